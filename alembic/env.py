@@ -20,6 +20,19 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# 마이그레이션에서 직접 관리하고 ORM에는 매핑하지 않는 DB 전용 객체
+UNMAPPED_DB_OBJECTS = {
+    ("column", "search_vector"),
+    ("index", "ix_materials_search_vector"),
+    ("index", "ix_materials_title_trgm"),
+    ("index", "ix_materials_summary_trgm"),
+}
+
+
+def include_object(obj, name, type_, reflected, compare_to) -> bool:
+    """autogenerate가 DB 전용 객체를 삭제 대상으로 잡지 않도록 제외"""
+    return (type_, name) not in UNMAPPED_DB_OBJECTS
+
 
 def _get_sync_database_url() -> str:
     override = os.getenv("ALEMBIC_DATABASE_URL")
@@ -39,6 +52,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -59,7 +73,11 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
@@ -25,49 +25,45 @@ def upgrade() -> None:
     bind = op.get_bind()
     progress_item_type.create(bind, checkfirst=True)
 
-    op.alter_column(
-        "user_progress",
-        "roadmap_id",
-        existing_type=sa.Integer(),
-        nullable=True,
-    )
-    op.add_column(
-        "user_progress",
-        sa.Column(
-            "item_type",
-            progress_item_type,
-            nullable=False,
-            server_default="roadmap",
-        ),
-    )
-    op.add_column(
-        "user_progress",
-        sa.Column("material_id", sa.Integer(), nullable=True),
-    )
-    op.create_index(
-        "ix_user_progress_item_type",
-        "user_progress",
-        ["item_type"],
-    )
-    op.create_foreign_key(
-        "fk_user_progress_material_id_materials",
-        source_table="user_progress",
-        referent_table="materials",
-        local_cols=["material_id"],
-        remote_cols=["id"],
-        ondelete="CASCADE",
-    )
-    op.create_unique_constraint(
-        "uq_user_material_progress",
-        "user_progress",
-        ["user_id", "material_id"],
-    )
-    op.create_check_constraint(
-        "ck_user_progress_item_type",
-        "user_progress",
-        "(item_type = 'roadmap' AND roadmap_id IS NOT NULL AND material_id IS NULL)"
-        " OR (item_type = 'material' AND material_id IS NOT NULL AND roadmap_id IS NULL)",
-    )
+    # SQLite는 ALTER COLUMN/제약 추가를 지원하지 않으므로 batch 모드(테이블 재생성)로 실행
+    # (PostgreSQL에서는 기존과 같은 ALTER 문이 그대로 실행된다)
+    with op.batch_alter_table("user_progress") as batch_op:
+        batch_op.alter_column(
+            "roadmap_id",
+            existing_type=sa.Integer(),
+            nullable=True,
+        )
+        batch_op.add_column(
+            sa.Column(
+                "item_type",
+                progress_item_type,
+                nullable=False,
+                server_default="roadmap",
+            ),
+        )
+        batch_op.add_column(
+            sa.Column("material_id", sa.Integer(), nullable=True),
+        )
+        batch_op.create_index(
+            "ix_user_progress_item_type",
+            ["item_type"],
+        )
+        batch_op.create_foreign_key(
+            "fk_user_progress_material_id_materials",
+            referent_table="materials",
+            local_cols=["material_id"],
+            remote_cols=["id"],
+            ondelete="CASCADE",
+        )
+        batch_op.create_unique_constraint(
+            "uq_user_material_progress",
+            ["user_id", "material_id"],
+        )
+        batch_op.create_check_constraint(
+            "ck_user_progress_item_type",
+            "(item_type = 'roadmap' AND roadmap_id IS NOT NULL AND material_id IS NULL)"
+            " OR (item_type = 'material' AND material_id IS NOT NULL AND roadmap_id IS NULL)",
+        )
 
     op.execute(
         "UPDATE user_progress SET item_type = 'roadmap' WHERE item_type IS NULL"
@@ -75,30 +71,20 @@ def upgrade() -> None:
 
 
 def downgrade() -> None:
-    op.alter_column(
-        "user_progress",
-        "roadmap_id",
-        existing_type=sa.Integer(),
-        nullable=False,
-    )
-    op.drop_constraint(
-        "ck_user_progress_item_type",
-        "user_progress",
-        type_="check",
-    )
-    op.drop_constraint(
-        "uq_user_material_progress",
-        "user_progress",
-        type_="unique",
-    )
-    op.drop_constraint(
-        "fk_user_progress_material_id_materials",
-        "user_progress",
-        type_="foreignkey",
-    )
-    op.drop_index("ix_user_progress_item_type", table_name="user_progress")
-    op.drop_column("user_progress", "material_id")
-    op.drop_column("user_progress", "item_type")
+    with op.batch_alter_table("user_progress") as batch_op:
+        batch_op.alter_column(
+            "roadmap_id",
+            existing_type=sa.Integer(),
+            nullable=False,
+        )
+        batch_op.drop_constraint("ck_user_progress_item_type", type_="check")
+        batch_op.drop_constraint("uq_user_material_progress", type_="unique")
+        batch_op.drop_constraint(
+            "fk_user_progress_material_id_materials", type_="foreignkey"
+        )
+        batch_op.drop_index("ix_user_progress_item_type")
+        batch_op.drop_column("material_id")
+        batch_op.drop_column("item_type")
 
     bind = op.get_bind()
     progress_item_type.drop(bind, checkfirst=True)
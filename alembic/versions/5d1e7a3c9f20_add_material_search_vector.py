@@ -0,0 +1,91 @@
+"""add full-text search vector to materials
+
+Revision ID: 5d1e7a3c9f20
+Revises: 2a6b0df8d8c3
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1e7a3c9f20"
+down_revision: Union[str, Sequence[str], None] = "2a6b0df8d8c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# title(A) > keywords(B) > summary(C) > source(D) 순으로 가중치 부여
+# 한국어 자료가 섞여 있으므로 형태소 분석 없이 'simple' 설정 사용
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A')"
+    " || setweight(to_tsvector('simple', coalesce(keywords::text, '')), 'B')"
+    " || setweight(to_tsvector('simple', coalesce(summary, '')), 'C')"
+    " || setweight(to_tsvector('simple', coalesce(source, '')), 'D')"
+)
+
+# SQLite: materials를 content 테이블로 쓰는 FTS5 가상 테이블 + 동기화 트리거
+# (app/infrastructure/db/models/material.py의 create_all용 DDL과 같은 정의)
+SQLITE_FTS_TABLE = "materials_fts"
+SQLITE_FTS_COLUMNS = "title, summary, source, keywords"
+SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5("
+    f"{SQLITE_FTS_COLUMNS}, content='materials', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON materials BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {SQLITE_FTS_COLUMNS}) "
+    "VALUES (new.id, new.title, new.summary, new.source, new.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON materials BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {SQLITE_FTS_COLUMNS}) "
+    "VALUES ('delete', old.id, old.title, old.summary, old.source, old.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE ON materials BEGIN "
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, {SQLITE_FTS_COLUMNS}) "
+    "VALUES ('delete', old.id, old.title, old.summary, old.source, old.keywords); "
+    f"INSERT INTO {SQLITE_FTS_TABLE}(rowid, {SQLITE_FTS_COLUMNS}) "
+    "VALUES (new.id, new.title, new.summary, new.source, new.keywords); END",
+    # 이미 있는 자료를 색인
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for statement in SQLITE_FTS_DDL:
+            op.execute(statement)
+        return
+    # tsvector/GIN은 PostgreSQL 전용
+    if dialect != "postgresql":
+        return
+
+    op.add_column(
+        "materials",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        ),
+    )
+    op.create_index(
+        "ix_materials_search_vector",
+        "materials",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            op.execute(f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_{suffix}")
+        op.execute(f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}")
+        return
+    if dialect != "postgresql":
+        return
+
+    op.drop_index("ix_materials_search_vector", table_name="materials")
+    op.drop_column("materials", "search_vector")
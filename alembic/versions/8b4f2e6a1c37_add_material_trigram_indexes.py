@@ -0,0 +1,48 @@
+"""add trigram indexes for fuzzy material search
+
+Revision ID: 8b4f2e6a1c37
+Revises: 5d1e7a3c9f20
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b4f2e6a1c37"
+down_revision: Union[str, Sequence[str], None] = "5d1e7a3c9f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # pg_trgm은 PostgreSQL 전용 (SQLite는 부분 일치 검색으로 대체)
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # ILIKE '%kw%' 부분 일치와 word_similarity(%>) 연산 모두 이 인덱스를 사용한다.
+    op.create_index(
+        "ix_materials_title_trgm",
+        "materials",
+        ["title"],
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_materials_summary_trgm",
+        "materials",
+        ["summary"],
+        postgresql_using="gin",
+        postgresql_ops={"summary": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.drop_index("ix_materials_summary_trgm", table_name="materials")
+    op.drop_index("ix_materials_title_trgm", table_name="materials")
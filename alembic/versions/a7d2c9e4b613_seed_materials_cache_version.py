@@ -0,0 +1,33 @@
+"""seed materials cache version
+
+Revision ID: a7d2c9e4b613
+Revises: f1a8c3d5e726
+Create Date: 2026-10-18 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7d2c9e4b613"
+down_revision: Union[str, Sequence[str], None] = "f1a8c3d5e726"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 이미 자료 변경으로 행이 만들어졌을 수 있으므로 없을 때만 추가
+    op.execute(
+        """
+        INSERT INTO cache_versions (name, version)
+        SELECT 'materials', 0
+        WHERE NOT EXISTS (SELECT 1 FROM cache_versions WHERE name = 'materials')
+        """
+    )
+
+
+def downgrade() -> None:
+    # 버전 카운터는 되돌리면 캐시가 예전 값과 겹칠 수 있으므로 그대로 둔다
+    pass
@@ -0,0 +1,29 @@
+"""add composite index for material keyset pagination
+
+Revision ID: c47a9d2e5b18
+Revises: 8b4f2e6a1c37
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c47a9d2e5b18"
+down_revision: Union[str, Sequence[str], None] = "8b4f2e6a1c37"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_materials_created_at_id",
+        "materials",
+        ["created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_materials_created_at_id", table_name="materials")
@@ -0,0 +1,37 @@
+"""add cache_versions table
+
+Revision ID: e93b6c1f4a52
+Revises: c47a9d2e5b18
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e93b6c1f4a52"
+down_revision: Union[str, Sequence[str], None] = "c47a9d2e5b18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    cache_versions = op.create_table(
+        "cache_versions",
+        sa.Column("name", sa.String(length=64), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+    op.bulk_insert(cache_versions, [{"name": "roadmaps", "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("cache_versions")
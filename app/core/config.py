@@ -20,6 +20,103 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = Field(alias="DATABASE_URL")
+    # 읽기 전용 복제본 (미설정 시 모든 조회가 DATABASE_URL 사용)
+    database_read_url: str | None = Field(default=None, alias="DATABASE_READ_URL")
+    # 쓰기 직후 이 시간 동안은 해당 사용자의 조회를 primary에서 수행
+    read_your_writes_seconds: float = Field(
+        default=5.0, alias="READ_YOUR_WRITES_SECONDS"
+    )
+    read_your_writes_max_users: int = Field(
+        default=10_000, alias="READ_YOUR_WRITES_MAX_USERS"
+    )
+    # SQL 로그 출력 (APP_DEBUG와 별개로 명시적으로 켜야 함)
+    database_echo: bool = Field(default=False, alias="DATABASE_ECHO")
+    # 워커(프로세스)별 커넥션 풀. 최대 연결 수 = 워커 수 × (pool_size + max_overflow)
+    database_pool_size: int = Field(default=5, alias="DATABASE_POOL_SIZE")
+    database_max_overflow: int = Field(default=10, alias="DATABASE_MAX_OVERFLOW")
+    database_pool_timeout_seconds: float = Field(
+        default=30.0, alias="DATABASE_POOL_TIMEOUT_SECONDS"
+    )
+    database_pool_recycle_seconds: int = Field(
+        default=1800, alias="DATABASE_POOL_RECYCLE_SECONDS"
+    )
+    database_pool_pre_ping: bool = Field(default=True, alias="DATABASE_POOL_PRE_PING")
+    # SQLAlchemy 컴파일 캐시 항목 수 (엔진 단위)
+    database_query_cache_size: int = Field(
+        default=500, alias="DATABASE_QUERY_CACHE_SIZE"
+    )
+    # 커넥션별 asyncpg prepared statement LRU 크기 (0이면 비활성화, pgbouncer transaction 모드 등)
+    database_prepared_statement_cache_size: int = Field(
+        default=100, alias="DATABASE_PREPARED_STATEMENT_CACHE_SIZE"
+    )
+    # 0이면 서버 기본값 사용 (asyncpg 연결에만 적용)
+    database_statement_timeout_ms: int = Field(
+        default=0, alias="DATABASE_STATEMENT_TIMEOUT_MS"
+    )
+
+    # Query diagnostics
+    # 요청별 SQL 실행 수/시간 집계 (Server-Timing 헤더로 노출되므로 개발/스테이징에서만 켤 것)
+    query_stats_enabled: bool = Field(default=False, alias="QUERY_STATS_ENABLED")
+    # 같은 SQL이 이 횟수 이상 실행되면 N+1 의심 경고
+    query_stats_n_plus_one_threshold: int = Field(
+        default=5, alias="QUERY_STATS_N_PLUS_ONE_THRESHOLD"
+    )
+
+    # Response compression (Accept-Encoding에 따라 br 우선, 그다음 gzip)
+    compression_enabled: bool = Field(default=True, alias="COMPRESSION_ENABLED")
+    # 이보다 작은 본문은 압축하지 않음 (bytes)
+    compression_minimum_size: int = Field(default=1024, alias="COMPRESSION_MINIMUM_SIZE")
+    # 압축 대상 Content-Type -> gzip 레벨(1-9). JSON 문자열로 지정, `text/*` 와일드카드 가능
+    compression_gzip_levels: dict[str, int] = Field(
+        default={
+            "application/json": 6,
+            "text/*": 6,
+            "application/javascript": 6,
+            "image/svg+xml": 6,
+        },
+        alias="COMPRESSION_GZIP_LEVELS",
+    )
+    # brotli 품질(0-11): Content-Type별 지정이 없으면 COMPRESSION_BROTLI_QUALITY
+    compression_brotli_levels: dict[str, int] = Field(
+        default_factory=dict, alias="COMPRESSION_BROTLI_LEVELS"
+    )
+    compression_brotli_quality: int = Field(default=4, alias="COMPRESSION_BROTLI_QUALITY")
+    # 같은 본문이 반복되는 경로는 압축 결과를 본문 digest 기준으로 캐시
+    compression_cache_paths: list[str] = Field(
+        default=["/openapi.json", "/api/v1/roadmaps"],
+        alias="COMPRESSION_CACHE_PATHS",
+    )
+    compression_cache_size: int = Field(default=64, alias="COMPRESSION_CACHE_SIZE")
+    compression_cache_ttl_seconds: float = Field(
+        default=3600.0, alias="COMPRESSION_CACHE_TTL_SECONDS"
+    )
+
+    # 조회 응답 캐시 (memory: 워커별 LRU, redis: RESPONSE_CACHE_URL 공유, none: 비활성화)
+    response_cache_backend: str = Field(default="memory", alias="RESPONSE_CACHE_BACKEND")
+    response_cache_url: str = Field(
+        default="redis://localhost:6379/0", alias="RESPONSE_CACHE_URL"
+    )
+    response_cache_ttl_seconds: float = Field(
+        default=60.0, alias="RESPONSE_CACHE_TTL_SECONDS"
+    )
+    response_cache_max_entries: int = Field(
+        default=10_000, alias="RESPONSE_CACHE_MAX_ENTRIES"
+    )
+    response_cache_timeout_seconds: float = Field(
+        default=0.5, alias="RESPONSE_CACHE_TIMEOUT_SECONDS"
+    )
+    # 워커별 redis 커넥션 풀 상한 (모두 사용 중이면 캐시 미스로 처리)
+    response_cache_max_connections: int = Field(
+        default=20, alias="RESPONSE_CACHE_MAX_CONNECTIONS"
+    )
+
+    # Material search
+    material_count_cache_ttl_seconds: float = Field(
+        default=30.0, alias="MATERIAL_COUNT_CACHE_TTL_SECONDS"
+    )
+    material_count_cache_size: int = Field(
+        default=1024, alias="MATERIAL_COUNT_CACHE_SIZE"
+    )
 
     # Security
     secret_key: str = Field(alias="SECRET_KEY")
@@ -30,6 +127,52 @@ class Settings(BaseSettings):
     refresh_token_expire_minutes: int = Field(
         default=60 * 24 * 14, alias="REFRESH_TOKEN_EXPIRE_MINUTES"
     )
+    # JWT 서명/검증 구현 (jose | pyjwt)
+    jwt_backend: str = Field(default="jose", alias="JWT_BACKEND")
+    # 검증된 토큰 캐시. 항목 수명은 min(토큰 exp까지 남은 시간, TTL)
+    token_cache_ttl_seconds: float = Field(
+        default=300.0, alias="TOKEN_CACHE_TTL_SECONDS"
+    )
+    token_cache_size: int = Field(default=10000, alias="TOKEN_CACHE_SIZE")
+    # 폐기된 access token denylist (Bloom filter 크기/거짓 양성률, 저장소 동기화 주기)
+    token_denylist_capacity: int = Field(
+        default=100_000, alias="TOKEN_DENYLIST_CAPACITY"
+    )
+    token_denylist_error_rate: float = Field(
+        default=0.001, alias="TOKEN_DENYLIST_ERROR_RATE"
+    )
+    token_denylist_sync_seconds: float = Field(
+        default=30.0, alias="TOKEN_DENYLIST_SYNC_SECONDS"
+    )
+    # 인증 사용자 캐시 (user id → User). 0이면 비활성화
+    user_cache_ttl_seconds: float = Field(default=60.0, alias="USER_CACHE_TTL_SECONDS")
+    user_cache_size: int = Field(default=4096, alias="USER_CACHE_SIZE")
+    # access token에 email/is_active/is_superuser 클레임을 담고, 토큰 수명 동안 DB 조회 없이 신뢰
+    auth_trust_token_claims: bool = Field(
+        default=False, alias="AUTH_TRUST_TOKEN_CLAIMS"
+    )
+    # 로그인 시도 제한 (token bucket: 최대 연속 시도 수 / 분당 회복량)
+    login_rate_limit_enabled: bool = Field(
+        default=True, alias="LOGIN_RATE_LIMIT_ENABLED"
+    )
+    login_rate_limit_ip_burst: int = Field(default=20, alias="LOGIN_RATE_LIMIT_IP_BURST")
+    login_rate_limit_ip_per_minute: float = Field(
+        default=10.0, alias="LOGIN_RATE_LIMIT_IP_PER_MINUTE"
+    )
+    login_rate_limit_email_burst: int = Field(
+        default=5, alias="LOGIN_RATE_LIMIT_EMAIL_BURST"
+    )
+    login_rate_limit_email_per_minute: float = Field(
+        default=2.0, alias="LOGIN_RATE_LIMIT_EMAIL_PER_MINUTE"
+    )
+    login_rate_limit_max_keys: int = Field(
+        default=100_000, alias="LOGIN_RATE_LIMIT_MAX_KEYS"
+    )
+    # bcrypt 전용 스레드 수 / 실행+대기 중 최대 작업 수 (초과 시 503)
+    password_hash_workers: int = Field(default=2, alias="PASSWORD_HASH_WORKERS")
+    password_hash_max_pending: int = Field(
+        default=32, alias="PASSWORD_HASH_MAX_PENDING"
+    )
 
 
 @lru_cache
@@ -1,21 +1,143 @@
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, cast
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Depends, Request
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import QueuePool
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.core.read_your_writes import wants_primary
 
 
 class Base(DeclarativeBase):
     pass
 
 
+def build_engine_options(settings: Settings, database_url: str) -> dict[str, Any]:
+    """URL 방언에 맞는 create_async_engine 인자를 만든다.
+
+    풀 크기/타임아웃은 PostgreSQL 같은 서버형 DB에만 적용한다 (SQLite는
+    SQLAlchemy 기본 풀(StaticPool/NullPool)을 그대로 사용).
+    """
+    url = make_url(database_url)
+    options: dict[str, Any] = {
+        "echo": settings.database_echo,
+        "query_cache_size": settings.database_query_cache_size,
+    }
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_timeout=settings.database_pool_timeout_seconds,
+        pool_recycle=settings.database_pool_recycle_seconds,
+        pool_pre_ping=settings.database_pool_pre_ping,
+    )
+    if url.get_driver_name() == "asyncpg":
+        connect_args: dict[str, Any] = {
+            "prepared_statement_cache_size": (
+                settings.database_prepared_statement_cache_size
+            ),
+        }
+        if settings.database_statement_timeout_ms > 0:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(settings.database_statement_timeout_ms)
+            }
+        options["connect_args"] = connect_args
+    return options
+
+
+def get_pool_status(engine: AsyncEngine) -> dict[str, Any]:
+    pool = engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            # 음수면 아직 pool_size만큼 연결을 만들지 않은 상태
+            overflow=pool.overflow(),
+            # 엔진 생성 시 넘긴 설정값 (QueuePool은 공개 접근자를 제공하지 않음)
+            max_overflow=settings.database_max_overflow,
+            timeout_seconds=pool.timeout(),
+        )
+    return status
+
+
 settings = get_settings()
-engine = create_async_engine(settings.database_url, echo=settings.app_debug)
+engine = create_async_engine(
+    settings.database_url,
+    **build_engine_options(settings, settings.database_url),
+)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
+# 읽기 전용 복제본 (DATABASE_READ_URL 미설정 시 None → primary 사용)
+read_engine: AsyncEngine | None = (
+    create_async_engine(
+        settings.database_read_url,
+        **build_engine_options(settings, settings.database_read_url),
+    )
+    if settings.database_read_url
+    else None
+)
+ReadSessionLocal = (
+    async_sessionmaker(read_engine, expire_on_commit=False)
+    if read_engine is not None
+    else None
+)
+
+
+class LazySession:
+    """처음 사용될 때 AsyncSession을 여는 프록시.
+
+    요청 의존성 해석 시점에는 세션도 커넥션도 만들지 않으므로, 캐시로 응답하거나
+    인증 단계에서 거절되는 요청은 풀 커넥션을 전혀 사용하지 않는다.
+    """
+
+    def __init__(self, factory: async_sessionmaker[AsyncSession]) -> None:
+        self._factory = factory
+        self._session: AsyncSession | None = None
+
+    @property
+    def is_started(self) -> bool:
+        return self._session is not None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._session is None:
+            self._session = self._factory()
+        return getattr(self._session, name)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
-        yield session
+    # FastAPI가 요청 단위로 의존성을 캐시하므로 모든 repository가 같은 세션을 공유한다
+    session = LazySession(AsyncSessionLocal)
+    try:
+        yield cast(AsyncSession, session)
+    finally:
+        await session.close()
+
 
+async def get_read_db(
+    request: Request,
+    primary: AsyncSession = Depends(get_db),
+) -> AsyncGenerator[AsyncSession, None]:
+    """조회 전용 세션. 복제본이 없거나 방금 쓰기를 한 사용자면 primary 세션을 그대로 쓴다."""
+    if ReadSessionLocal is None or wants_primary(request):
+        yield primary
+        return
+    session = LazySession(ReadSessionLocal)
+    try:
+        yield cast(AsyncSession, session)
+    finally:
+        await session.close()
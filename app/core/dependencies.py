@@ -1,7 +1,15 @@
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+import math
 
-from app.core.database import get_db
+from fastapi import Depends, HTTPException, Request, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+
+from app.core.database import get_db, get_read_db
+from app.core.rate_limit import (
+    LoginRateLimiter,
+    RateLimitExceededError,
+    get_login_rate_limiter,
+)
+from app.core.response_cache import get_response_cache
 from app.domain.entities import User
 from app.infrastructure.repositories.material_repository import (
     MaterialRepository,
@@ -30,6 +38,23 @@ async def get_auth_service(
     return AuthService(repository)
 
 
+async def enforce_login_rate_limit(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    limiter: LoginRateLimiter = Depends(get_login_rate_limiter),
+) -> None:
+    """bcrypt 검증 전에 IP/이메일별 로그인 시도 횟수를 제한한다."""
+    client_ip = request.client.host if request.client else None
+    try:
+        await limiter.check(client_ip, form_data.username)
+    except RateLimitExceededError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts, please retry later",
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        ) from exc
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     auth_service: AuthService = Depends(get_auth_service),
@@ -73,9 +98,28 @@ async def get_material_scrap_repository(
     return MaterialScrapRepository(session)
 
 
+# 조회 전용 엔드포인트는 복제본 세션(get_read_db)을 사용
+async def get_read_roadmap_repository(
+    session=Depends(get_read_db),
+) -> RoadmapRepository:
+    return RoadmapRepository(session)
+
+
+async def get_read_progress_repository(
+    session=Depends(get_read_db),
+) -> UserProgressRepository:
+    return UserProgressRepository(session)
+
+
+async def get_read_material_repository(
+    session=Depends(get_read_db),
+) -> MaterialRepository:
+    return MaterialRepository(session)
+
+
 async def get_roadmap_usecase(
-    roadmap_repo: RoadmapRepository = Depends(get_roadmap_repository),
-    progress_repo: UserProgressRepository = Depends(get_progress_repository),
+    roadmap_repo: RoadmapRepository = Depends(get_read_roadmap_repository),
+    progress_repo: UserProgressRepository = Depends(get_read_progress_repository),
 ) -> GetRoadmapsUseCase:
     return GetRoadmapsUseCase(roadmap_repo, progress_repo)
 
@@ -85,19 +129,21 @@ async def get_update_progress_usecase(
     material_repo: MaterialRepository = Depends(get_material_repository),
     progress_repo: UserProgressRepository = Depends(get_progress_repository),
 ) -> UpdateProgressUseCase:
-    return UpdateProgressUseCase(roadmap_repo, material_repo, progress_repo)
+    return UpdateProgressUseCase(
+        roadmap_repo, material_repo, progress_repo, cache=get_response_cache()
+    )
 
 
 async def get_progress_overview_usecase(
-    progress_repo: UserProgressRepository = Depends(get_progress_repository),
+    progress_repo: UserProgressRepository = Depends(get_read_progress_repository),
 ) -> GetUserProgressUseCase:
-    return GetUserProgressUseCase(progress_repo)
+    return GetUserProgressUseCase(progress_repo, cache=get_response_cache())
 
 
 async def get_material_search_usecase(
-    repository: MaterialRepository = Depends(get_material_repository),
+    repository: MaterialRepository = Depends(get_read_material_repository),
 ) -> SearchMaterialsUseCase:
-    return SearchMaterialsUseCase(repository)
+    return SearchMaterialsUseCase(repository, cache=get_response_cache())
 
 
 async def get_material_scrap_usecase(
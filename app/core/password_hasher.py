@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, TypeVar
+
+from app.core.config import get_settings
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class PasswordHasherSaturatedError(Exception):
+    """Raised when the hashing queue is full and the request must be shed."""
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing/verification on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL, so the event loop keeps serving other requests while
+    a login is being verified. Once `max_pending` operations are running or queued,
+    new ones are rejected immediately instead of piling up behind the pool.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="password-hasher"
+        )
+        # 완료 콜백은 작업 스레드에서 실행되므로 카운터는 lock으로 보호
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "in_flight": self._pending,
+            "queue_depth": max(0, self._pending - self.max_workers),
+            "completed": self._completed,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                raise PasswordHasherSaturatedError("password hashing queue is full")
+            self._pending += 1
+
+        # 슬롯은 await하는 코루틴이 아니라 작업 자체가 끝날 때 반환한다.
+        # 요청이 취소돼도 이미 실행 중인 bcrypt는 끝날 때까지 슬롯을 차지한다
+        # (아직 대기 중인 작업은 취소되어 바로 반환).
+        try:
+            future = self._executor.submit(func, *args)
+        except RuntimeError:
+            # shutdown 이후 제출된 경우 콜백이 붙지 않으므로 직접 반환
+            with self._lock:
+                self._pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return await asyncio.wrap_future(future)
+
+    def _release(self, future: Future) -> None:
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled() and future.exception() is None:
+                self._completed += 1
+
+
+@lru_cache
+def get_password_hasher() -> PasswordHasher:
+    settings = get_settings()
+    return PasswordHasher(
+        max_workers=settings.password_hash_workers,
+        max_pending=settings.password_hash_max_pending,
+    )
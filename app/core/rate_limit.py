@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable
+
+from app.core.config import get_settings
+
+
+@dataclass(frozen=True)
+class TokenBucketRule:
+    """capacity개까지 몰아서 허용하고, 초당 refill_rate개씩 다시 채운다."""
+
+    scope: str
+    capacity: int
+    refill_rate: float
+
+
+class RateLimitExceededError(Exception):
+    def __init__(self, scope: str, retry_after: float) -> None:
+        super().__init__(f"rate limit exceeded for {scope}")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class RateLimitBackend(ABC):
+    """Token bucket 상태 저장소. 여러 워커가 한도를 공유하려면 공유 저장소 구현을 사용한다."""
+
+    @abstractmethod
+    async def consume(self, key: str, rule: TokenBucketRule, cost: float = 1) -> float:
+        """토큰을 차감하고 0을 반환한다. 부족하면 차감 없이 재시도까지 남은 초를 반환한다."""
+
+    @abstractmethod
+    async def reset(self) -> None:
+        ...
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """워커 프로세스 단위 token bucket. 오래 쓰이지 않은 키부터 max_keys 이내로 유지한다."""
+
+    def __init__(
+        self, max_keys: int = 100_000, timer: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.max_keys = max_keys
+        self._timer = timer
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def consume(self, key: str, rule: TokenBucketRule, cost: float = 1) -> float:
+        now = self._timer()
+        tokens, updated_at = self._buckets.get(key, (float(rule.capacity), now))
+        tokens = min(rule.capacity, tokens + (now - updated_at) * rule.refill_rate)
+
+        if tokens < cost:
+            retry_after = (cost - tokens) / rule.refill_rate if rule.refill_rate > 0 else math.inf
+        else:
+            tokens -= cost
+            retry_after = 0.0
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+    async def reset(self) -> None:
+        self._buckets.clear()
+
+
+class LoginRateLimiter:
+    """로그인 시도를 IP 단위와 이메일 단위 token bucket으로 제한한다.
+
+    bcrypt 검증 전에 호출되어, credential stuffing 폭주가 해시 스레드 풀을
+    점유하지 못하게 한다.
+    """
+
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        ip_rule: TokenBucketRule,
+        email_rule: TokenBucketRule,
+        enabled: bool = True,
+    ) -> None:
+        self.backend = backend
+        self.ip_rule = ip_rule
+        self.email_rule = email_rule
+        self.enabled = enabled
+        self._admitted = 0
+        self._rejected: dict[str, int] = {ip_rule.scope: 0, email_rule.scope: 0}
+
+    async def check(self, client_ip: str | None, email: str) -> None:
+        if not self.enabled:
+            return
+        attempts = [(self.email_rule, email.strip().lower())]
+        if client_ip:
+            attempts.insert(0, (self.ip_rule, client_ip))
+
+        for rule, identity in attempts:
+            retry_after = await self.backend.consume(f"login:{rule.scope}:{identity}", rule)
+            if retry_after > 0:
+                self._rejected[rule.scope] += 1
+                raise RateLimitExceededError(rule.scope, retry_after)
+        self._admitted += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "admitted": self._admitted,
+            "rejected": sum(self._rejected.values()),
+            **{f"rejected_by_{scope}": count for scope, count in self._rejected.items()},
+        }
+
+
+@lru_cache
+def get_login_rate_limiter() -> LoginRateLimiter:
+    settings = get_settings()
+    return LoginRateLimiter(
+        backend=InMemoryRateLimitBackend(max_keys=settings.login_rate_limit_max_keys),
+        ip_rule=TokenBucketRule(
+            scope="ip",
+            capacity=settings.login_rate_limit_ip_burst,
+            refill_rate=settings.login_rate_limit_ip_per_minute / 60,
+        ),
+        email_rule=TokenBucketRule(
+            scope="email",
+            capacity=settings.login_rate_limit_email_burst,
+            refill_rate=settings.login_rate_limit_email_per_minute / 60,
+        ),
+        enabled=settings.login_rate_limit_enabled,
+    )
@@ -0,0 +1,71 @@
+"""
+Read-your-writes escape hatch for replica routing.
+
+Reads of a user who has just written (progress update, scrap toggle) are
+sent to the primary for `read_your_writes_seconds`, so replica lag never
+hides their own change. Two markers are set on every write:
+
+* an in-process entry keyed by user id (same worker, no client cooperation)
+* a short-lived cookie holding the deadline, which covers requests that
+  land on another worker
+"""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import Request, Response
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.core.security import InvalidTokenError, validate_token
+
+settings = get_settings()
+
+READ_YOUR_WRITES_COOKIE = "stacknori_rw_until"
+
+recent_writers: TTLCache[int, bool] = TTLCache(
+    maxsize=settings.read_your_writes_max_users,
+    ttl=settings.read_your_writes_seconds,
+)
+
+
+def mark_write(response: Response, user_id: int) -> None:
+    """복제본이 설정된 경우에만 쓰기 표시를 남긴다 (없으면 모든 조회가 이미 primary)."""
+    window = settings.read_your_writes_seconds
+    if window <= 0 or not settings.database_read_url:
+        return
+    recent_writers.set(user_id, True)
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        f"{time.time() + window:.3f}",
+        max_age=max(1, int(window)),
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def wants_primary(request: Request) -> bool:
+    """최근 쓰기를 한 요청자이면 True (복제본 대신 primary에서 읽어야 함)."""
+    deadline = request.cookies.get(READ_YOUR_WRITES_COOKIE)
+    if deadline:
+        try:
+            if float(deadline) > time.time():
+                return True
+        except ValueError:
+            pass
+
+    user_id = _bearer_user_id(request)
+    return user_id is not None and recent_writers.get(user_id) is not None
+
+
+def _bearer_user_id(request: Request) -> int | None:
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        # 검증된 토큰 캐시를 거치므로 get_current_user와 중복 검증 비용은 거의 없음
+        subject = validate_token(token, expected_type="access").get("sub")
+    except InvalidTokenError:
+        return None
+    return int(subject) if subject is not None else None
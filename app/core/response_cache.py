@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Awaitable, TypeVar
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# 모든 사용자가 공유하는 캐시 항목 (자료 목록 페이지 등)
+SHARED_SCOPE = "shared"
+
+# 세대 카운터는 값보다 오래 살아야 하므로 값 TTL과 별개로 길게 유지
+_GENERATION_TTL_SECONDS = 7 * 24 * 3600.0
+
+
+def user_scope(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+class CacheBackendError(Exception):
+    """캐시 저장소 연결/프로토콜 오류. 호출 측에서는 캐시 미스로 취급한다."""
+
+
+class CacheBackend(ABC):
+    """바이트 값 캐시 저장소. 여러 워커가 캐시를 공유하려면 공유 저장소 구현을 사용한다."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """정수 카운터를 1 증가시키고 새 값을 반환한다 (없으면 1)."""
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """워커 프로세스 단위 LRU 캐시 (오래 쓰이지 않은 항목부터 max_entries 이내로 유지)"""
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        self._data: TTLCache[str, bytes | int] = TTLCache(
+            maxsize=max_entries, ttl=_GENERATION_TTL_SECONDS
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        value = self._data.get(key)
+        return str(value).encode() if isinstance(value, int) else value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._data.set(key, value, ttl=ttl)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key)
+
+    async def incr(self, key: str) -> int:
+        current = self._data.get(key)
+        value = int(current or 0) + 1
+        self._data.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCacheBackend(CacheBackend):
+    """redis.asyncio 커넥션 풀 기반 공유 저장소.
+
+    URL 형식: redis://[:password@]host[:port][/db] (rediss:// 등 redis-py가 지원하는 형식)
+    연결/명령 오류와 타임아웃은 CacheBackendError로 바꿔 올린다.
+    """
+
+    def __init__(
+        self, url: str, timeout: float = 0.5, max_connections: int = 20
+    ) -> None:
+        self.client = aioredis.Redis.from_url(
+            url,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+            max_connections=max_connections,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._call("GET", self.client.get(key))
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._call("SET", self.client.set(key, value, px=max(1, int(ttl * 1000))))
+
+    async def delete(self, key: str) -> None:
+        await self._call("DEL", self.client.delete(key))
+
+    async def incr(self, key: str) -> int:
+        return await self._call("INCR", self.client.incr(key))
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    async def _call(command: str, operation: Awaitable[T]) -> T:
+        try:
+            return await operation
+        except (RedisError, OSError, asyncio.TimeoutError) as exc:
+            raise CacheBackendError(f"cache command {command} failed: {exc!r}") from exc
+
+
+class ResponseCache:
+    """세대(generation) 카운터로 무효화하는 응답 캐시.
+
+    키는 `<namespace>:<scope>:g<세대>:<digest>` 형태다. 쓰기 시 scope의 세대만 올리면
+    이전 세대 항목은 더 이상 조회되지 않고 TTL이 지나면 사라진다.
+    저장소 오류는 로그만 남기고 캐시 미스로 처리한다.
+    """
+
+    def __init__(
+        self, backend: CacheBackend, ttl: float = 60.0, namespace: str = "stacknori"
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.namespace = namespace
+        self.hits = 0
+        self.misses = 0
+
+    async def key(self, scope: str, *parts: Any) -> str:
+        """현재 세대를 반영한 캐시 키 (parts는 repr 기준으로 해시)"""
+        generation = await self._generation(scope)
+        digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+        return f"{self.namespace}:{scope}:g{generation}:{digest}"
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self.backend.get(key)
+        except CacheBackendError as exc:
+            logger.warning("response cache get failed: %s", exc)
+            value = None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        try:
+            await self.backend.set(key, value, self.ttl)
+        except CacheBackendError as exc:
+            logger.warning("response cache set failed: %s", exc)
+
+    async def invalidate(self, scope: str) -> None:
+        """scope의 세대를 올려 기존 항목을 모두 무효화"""
+        try:
+            await self.backend.incr(self._generation_key(scope))
+        except CacheBackendError as exc:
+            logger.warning("response cache invalidation failed for %s: %s", scope, exc)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    async def _generation(self, scope: str) -> int:
+        try:
+            value = await self.backend.get(self._generation_key(scope))
+        except CacheBackendError as exc:
+            logger.warning("response cache generation read failed: %s", exc)
+            value = None
+        return int(value) if value is not None else 0
+
+    def _generation_key(self, scope: str) -> str:
+        return f"{self.namespace}:{scope}:generation"
+
+
+@lru_cache
+def get_response_cache() -> ResponseCache | None:
+    """RESPONSE_CACHE_BACKEND 설정에 따른 프로세스 단일 응답 캐시 (none이면 None)"""
+    settings = get_settings()
+    backend_name = settings.response_cache_backend.lower()
+    if backend_name == "none":
+        return None
+    if backend_name == "memory":
+        backend: CacheBackend = InMemoryCacheBackend(
+            max_entries=settings.response_cache_max_entries
+        )
+    elif backend_name == "redis":
+        backend = RedisCacheBackend(
+            settings.response_cache_url,
+            timeout=settings.response_cache_timeout_seconds,
+            max_connections=settings.response_cache_max_connections,
+        )
+    else:
+        raise ValueError(f"unsupported RESPONSE_CACHE_BACKEND: {backend_name!r}")
+    return ResponseCache(backend, ttl=settings.response_cache_ttl_seconds)
@@ -1,10 +1,14 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import lru_cache
+from typing import Any, Protocol
 from uuid import uuid4
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
+from app.core.cache import TTLCache
 from app.core.config import get_settings
 
 
@@ -12,33 +16,126 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 settings = get_settings()
 
 
-def _create_token(subject: str, minutes: int, token_type: str) -> str:
+class InvalidTokenError(Exception):
+    """Raised when JWT verification fails."""
+
+
+class JWTBackend(Protocol):
+    """서명/검증 구현체 인터페이스. 검증 실패는 InvalidTokenError로 통일한다."""
+
+    name: str
+
+    def encode(self, payload: dict[str, Any], key: str, algorithm: str) -> str:
+        ...
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        ...
+
+
+class JoseBackend:
+    name = "jose"
+
+    def encode(self, payload: dict[str, Any], key: str, algorithm: str) -> str:
+        return jwt.encode(payload, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        try:
+            return jwt.decode(token, key, algorithms=algorithms)
+        except JWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+
+
+class PyJWTBackend:
+    """PyJWT 기반 구현 (선택 의존성: `pip install PyJWT`)."""
+
+    name = "pyjwt"
+
+    def __init__(self) -> None:
+        import jwt as pyjwt
+
+        self._jwt = pyjwt
+
+    def encode(self, payload: dict[str, Any], key: str, algorithm: str) -> str:
+        return self._jwt.encode(payload, key, algorithm=algorithm)
+
+    def decode(self, token: str, key: str, algorithms: list[str]) -> dict[str, Any]:
+        try:
+            return self._jwt.decode(token, key, algorithms=algorithms)
+        except self._jwt.PyJWTError as exc:
+            raise InvalidTokenError(str(exc)) from exc
+
+
+JWT_BACKENDS: dict[str, type] = {
+    JoseBackend.name: JoseBackend,
+    PyJWTBackend.name: PyJWTBackend,
+}
+
+
+@lru_cache
+def get_jwt_backend() -> JWTBackend:
+    try:
+        backend_cls = JWT_BACKENDS[settings.jwt_backend]
+    except KeyError as exc:
+        raise ValueError(f"Unknown JWT_BACKEND: {settings.jwt_backend}") from exc
+    return backend_cls()
+
+
+# 검증을 통과한 토큰의 sha256 digest → payload. 항목은 토큰의 exp 시점에 만료된다.
+verified_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    maxsize=settings.token_cache_size,
+    ttl=settings.token_cache_ttl_seconds,
+)
+
+
+def _create_token(
+    subject: str,
+    minutes: int,
+    token_type: str,
+    claims: dict[str, Any] | None = None,
+    jti: str | None = None,
+) -> str:
     now = datetime.now(timezone.utc)
     expires = now + timedelta(minutes=minutes)
     payload = {
+        **(claims or {}),
         "sub": subject,
         "exp": expires,
         "iat": now,
-        "jti": uuid4().hex,
+        "jti": jti or uuid4().hex,
         "type": token_type,
     }
-    return jwt.encode(payload, settings.secret_key, algorithm=settings.algorithm)
+    return get_jwt_backend().encode(
+        payload, settings.secret_key, algorithm=settings.algorithm
+    )
 
 
-def create_access_token(subject: str, expires_delta: timedelta | None = None) -> str:
+def create_access_token(
+    subject: str,
+    expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
+    jti: str | None = None,
+) -> str:
     minutes = (
         int(expires_delta.total_seconds() / 60)
         if expires_delta
         else settings.access_token_expire_minutes
     )
-    return _create_token(subject, minutes, token_type="access")
+    return _create_token(
+        subject, minutes, token_type="access", claims=claims, jti=jti
+    )
 
 
-def create_refresh_token(subject: str) -> str:
+def create_refresh_token(
+    subject: str,
+    jti: str | None = None,
+    family_id: str | None = None,
+) -> str:
     return _create_token(
         subject,
         settings.refresh_token_expire_minutes,
         token_type="refresh",
+        claims={"fam": family_id} if family_id else None,
+        jti=jti,
     )
 
 
@@ -51,18 +148,26 @@ def get_password_hash(password: str) -> str:
 
 
 def decode_token(token: str) -> dict[str, Any]:
-    return jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+    return get_jwt_backend().decode(
+        token, settings.secret_key, algorithms=[settings.algorithm]
+    )
 
 
-class InvalidTokenError(Exception):
-    """Raised when JWT verification fails."""
+def _verify_cached(token: str) -> dict[str, Any]:
+    digest = hashlib.sha256(token.encode()).digest()
+    payload = verified_token_cache.get(digest)
+    if payload is None:
+        payload = decode_token(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)):
+            ttl = min(exp - time.time(), verified_token_cache.ttl)
+            verified_token_cache.set(digest, payload, ttl=ttl)
+    # 호출자가 수정해도 캐시된 payload가 바뀌지 않도록 복사본 반환
+    return dict(payload)
 
 
 def validate_token(token: str, expected_type: str = "access") -> dict[str, Any]:
-    try:
-        payload = decode_token(token)
-    except JWTError as exc:
-        raise InvalidTokenError(str(exc)) from exc
+    payload = _verify_cached(token)
 
     token_type = payload.get("type")
     if expected_type and token_type != expected_type:
@@ -0,0 +1,82 @@
+"""
+Denylist for revoked access tokens.
+
+Access tokens are stateless, so revoking one means remembering its `jti`
+until it expires. Every worker keeps a Bloom filter of revoked jtis: the
+common case (token not revoked) is answered in memory, and only filter hits
+are confirmed against the refresh token store. The filter is rebuilt from the
+store every `sync_interval` seconds so revocations made by other workers show
+up, and expired jtis drop out.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import Callable
+
+from app.core.bloom import BloomFilter
+from app.core.config import get_settings
+from app.domain.repositories import RefreshTokenStore
+
+settings = get_settings()
+
+
+class AccessTokenDenylist:
+    def __init__(
+        self,
+        capacity: int,
+        error_rate: float,
+        sync_interval: float,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_interval = sync_interval
+        self._timer = timer
+        self.clear()
+
+    def clear(self) -> None:
+        self._filter = BloomFilter(self.capacity, self.error_rate)
+        self._synced_at: float | None = None
+        self._added_during_sync: set[str] | None = None
+
+    def add(self, jti: str) -> None:
+        self._filter.add(jti)
+        if self._added_during_sync is not None:
+            self._added_during_sync.add(jti)
+
+    async def is_revoked(self, jti: str, store: RefreshTokenStore) -> bool:
+        await self.sync(store)
+        if jti not in self._filter:
+            return False
+        return await store.is_access_revoked(jti)
+
+    async def sync(self, store: RefreshTokenStore, force: bool = False) -> None:
+        now = self._timer()
+        if (
+            not force
+            and self._synced_at is not None
+            and now - self._synced_at < self.sync_interval
+        ):
+            return
+        # 동시 요청이 같은 동기화를 반복하지 않도록 먼저 시각을 기록한다
+        self._synced_at = now
+        self._added_during_sync = set()
+        try:
+            jtis = await store.revoked_access_tokens(datetime.now(timezone.utc))
+        except Exception:
+            self._added_during_sync = None
+            raise
+        rebuilt = BloomFilter(max(self.capacity, 2 * len(jtis)), self.error_rate)
+        for jti in [*jtis, *self._added_during_sync]:
+            rebuilt.add(jti)
+        self._filter = rebuilt
+        self._added_during_sync = None
+
+
+access_token_denylist = AccessTokenDenylist(
+    capacity=settings.token_denylist_capacity,
+    error_rate=settings.token_denylist_error_rate,
+    sync_interval=settings.token_denylist_sync_seconds,
+)
@@ -1,5 +1,13 @@
-from .material import Material, MaterialDifficulty, MaterialType
+from .material import (
+    Material,
+    MaterialDifficulty,
+    MaterialMatch,
+    MaterialSort,
+    MaterialTotalMode,
+    MaterialType,
+)
 from .progress import ItemType, UserProgress
+from .refresh_token import RefreshToken
 from .roadmap import Roadmap, RoadmapCategory
 from .scrap import MaterialScrap
 from .user import User
@@ -11,8 +19,12 @@ __all__ = [
     "Material",
     "MaterialDifficulty",
     "MaterialType",
+    "MaterialSort",
+    "MaterialMatch",
+    "MaterialTotalMode",
     "UserProgress",
     "ItemType",
     "MaterialScrap",
+    "RefreshToken",
 ]
 
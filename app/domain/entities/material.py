@@ -17,6 +17,22 @@ class MaterialType(str, Enum):
     VIDEO = "video"
 
 
+class MaterialSort(str, Enum):
+    LATEST = "latest"
+    RELEVANCE = "relevance"
+
+
+class MaterialMatch(str, Enum):
+    CONTAINS = "contains"
+    FUZZY = "fuzzy"
+
+
+class MaterialTotalMode(str, Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 class Material(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
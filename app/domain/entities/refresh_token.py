@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class RefreshToken(BaseModel):
+    """발급된 refresh token 기록. 같은 로그인에서 회전된 토큰은 family_id를 공유한다."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    jti: str
+    family_id: str
+    user_id: int
+    # 함께 발급된 access token (family 폐기 시 denylist에 추가)
+    access_jti: str
+    access_expires_at: datetime
+    expires_at: datetime
+    revoked_at: datetime | None = None
+    access_revoked: bool = False
+    replaced_by: str | None = None
+    created_at: datetime | None = None
@@ -1,4 +1,4 @@
 from .base import RepositoryProtocol
+from .refresh_token import RefreshTokenStore
 
-__all__ = ["RepositoryProtocol"]
-
+__all__ = ["RepositoryProtocol", "RefreshTokenStore"]
@@ -0,0 +1,43 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.domain.entities.refresh_token import RefreshToken
+
+
+class RefreshTokenStore(ABC):
+    """Refresh token family 저장소 계약."""
+
+    @abstractmethod
+    async def add(self, token: RefreshToken) -> None:
+        ...
+
+    @abstractmethod
+    async def get(self, jti: str) -> RefreshToken | None:
+        ...
+
+    @abstractmethod
+    async def get_or_add(self, token: RefreshToken) -> RefreshToken:
+        """같은 jti 기록이 없을 때만 저장하고, 저장소에 남은 기록을 반환한다."""
+
+    @abstractmethod
+    async def rotate(self, jti: str, replacement: RefreshToken) -> bool:
+        """아직 폐기되지 않은 jti를 폐기하고 replacement를 저장한다.
+
+        이미 폐기된 토큰이면(재사용 또는 동시 회전) 아무것도 하지 않고 False를 반환한다.
+        """
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str) -> list[RefreshToken]:
+        """family 전체의 refresh/access token을 폐기하고 해당 기록을 반환한다."""
+
+    @abstractmethod
+    async def is_access_revoked(self, access_jti: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def revoked_access_tokens(self, now: datetime) -> list[str]:
+        """아직 만료되지 않은 폐기된 access token jti 목록."""
+
+    @abstractmethod
+    async def delete_expired(self, now: datetime) -> int:
+        """expires_at이 지난 기록을 삭제하고 삭제한 개수를 반환한다."""
@@ -1,5 +1,7 @@
+from .cache_version import CacheVersionModel
 from .material import MaterialModel
 from .progress import UserProgressModel
+from .refresh_token import RefreshTokenModel
 from .roadmap import RoadmapModel
 from .scrap import MaterialScrapModel
 from .user import UserModel
@@ -10,5 +12,10 @@ __all__ = [
     "MaterialModel",
     "UserProgressModel",
     "MaterialScrapModel",
+    "CacheVersionModel",
+    "RefreshTokenModel",
 ]
 
+# 모델 변경 시 캐시 버전을 올리는 ORM 이벤트 등록
+from app.infrastructure.db import versioning  # noqa: E402,F401
+
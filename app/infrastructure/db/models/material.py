@@ -4,12 +4,15 @@ from datetime import datetime
 from enum import Enum as PyEnum
 
 from sqlalchemy import (
+    DDL,
     DateTime,
     Enum as SqlEnum,
+    Index,
     JSON,
     Integer,
     String,
     Text,
+    event,
     func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -29,6 +32,10 @@ class MaterialType(str, PyEnum):
 
 class MaterialModel(Base):
     __tablename__ = "materials"
+    __table_args__ = (
+        # 최신순 목록의 keyset 페이지네이션용 (created_at desc, id desc 역방향 스캔)
+        Index("ix_materials_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -68,3 +75,36 @@ class MaterialModel(Base):
     )
 
 
+# 전문 검색 인덱스
+# - PostgreSQL: 마이그레이션(5d1e7a3c9f20)에서 생성되는 search_vector(tsvector) + GIN 인덱스.
+#   DB가 계산하는 generated 컬럼이므로 ORM 모델에는 매핑하지 않는다.
+# - SQLite(테스트/로컬): materials를 content 테이블로 쓰는 FTS5 가상 테이블 + 동기화 트리거
+MATERIALS_FTS_TABLE = "materials_fts"
+
+_SQLITE_FTS_DDL = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {MATERIALS_FTS_TABLE} USING fts5("
+    "title, summary, source, keywords, content='materials', content_rowid='id')",
+    f"CREATE TRIGGER IF NOT EXISTS {MATERIALS_FTS_TABLE}_ai AFTER INSERT ON materials BEGIN "
+    f"INSERT INTO {MATERIALS_FTS_TABLE}(rowid, title, summary, source, keywords) "
+    "VALUES (new.id, new.title, new.summary, new.source, new.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {MATERIALS_FTS_TABLE}_ad AFTER DELETE ON materials BEGIN "
+    f"INSERT INTO {MATERIALS_FTS_TABLE}({MATERIALS_FTS_TABLE}, rowid, title, summary, source, keywords) "
+    "VALUES ('delete', old.id, old.title, old.summary, old.source, old.keywords); END",
+    f"CREATE TRIGGER IF NOT EXISTS {MATERIALS_FTS_TABLE}_au AFTER UPDATE ON materials BEGIN "
+    f"INSERT INTO {MATERIALS_FTS_TABLE}({MATERIALS_FTS_TABLE}, rowid, title, summary, source, keywords) "
+    "VALUES ('delete', old.id, old.title, old.summary, old.source, old.keywords); "
+    f"INSERT INTO {MATERIALS_FTS_TABLE}(rowid, title, summary, source, keywords) "
+    "VALUES (new.id, new.title, new.summary, new.source, new.keywords); END",
+]
+
+for _statement in _SQLITE_FTS_DDL:
+    event.listen(
+        MaterialModel.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    MaterialModel.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {MATERIALS_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
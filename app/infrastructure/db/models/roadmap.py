@@ -55,7 +55,8 @@ class RoadmapModel(Base):
         "RoadmapModel",
         back_populates="parent",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        # 필요한 곳에서만 명시적으로 selectinload (RoadmapModel을 읽을 때마다
+        # 하위 노드를 단계별로 추가 조회하지 않도록)
     )
     progress_entries: Mapped[list["UserProgressModel"]] = relationship(
         "UserProgressModel",
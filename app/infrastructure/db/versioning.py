@@ -0,0 +1,121 @@
+"""
+Dataset version counters stored in `cache_versions`.
+
+Any ORM flush that inserts, updates or deletes a versioned model bumps the
+matching counter in the same transaction, so process-wide caches (e.g. the
+roadmap tree) can detect changes made by other workers, the seed scripts or
+admin edits with a single primary-key lookup. Scraps are versioned per user
+(`material_scraps:<user_id>`), so one user's scrap does not change anyone
+else's stamp.
+"""
+
+from __future__ import annotations
+
+from itertools import chain
+
+from sqlalchemy import (
+    BindParameter,
+    Connection,
+    ScalarSelect,
+    bindparam,
+    event,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.infrastructure.db.models.cache_version import CacheVersionModel
+from app.infrastructure.db.models.material import MaterialModel
+from app.infrastructure.db.models.roadmap import RoadmapModel
+from app.infrastructure.db.models.scrap import MaterialScrapModel
+
+ROADMAP_TREE = "roadmaps"
+MATERIAL_CATALOGUE = "materials"
+MATERIAL_SCRAPS = "material_scraps"
+
+_VERSIONED_MODELS: dict[type, str] = {
+    RoadmapModel: ROADMAP_TREE,
+    MaterialModel: MATERIAL_CATALOGUE,
+}
+
+# INSERT ... ON CONFLICT를 지원하는 dialect
+_UPSERT_INSERTS = {"postgresql": postgresql_insert, "sqlite": sqlite_insert}
+
+
+# 캐시 확인 때마다 실행되므로 문장을 한 번만 만든다
+_GET_VERSION = select(CacheVersionModel.version).where(
+    CacheVersionModel.name == bindparam("name")
+)
+
+
+def scrap_version_name(user_id: int) -> str:
+    """사용자별 스크랩 버전 카운터 이름"""
+    return f"{MATERIAL_SCRAPS}:{user_id}"
+
+
+def version_subquery(name: str | BindParameter[str]) -> ScalarSelect[int]:
+    """다른 조회 문장에 끼워 넣어 같은 왕복에서 버전을 함께 읽기 위한 스칼라 서브쿼리 (없으면 0)"""
+    return select(
+        func.coalesce(func.max(CacheVersionModel.version), 0)
+    ).where(CacheVersionModel.name == name).scalar_subquery()
+
+
+async def get_version(session: AsyncSession, name: str) -> int:
+    version = (await session.execute(_GET_VERSION, {"name": name})).scalar_one_or_none()
+    return version or 0
+
+
+def bump_version(connection: Connection, name: str) -> None:
+    """버전을 1 증가시킨다 (행이 없으면 생성). ORM 밖에서 직접 쓰기를 할 때도 호출한다.
+
+    행이 없을 때 동시에 처음 쓰는 트랜잭션끼리 기본키 충돌이 나지 않도록 upsert 한 문장으로 처리한다.
+    """
+    dialect_insert = _UPSERT_INSERTS.get(connection.dialect.name)
+    if dialect_insert is not None:
+        stmt = dialect_insert(CacheVersionModel).values(name=name, version=1)
+        connection.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[CacheVersionModel.name],
+                set_={
+                    "version": CacheVersionModel.version + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+        return
+
+    result = connection.execute(
+        update(CacheVersionModel)
+        .where(CacheVersionModel.name == name)
+        .values(version=CacheVersionModel.version + 1)
+    )
+    if result.rowcount == 0:
+        connection.execute(insert(CacheVersionModel).values(name=name, version=1))
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_versions_after_flush(session: Session, flush_context) -> None:
+    changed: set[str] = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        name = _version_name(obj)
+        if name is None or name in changed:
+            continue
+        if obj in session.dirty and not session.is_modified(obj):
+            continue
+        changed.add(name)
+
+    if changed:
+        connection = session.connection()
+        for name in sorted(changed):
+            bump_version(connection, name)
+
+
+def _version_name(obj: object) -> str | None:
+    if isinstance(obj, MaterialScrapModel):
+        return scrap_version_name(obj.user_id)
+    return _VERSIONED_MODELS.get(type(obj))
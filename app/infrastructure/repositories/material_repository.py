@@ -1,13 +1,126 @@
 from __future__ import annotations
 
-import json
-from typing import Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import NamedTuple
 
-from sqlalchemy import and_, func, or_, select, String
+from sqlalchemy import (
+    Subquery,
+    and_,
+    bindparam,
+    case,
+    column,
+    exists,
+    false,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+    text,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.domain.entities import Material, MaterialDifficulty, MaterialType
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.domain.entities import (
+    MaterialDifficulty,
+    MaterialMatch,
+    MaterialSort,
+    MaterialTotalMode,
+    MaterialType,
+)
 from app.infrastructure.db.models import MaterialModel, MaterialScrapModel
+from app.infrastructure.db.models.material import MATERIALS_FTS_TABLE
+from app.infrastructure.db.versioning import (
+    MATERIAL_CATALOGUE,
+    get_version,
+    scrap_version_name,
+    version_subquery,
+)
+
+# 마이그레이션으로만 존재하는 PostgreSQL generated 컬럼 (ORM 미매핑)
+_SEARCH_VECTOR = literal_column("materials.search_vector", type_=TSVECTOR)
+_TS_CONFIG = literal_column("'simple'::regconfig")
+_FTS_TABLE = table(MATERIALS_FTS_TABLE, column("rowid"))
+
+# 목록 응답(MaterialItem)에 필요한 컬럼만 튜플로 조회한다 (ORM 객체/엔티티 생성 없음).
+# created_at은 keyset 커서 계산용
+_ITEM_COLUMNS = (
+    MaterialModel.id,
+    MaterialModel.title,
+    MaterialModel.url,
+    MaterialModel.difficulty,
+    MaterialModel.type,
+    MaterialModel.source,
+    MaterialModel.summary,
+    MaterialModel.keywords,
+    MaterialModel.created_at,
+)
+
+# 스크랩 여부는 (user_id, material_id) 유니크 인덱스를 타는 EXISTS로 같은 쿼리에서 계산.
+# 기본 SELECT는 한 번만 만들고, 요청마다 필터/정렬만 덧붙인다 (user_id는 바인드 파라미터)
+_IS_SCRAPPED = exists().where(
+    MaterialScrapModel.user_id == bindparam("scrap_user_id"),
+    MaterialScrapModel.material_id == MaterialModel.id,
+)
+_SELECT_WITH_SCRAP = select(*_ITEM_COLUMNS, _IS_SCRAPPED.label("is_scrapped"))
+_SELECT_ANONYMOUS = select(*_ITEM_COLUMNS, false().label("is_scrapped"))
+_COUNT = select(func.count(MaterialModel.id))
+# 조건부 GET(ETag)용: 카탈로그 버전 + 사용자 스크랩 버전 (둘 다 cache_versions 기본키 조회)
+_VERSION_STAMP = select(
+    version_subquery(MATERIAL_CATALOGUE),
+    version_subquery(bindparam("scrap_version")),
+)
+# 공유 페이지에 is_scrapped를 덧씌울 때 해당 페이지의 자료 id만 확인
+# ((user_id, material_id) 유니크 인덱스 사용)
+_SCRAPPED_AMONG = select(MaterialScrapModel.material_id).where(
+    MaterialScrapModel.user_id == bindparam("user_id"),
+    MaterialScrapModel.material_id.in_(bindparam("material_ids", expanding=True)),
+)
+_ESTIMATED_TOTAL = text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = 'materials'::regclass"
+)
+
+_settings = get_settings()
+# (카탈로그 버전, 정규화된 필터 조합) -> 정확한 COUNT 결과 (짧은 TTL, 워커 프로세스 단위)
+material_count_cache: TTLCache[tuple, int] = TTLCache(
+    maxsize=_settings.material_count_cache_size,
+    ttl=_settings.material_count_cache_ttl_seconds,
+)
+
+
+class MaterialListRow(NamedTuple):
+    """목록 응답용 자료 한 행 (_ITEM_COLUMNS + is_scrapped 순서)"""
+
+    id: int
+    title: str
+    url: str
+    difficulty: MaterialDifficulty
+    type: MaterialType
+    source: str | None
+    summary: str | None
+    keywords: list[str] | None
+    created_at: datetime
+    is_scrapped: bool
+
+
+class CursorNotSupportedError(Exception):
+    """관련도/유사도순 정렬에 keyset cursor가 주어졌을 때 발생"""
+
+
+@dataclass(frozen=True)
+class MaterialSearchResult:
+    materials: list[MaterialListRow]
+    # total_mode=none이면 None
+    total: int | None
+    # 다음 페이지가 있고 최신순 정렬일 때 마지막 행의 (created_at, id)
+    next_after: tuple[datetime, int] | None = None
+    # total이 통계 기반 추정치인지 여부
+    total_is_estimate: bool = False
 
 
 class MaterialRepository:
@@ -22,24 +135,51 @@ class MaterialRepository:
         keyword: str | None = None,
         difficulty: MaterialDifficulty | None = None,
         type_: MaterialType | None = None,
+        sort: MaterialSort = MaterialSort.LATEST,
+        match: MaterialMatch = MaterialMatch.CONTAINS,
         page: int = 1,
         limit: int = 20,
+        after: tuple[datetime, int] | None = None,
+        total_mode: MaterialTotalMode = MaterialTotalMode.EXACT,
         user_id: int | None = None,
-    ) -> tuple[list[Material], int]:
-        stmt = select(MaterialModel)
-        count_stmt = select(func.count(MaterialModel.id))
+        catalogue_version: int | None = None,
+    ) -> MaterialSearchResult:
+        """자료 검색
+
+        `after`((created_at, id))가 주어지면 OFFSET 대신 keyset 방식으로 그 다음 행부터 조회한다.
+        keyset 페이지네이션은 최신순(created_at desc, id desc) 정렬에서만 지원한다.
+
+        `total_mode`
+        - exact: 필터 조합별로 짧은 TTL 동안 캐시된 정확한 COUNT
+        - estimated: 필터가 없으면 pg_class.reltuples 통계값, 그 외에는 exact와 동일
+        - none: COUNT를 생략 (total=None)
+
+        COUNT 캐시 키에는 카탈로그 버전이 포함된다. 호출자가 이미 읽은 버전을
+        `catalogue_version`으로 넘기면 재조회하지 않는다.
+        """
+        if user_id:
+            stmt = _SELECT_WITH_SCRAP
+            params = {"scrap_user_id": user_id}
+        else:
+            stmt = _SELECT_ANONYMOUS
+            params = {}
+        count_stmt = _COUNT
 
         filters = []
-        if keyword:
-            ilike = f"%{keyword}%"
-            # title과 summary만 DB 레벨에서 검색
-            # keywords는 Python 레벨에서 필터링 (SQLite JSON 검색 이슈 회피)
-            filters.append(
-                or_(
-                    MaterialModel.title.ilike(ilike),
-                    MaterialModel.summary.ilike(ilike),
-                )
-            )
+        ranked: Subquery | None = None
+        search_mode = "contains"
+        if keyword and keyword.strip():
+            if match == MaterialMatch.FUZZY:
+                ranked = self._fuzzy_ranking(keyword)
+                search_mode = "fuzzy"
+            elif sort == MaterialSort.RELEVANCE:
+                ranked = self._full_text_ranking(keyword)
+                search_mode = "fulltext"
+        if ranked is not None:
+            stmt = stmt.join(ranked, ranked.c.id == MaterialModel.id)
+            count_stmt = count_stmt.join(ranked, ranked.c.id == MaterialModel.id)
+        elif keyword:
+            filters.append(self._keyword_filter(keyword))
         if difficulty:
             filters.append(MaterialModel.difficulty == difficulty)
         if type_:
@@ -49,66 +189,201 @@ class MaterialRepository:
             stmt = stmt.where(and_(*filters))
             count_stmt = count_stmt.where(and_(*filters))
 
-        stmt = stmt.order_by(MaterialModel.created_at.desc())
-        total = (await self.session.execute(count_stmt)).scalar_one()
-
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
-
-        materials_result = await self.session.scalars(stmt)
-        materials_list = list(materials_result)
-        
-        # keywords 검색은 Python 레벨에서 필터링
-        if keyword:
-            keyword_lower = keyword.lower()
-            materials_list = [
-                m for m in materials_list
-                if keyword_lower in m.title.lower()
-                or (m.summary and keyword_lower in m.summary.lower())
-                or (m.keywords and any(keyword_lower in str(k).lower() for k in (m.keywords or [])))
-            ]
-            # Python 필터링 후 total 재계산
-            total = len(materials_list)
-        
-        scrap_ids: set[int] = set()
-        if user_id:
-            scrap_stmt = select(MaterialScrapModel.material_id).where(
-                MaterialScrapModel.user_id == user_id
+        if ranked is not None and after is not None:
+            raise CursorNotSupportedError("keyset pagination requires latest ordering")
+
+        # id를 보조 정렬키로 두어 같은 created_at에서도 순서가 고정되도록 한다
+        order_by = [MaterialModel.created_at.desc(), MaterialModel.id.desc()]
+        if ranked is not None:
+            order_by.insert(0, ranked.c.rank.desc())
+        stmt = stmt.order_by(*order_by)
+
+        total: int | None = None
+        total_is_estimate = False
+        if total_mode == MaterialTotalMode.ESTIMATED and not (
+            keyword or difficulty or type_
+        ):
+            total = await self._estimated_total()
+            total_is_estimate = total is not None
+        if total is None and total_mode != MaterialTotalMode.NONE:
+            # 쓰기 이후에는 버전이 바뀌므로 이전 COUNT를 재사용하지 않는다
+            if catalogue_version is None:
+                catalogue_version = await get_version(self.session, MATERIAL_CATALOGUE)
+            count_key = (
+                catalogue_version,
+                search_mode,
+                keyword.lower() if keyword else None,
+                difficulty,
+                type_,
+            )
+            total = material_count_cache.get(count_key)
+            if total is None:
+                total = (await self.session.execute(count_stmt)).scalar_one()
+                material_count_cache.set(count_key, total)
+
+        if after is not None:
+            # (created_at, id) 복합 인덱스를 역방향으로 타며 바로 다음 행부터 읽는다
+            stmt = stmt.where(
+                tuple_(MaterialModel.created_at, MaterialModel.id) < tuple_(*after)
+            )
+        else:
+            stmt = stmt.offset((page - 1) * limit)
+        # 다음 페이지 존재 여부 확인용으로 한 행 더 조회
+        stmt = stmt.limit(limit + 1)
+
+        result = await self.session.execute(stmt, params)
+        rows = [MaterialListRow._make(row) for row in result]
+        next_after = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            if ranked is None:
+                last = rows[-1]
+                next_after = (last.created_at, last.id)
+
+        return MaterialSearchResult(
+            materials=rows,
+            total=total,
+            next_after=next_after,
+            total_is_estimate=total_is_estimate,
+        )
+
+    async def get_version_stamp(self, user_id: int) -> tuple[int, int]:
+        """(자료 카탈로그 버전, 사용자 스크랩 버전)을 한 번의 조회로 반환.
+
+        스크랩 버전이 0이면 사용자가 한 번도 스크랩한 적이 없다.
+        """
+        row = (
+            await self.session.execute(
+                _VERSION_STAMP, {"scrap_version": scrap_version_name(user_id)}
+            )
+        ).one()
+        return row[0], row[1]
+
+    async def get_scrapped_ids(
+        self, user_id: int, material_ids: list[int]
+    ) -> set[int]:
+        """material_ids 중 사용자가 스크랩한 자료 id (공유 페이지에 is_scrapped를 덧씌울 때 사용)"""
+        if not material_ids:
+            return set()
+        result = await self.session.execute(
+            _SCRAPPED_AMONG, {"user_id": user_id, "material_ids": material_ids}
+        )
+        return set(result.scalars())
+
+    async def _estimated_total(self) -> int | None:
+        """PostgreSQL 통계(reltuples) 기반 전체 행 수 추정치. 사용할 수 없으면 None"""
+        if self._dialect_name() != "postgresql":
+            return None
+        estimate = (await self.session.execute(_ESTIMATED_TOTAL)).scalar_one_or_none()
+        # 한 번도 ANALYZE 되지 않은 테이블은 -1을 반환
+        if estimate is None or estimate < 0:
+            return None
+        return int(estimate)
+
+    def _keyword_filter(self, keyword: str) -> ColumnElement[bool]:
+        """title/summary/keywords 중 하나라도 키워드를 포함하면 매칭 (DB 레벨)"""
+        pattern = f"%{keyword}%"
+        return or_(
+            MaterialModel.title.ilike(pattern),
+            MaterialModel.summary.ilike(pattern),
+            self._keywords_match(pattern),
+        )
+
+    def _keywords_match(self, pattern: str) -> ColumnElement[bool]:
+        """keywords JSON 배열의 원소 중 하나라도 pattern(ILIKE)과 일치하면 참"""
+        # keywords는 JSON 배열이므로 원소 단위로 펼쳐서 비교
+        if self._dialect_name() == "postgresql":
+            # JSON null 등 배열이 아닌 값은 NULL로 바꿔 원소 추출 에러를 방지
+            keywords = case(
+                (func.json_typeof(MaterialModel.keywords) == "array", MaterialModel.keywords)
+            )
+            element = (
+                func.json_array_elements_text(keywords)
+                .table_valued("value")
+                .render_derived(name="keyword_element")
+            )
+        else:
+            element = (
+                func.json_each(MaterialModel.keywords)
+                .table_valued("value")
+                .alias("keyword_element")
+            )
+        return exists(
+            select(1).select_from(element).where(element.c.value.ilike(pattern))
+        )
+
+    def _full_text_ranking(self, keyword: str) -> Subquery:
+        """전문 검색 매칭 결과를 (id, rank) 서브쿼리로 반환 (rank가 클수록 관련도 높음)"""
+        if self._dialect_name() == "postgresql":
+            query = func.websearch_to_tsquery(_TS_CONFIG, keyword)
+            return (
+                select(
+                    MaterialModel.id.label("id"),
+                    func.ts_rank_cd(_SEARCH_VECTOR, query).label("rank"),
+                )
+                .where(_SEARCH_VECTOR.op("@@")(query))
+                .subquery("ranked_materials")
             )
-            scrap_ids = set((await self.session.execute(scrap_stmt)).scalars().all())
 
+        # SQLite: FTS5 bm25는 값이 작을수록 관련도가 높으므로 부호를 뒤집는다.
+        # 컬럼 가중치는 PostgreSQL setweight(A/B/C/D) 순서와 맞춘다.
+        fts = literal_column(MATERIALS_FTS_TABLE)
+        return (
+            select(
+                _FTS_TABLE.c.rowid.label("id"),
+                (-func.bm25(fts, 1.0, 0.2, 0.1, 0.4)).label("rank"),
+            )
+            .select_from(_FTS_TABLE)
+            .where(fts.op("MATCH")(self._fts5_query(keyword)))
+            .subquery("ranked_materials")
+        )
+
+    def _fuzzy_ranking(self, keyword: str) -> Subquery:
+        """부분 단어/오타를 허용하는 매칭 결과를 (id, rank) 서브쿼리로 반환"""
+        if self._dialect_name() == "postgresql":
+            # - ILIKE '%kw%' : 부분 문자열
+            # - column %> kw : word_similarity(kw, column) >= pg_trgm.word_similarity_threshold
+            # - keywords 원소 부분 일치 : 기본(contains) 모드와 같은 결과를 포함하도록 추가
+            #   (인덱스가 없어 title/summary의 BitmapOr 대신 순차 스캔 필터가 될 수 있음)
+            pattern = f"%{keyword}%"
+            summary = func.coalesce(MaterialModel.summary, "")
+            rank = func.greatest(
+                func.word_similarity(keyword, MaterialModel.title),
+                func.word_similarity(keyword, summary),
+            )
+            predicate = or_(
+                MaterialModel.title.ilike(pattern),
+                MaterialModel.summary.ilike(pattern),
+                MaterialModel.title.op("%>")(keyword),
+                MaterialModel.summary.op("%>")(keyword),
+                self._keywords_match(pattern),
+            )
+        else:
+            # SQLite에는 trigram 유사도가 없으므로 부분 일치 + 제목 매칭 우선으로 대체
+            rank = case(
+                (MaterialModel.title.ilike(f"%{keyword}%"), 1.0),
+                else_=0.0,
+            )
+            predicate = self._keyword_filter(keyword)
         return (
-            [
-                self._to_entity(model, is_scrapped=model.id in scrap_ids)
-                for model in materials_list
-            ],
-            total,
+            select(MaterialModel.id.label("id"), rank.label("rank"))
+            .where(predicate)
+            .subquery("ranked_materials")
         )
 
+    @staticmethod
+    def _fts5_query(keyword: str) -> str:
+        # 사용자 입력을 FTS5 문법으로 해석하지 않도록 토큰별로 따옴표 처리 (AND 결합)
+        tokens = keyword.split()
+        return " ".join('"' + token.replace('"', '""') + '"' for token in tokens)
+
+    def _dialect_name(self) -> str:
+        return self.session.bind.dialect.name
+
     async def get_by_id(self, material_id: int) -> MaterialModel | None:
         stmt = select(MaterialModel).where(MaterialModel.id == material_id)
         return await self.session.scalar(stmt)
 
-    def _to_entity(self, model: MaterialModel, *, is_scrapped: bool) -> Material:
-        keywords = model.keywords or []
-        return Material(
-            id=model.id,
-            title=model.title,
-            url=model.url,
-            difficulty=MaterialDifficulty(
-                model.difficulty.value if hasattr(model.difficulty, "value") else model.difficulty
-            ),
-            type=MaterialType(
-                model.type.value if hasattr(model.type, "value") else model.type
-            ),
-            source=model.source,
-            summary=model.summary,
-            keywords=list(keywords),
-            is_scrapped=is_scrapped,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
-
 
 class MaterialScrapRepository:
     """Handles user scrap state for materials."""
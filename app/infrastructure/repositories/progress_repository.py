@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, bindparam, func, literal, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.domain.entities import ItemType, RoadmapCategory, UserProgress
@@ -12,6 +15,102 @@ from app.infrastructure.db.models import (
     RoadmapModel,
     UserProgressModel,
 )
+from app.infrastructure.db.versioning import (
+    MATERIAL_CATALOGUE,
+    ROADMAP_TREE,
+    version_subquery,
+)
+
+
+_PROGRESS_MAP = select(
+    UserProgressModel.roadmap_id,
+    UserProgressModel.is_completed,
+).where(
+    and_(
+        UserProgressModel.user_id == bindparam("user_id"),
+        UserProgressModel.item_type == ItemType.ROADMAP.value,
+    )
+)
+
+
+# 조건부 GET(ETag)용 버전 스탬프: 데이터셋 버전 + 사용자 진도의 (개수, 완료 개수, 최종 수정 시각)
+_PROGRESS_STAMP_COLUMNS = (
+    func.count(UserProgressModel.id),
+    func.count(UserProgressModel.id).filter(UserProgressModel.is_completed.is_(True)),
+    func.max(UserProgressModel.updated_at),
+)
+_ROADMAP_STAMP = select(
+    version_subquery(ROADMAP_TREE), *_PROGRESS_STAMP_COLUMNS
+).where(
+    and_(
+        UserProgressModel.user_id == bindparam("user_id"),
+        UserProgressModel.item_type == ItemType.ROADMAP.value,
+    )
+)
+_OVERVIEW_STAMP = select(
+    version_subquery(ROADMAP_TREE),
+    version_subquery(MATERIAL_CATALOGUE),
+    *_PROGRESS_STAMP_COLUMNS,
+).where(UserProgressModel.user_id == bindparam("user_id"))
+
+
+@lru_cache(maxsize=None)
+def _statistics_statement(
+    include_roadmap: bool, include_material: bool, by_category: bool
+) -> Select:
+    """필터 조합(최대 6가지)별 통계 쿼리. user_id/category는 바인드 파라미터로 받는다.
+
+    전체 개수는 스칼라 서브쿼리, 완료 개수는 사용자 progress 한 번 스캔 + FILTER 집계로
+    한 번의 왕복에서 모두 계산한다.
+    """
+    category = bindparam("category")
+
+    roadmap_total = literal(0)
+    if include_roadmap:
+        roadmap_total_stmt = select(func.count(RoadmapModel.id))
+        if by_category:
+            roadmap_total_stmt = roadmap_total_stmt.where(
+                RoadmapModel.category == category
+            )
+        roadmap_total = roadmap_total_stmt.scalar_subquery()
+
+    material_total = literal(0)
+    if include_material:
+        material_total = select(func.count(MaterialModel.id)).scalar_subquery()
+
+    roadmap_completed_filter = and_(
+        UserProgressModel.item_type == ItemType.ROADMAP.value,
+        RoadmapModel.id.is_not(None),
+    )
+    if by_category:
+        roadmap_completed_filter = and_(
+            roadmap_completed_filter, RoadmapModel.category == category
+        )
+    completed = (
+        select(
+            func.count(UserProgressModel.id)
+            .filter(roadmap_completed_filter)
+            .label("roadmap_completed"),
+            func.count(UserProgressModel.id)
+            .filter(UserProgressModel.item_type == ItemType.MATERIAL.value)
+            .label("material_completed"),
+        )
+        .select_from(UserProgressModel)
+        .outerjoin(RoadmapModel, UserProgressModel.roadmap_id == RoadmapModel.id)
+        .where(
+            and_(
+                UserProgressModel.user_id == bindparam("user_id"),
+                UserProgressModel.is_completed.is_(True),
+            )
+        )
+        .subquery("completed")
+    )
+    return select(
+        roadmap_total.label("roadmap_total"),
+        material_total.label("material_total"),
+        completed.c.roadmap_completed,
+        completed.c.material_completed,
+    ).select_from(completed)
 
 
 class UserProgressRepository:
@@ -21,21 +120,21 @@ class UserProgressRepository:
         self.session = session
 
     async def get_progress_map(self, user_id: int) -> dict[int, bool]:
-        stmt = (
-            select(
-                UserProgressModel.roadmap_id,
-                UserProgressModel.is_completed,
-            )
-            .where(
-                and_(
-                    UserProgressModel.user_id == user_id,
-                    UserProgressModel.item_type == ItemType.ROADMAP.value,
-                )
-            )
-        )
-        result = await self.session.execute(stmt)
+        result = await self.session.execute(_PROGRESS_MAP, {"user_id": user_id})
         return {roadmap_id: completed for roadmap_id, completed in result if roadmap_id}
 
+    async def get_version_stamp(
+        self, user_id: int, *, item_type: Optional[ItemType] = None
+    ) -> tuple:
+        """응답 본문을 만들지 않고도 변경 여부를 판단할 수 있는 값들을 한 번의 조회로 반환
+
+        - item_type=roadmap: (로드맵 트리 버전, 로드맵 진도 개수, 완료 개수, 최종 수정 시각)
+        - None: (로드맵 트리 버전, 자료 카탈로그 버전, 전체 진도 개수, 완료 개수, 최종 수정 시각)
+        """
+        stmt = _ROADMAP_STAMP if item_type == ItemType.ROADMAP else _OVERVIEW_STAMP
+        row = (await self.session.execute(stmt, {"user_id": user_id})).one()
+        return tuple(row)
+
     async def upsert_progress(
         self,
         *,
@@ -44,39 +143,65 @@ class UserProgressRepository:
         completed: bool,
         item_type: ItemType,
     ) -> UserProgress:
-        target_column = (
-            UserProgressModel.roadmap_id
-            if item_type == ItemType.ROADMAP
-            else UserProgressModel.material_id
-        )
-        stmt = select(UserProgressModel).where(
-            and_(
-                UserProgressModel.user_id == user_id,
-                UserProgressModel.item_type == item_type.value,
-                target_column == item_id,
-            )
-        )
-        progress = await self.session.scalar(stmt)
+        """INSERT ... ON CONFLICT DO UPDATE ... RETURNING 한 문장으로 진도를 저장
 
-        if progress:
-            progress.is_completed = completed
-            progress.completed_at = datetime.now(timezone.utc) if completed else None
+        동시 요청(더블 클릭)에도 uq_user_progress / uq_user_material_progress 제약 위에서
+        원자적으로 갱신되며, 항목 이름/카테고리도 같은 문장의 RETURNING으로 함께 받는다.
+        """
+        if item_type == ItemType.ROADMAP:
+            target_column = UserProgressModel.roadmap_id
+            item_name = select(RoadmapModel.name).where(RoadmapModel.id == item_id)
+            category = select(RoadmapModel.category).where(RoadmapModel.id == item_id)
         else:
-            progress = UserProgressModel(
-                user_id=user_id,
-                roadmap_id=item_id if item_type == ItemType.ROADMAP else None,
-                material_id=item_id if item_type == ItemType.MATERIAL else None,
-                item_type=item_type.value,
-                is_completed=completed,
-                completed_at=datetime.now(timezone.utc) if completed else None,
-            )
-            self.session.add(progress)
+            target_column = UserProgressModel.material_id
+            item_name = select(MaterialModel.title).where(MaterialModel.id == item_id)
+            category = select(MaterialModel.type).where(MaterialModel.id == item_id)
 
-        await self.session.flush()
-        await self.session.refresh(progress)
+        insert = (
+            postgresql_insert
+            if self.session.bind.dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        stmt = insert(UserProgressModel).values(
+            user_id=user_id,
+            roadmap_id=item_id if item_type == ItemType.ROADMAP else None,
+            material_id=item_id if item_type == ItemType.MATERIAL else None,
+            item_type=item_type.value,
+            is_completed=completed,
+            completed_at=datetime.now(timezone.utc) if completed else None,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[UserProgressModel.user_id, target_column],
+            set_={
+                "is_completed": stmt.excluded.is_completed,
+                "completed_at": stmt.excluded.completed_at,
+                "updated_at": func.now(),
+            },
+        ).returning(
+            UserProgressModel.id,
+            UserProgressModel.user_id,
+            target_column.label("item_id"),
+            UserProgressModel.item_type,
+            UserProgressModel.is_completed,
+            UserProgressModel.completed_at,
+            item_name.scalar_subquery().label("item_name"),
+            category.scalar_subquery().label("category"),
+        )
+        row = (await self.session.execute(stmt)).one()
         await self.session.commit()
 
-        return await self._to_entity(progress)
+        return UserProgress(
+            id=row.id,
+            user_id=row.user_id,
+            item_id=row.item_id,
+            item_name=row.item_name or "",
+            item_type=row.item_type,
+            category=(
+                row.category.value if hasattr(row.category, "value") else row.category
+            ),
+            is_completed=row.is_completed,
+            completed_at=row.completed_at,
+        )
 
     async def list_by_user(
         self,
@@ -114,12 +239,10 @@ class UserProgressRepository:
                 )
             )
         result = await self.session.execute(stmt)
-        progress_list: list[UserProgress] = []
-        for progress, roadmap, material in result:
-            progress_list.append(
-                await self._to_entity(progress, roadmap=roadmap, material=material)
-            )
-        return progress_list
+        return [
+            self._to_entity(progress, roadmap=roadmap, material=material)
+            for progress, roadmap, material in result
+        ]
 
     async def statistics(
         self,
@@ -130,58 +253,18 @@ class UserProgressRepository:
         include_roadmap = item_type in (None, ItemType.ROADMAP)
         include_material = item_type in (None, ItemType.MATERIAL)
 
-        roadmap_total = 0
-        if include_roadmap:
-            stmt_roadmap_total = select(func.count(RoadmapModel.id))
-            if category:
-                stmt_roadmap_total = stmt_roadmap_total.where(
-                    RoadmapModel.category == category
-                )
-            roadmap_total = (await self.session.execute(stmt_roadmap_total)).scalar_one()
-
-        material_total = 0
-        if include_material:
-            stmt_material_total = select(func.count(MaterialModel.id))
-            material_total = (
-                await self.session.execute(stmt_material_total)
-            ).scalar_one()
-
-        roadmap_completed = 0
-        if include_roadmap:
-            stmt_roadmap_completed = (
-                select(func.count(UserProgressModel.id))
-                .join(RoadmapModel, UserProgressModel.roadmap_id == RoadmapModel.id)
-                .where(
-                    and_(
-                        UserProgressModel.user_id == user_id,
-                        UserProgressModel.item_type == ItemType.ROADMAP.value,
-                        UserProgressModel.is_completed.is_(True),
-                    )
-                )
-            )
-            if category:
-                stmt_roadmap_completed = stmt_roadmap_completed.where(
-                    RoadmapModel.category == category
-                )
-            roadmap_completed = (
-                await self.session.execute(stmt_roadmap_completed)
-            ).scalar_one()
-
-        material_completed = 0
-        if include_material:
-            stmt_material_completed = (
-                select(func.count(UserProgressModel.id))
-                .where(
-                    and_(
-                        UserProgressModel.user_id == user_id,
-                        UserProgressModel.item_type == ItemType.MATERIAL.value,
-                        UserProgressModel.is_completed.is_(True),
-                    )
-                )
-            )
-            material_completed = (
-                await self.session.execute(stmt_material_completed)
-            ).scalar_one()
+        stmt = _statistics_statement(
+            include_roadmap, include_material, category is not None
+        )
+        params = {"user_id": user_id}
+        if category is not None:
+            params["category"] = category
+        row = (await self.session.execute(stmt, params)).one()
+
+        roadmap_total = row.roadmap_total
+        material_total = row.material_total
+        roadmap_completed = row.roadmap_completed if include_roadmap else 0
+        material_completed = row.material_completed if include_material else 0
 
         total_items = roadmap_total + material_total
         completed_items = roadmap_completed + material_completed
@@ -196,16 +279,15 @@ class UserProgressRepository:
             "material_completed": material_completed,
         }
 
-    async def _to_entity(
-        self,
+    @staticmethod
+    def _to_entity(
         progress: UserProgressModel,
         roadmap: RoadmapModel | None = None,
         material: MaterialModel | None = None,
     ) -> UserProgress:
+        # roadmap/material은 list_by_user의 outer join 결과. 없으면 이미 삭제된 항목이므로
+        # 행마다 다시 조회하지 않는다 (N+1 방지)
         if progress.item_type == ItemType.ROADMAP:
-            roadmap = roadmap or await self.session.scalar(
-                select(RoadmapModel).where(RoadmapModel.id == progress.roadmap_id)
-            )
             category = (
                 roadmap.category.value
                 if roadmap and hasattr(roadmap.category, "value")
@@ -214,9 +296,6 @@ class UserProgressRepository:
             item_name = roadmap.name if roadmap else ""
             item_id = progress.roadmap_id or 0
         else:
-            material = material or await self.session.scalar(
-                select(MaterialModel).where(MaterialModel.id == progress.material_id)
-            )
             category = (
                 material.type.value
                 if material and hasattr(material.type, "value")
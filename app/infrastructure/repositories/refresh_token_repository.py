@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import and_, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.entities import RefreshToken
+from app.domain.repositories import RefreshTokenStore
+from app.infrastructure.db.models import RefreshTokenModel
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class SqlRefreshTokenStore(RefreshTokenStore):
+    """refresh_tokens 테이블 기반 저장소."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def add(self, token: RefreshToken) -> None:
+        await self.session.execute(
+            insert(RefreshTokenModel).values(**_token_values(token))
+        )
+        await self.session.commit()
+
+    async def get(self, jti: str) -> RefreshToken | None:
+        model = await self.session.get(RefreshTokenModel, jti)
+        if model is None:
+            return None
+        return RefreshToken.model_validate(model)
+
+    async def get_or_add(self, token: RefreshToken) -> RefreshToken:
+        try:
+            await self.add(token)
+        except IntegrityError:
+            # 동시에 같은 jti를 먼저 저장한 요청이 있음
+            await self.session.rollback()
+            existing = await self.get(token.jti)
+            if existing is None:
+                raise
+            return existing
+        return token
+
+    async def rotate(self, jti: str, replacement: RefreshToken) -> bool:
+        # revoked_at IS NULL 조건으로 동시 회전 중 하나만 성공하도록 한다
+        result = await self.session.execute(
+            update(RefreshTokenModel)
+            .where(
+                and_(
+                    RefreshTokenModel.jti == jti,
+                    RefreshTokenModel.revoked_at.is_(None),
+                )
+            )
+            .values(revoked_at=_utcnow(), replaced_by=replacement.jti)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            return False
+        await self.session.execute(
+            insert(RefreshTokenModel).values(**_token_values(replacement))
+        )
+        await self.session.commit()
+        return True
+
+    async def revoke_family(self, family_id: str) -> list[RefreshToken]:
+        now = _utcnow()
+        await self.session.execute(
+            update(RefreshTokenModel)
+            .where(
+                and_(
+                    RefreshTokenModel.family_id == family_id,
+                    RefreshTokenModel.revoked_at.is_(None),
+                )
+            )
+            .values(revoked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(
+            update(RefreshTokenModel)
+            .where(RefreshTokenModel.family_id == family_id)
+            .values(access_revoked=True)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        result = await self.session.execute(
+            select(RefreshTokenModel)
+            .where(RefreshTokenModel.family_id == family_id)
+            .execution_options(populate_existing=True)
+        )
+        return [RefreshToken.model_validate(model) for model in result.scalars()]
+
+    async def is_access_revoked(self, access_jti: str) -> bool:
+        stmt = select(RefreshTokenModel.access_revoked).where(
+            RefreshTokenModel.access_jti == access_jti
+        )
+        return bool((await self.session.execute(stmt)).scalar_one_or_none())
+
+    async def revoked_access_tokens(self, now: datetime) -> list[str]:
+        stmt = select(RefreshTokenModel.access_jti).where(
+            and_(
+                RefreshTokenModel.access_revoked.is_(True),
+                RefreshTokenModel.access_expires_at > now,
+            )
+        )
+        return list((await self.session.execute(stmt)).scalars())
+
+    async def delete_expired(self, now: datetime) -> int:
+        # access token은 refresh token보다 먼저 만료되므로 denylist 정보도 함께 정리된다
+        result = await self.session.execute(
+            delete(RefreshTokenModel)
+            .where(RefreshTokenModel.expires_at <= now)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+
+class InMemoryRefreshTokenStore(RefreshTokenStore):
+    """단일 프로세스/테스트용 저장소."""
+
+    def __init__(self) -> None:
+        self._tokens: dict[str, RefreshToken] = {}
+
+    async def add(self, token: RefreshToken) -> None:
+        self._tokens[token.jti] = token
+
+    async def get(self, jti: str) -> RefreshToken | None:
+        return self._tokens.get(jti)
+
+    async def get_or_add(self, token: RefreshToken) -> RefreshToken:
+        return self._tokens.setdefault(token.jti, token)
+
+    async def rotate(self, jti: str, replacement: RefreshToken) -> bool:
+        current = self._tokens.get(jti)
+        if current is None or current.revoked_at is not None:
+            return False
+        self._tokens[jti] = current.model_copy(
+            update={"revoked_at": _utcnow(), "replaced_by": replacement.jti}
+        )
+        self._tokens[replacement.jti] = replacement
+        return True
+
+    async def revoke_family(self, family_id: str) -> list[RefreshToken]:
+        now = _utcnow()
+        revoked = []
+        for jti, token in self._tokens.items():
+            if token.family_id != family_id:
+                continue
+            token = token.model_copy(
+                update={
+                    "revoked_at": token.revoked_at or now,
+                    "access_revoked": True,
+                }
+            )
+            self._tokens[jti] = token
+            revoked.append(token)
+        return revoked
+
+    async def is_access_revoked(self, access_jti: str) -> bool:
+        return any(
+            token.access_revoked and token.access_jti == access_jti
+            for token in self._tokens.values()
+        )
+
+    async def revoked_access_tokens(self, now: datetime) -> list[str]:
+        return [
+            token.access_jti
+            for token in self._tokens.values()
+            if token.access_revoked and token.access_expires_at > now
+        ]
+
+    async def delete_expired(self, now: datetime) -> int:
+        expired = [jti for jti, token in self._tokens.items() if token.expires_at <= now]
+        for jti in expired:
+            del self._tokens[jti]
+        return len(expired)
+
+
+def _token_values(token: RefreshToken) -> dict:
+    return token.model_dump(exclude={"created_at"})
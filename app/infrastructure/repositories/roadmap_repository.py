@@ -1,12 +1,58 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from dataclasses import dataclass
+from datetime import datetime
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
+from app.domain.entities import RoadmapCategory
 from app.infrastructure.db.models import RoadmapModel
+from app.infrastructure.db.versioning import ROADMAP_TREE, get_version
+
+
+@dataclass(frozen=True)
+class RoadmapNodeData:
+    """사용자와 무관한 로드맵 노드의 불변 데이터"""
+
+    id: int
+    category: RoadmapCategory
+    name: str
+    level: int
+    description: str | None
+    parent_id: int | None
+    created_at: datetime | None
+    updated_at: datetime | None
+
+
+@dataclass(frozen=True)
+class RoadmapTreeSnapshot:
+    """특정 버전의 전체 로드맵 노드 (id 순서)"""
+
+    version: int
+    nodes: tuple[RoadmapNodeData, ...]
+
+
+class RoadmapTreeCache:
+    """워커 프로세스 단위로 최신 로드맵 스냅샷 하나를 보관"""
+
+    def __init__(self) -> None:
+        self.snapshot: RoadmapTreeSnapshot | None = None
+
+    def get(self, version: int) -> RoadmapTreeSnapshot | None:
+        snapshot = self.snapshot
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+        return None
+
+    def set(self, snapshot: RoadmapTreeSnapshot) -> None:
+        self.snapshot = snapshot
+
+    def clear(self) -> None:
+        self.snapshot = None
+
+
+roadmap_tree_cache = RoadmapTreeCache()
 
 
 class RoadmapRepository:
@@ -15,26 +61,52 @@ class RoadmapRepository:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
-    async def list_all(self) -> list[RoadmapModel]:
-        stmt = select(RoadmapModel).options(selectinload(RoadmapModel.children))
-        result = await self.session.scalars(stmt)
-        return list(result)
+    async def get_tree(self, version: int | None = None) -> RoadmapTreeSnapshot:
+        """캐시된 로드맵 스냅샷을 반환. DB 버전 카운터가 바뀌었을 때만 다시 읽는다.
+
+        같은 요청에서 이미 읽은 버전이 있으면 `version`으로 넘겨 버전 조회를 생략한다.
+        """
+        if version is None:
+            version = await get_version(self.session, ROADMAP_TREE)
+        snapshot = roadmap_tree_cache.get(version)
+        if snapshot is not None:
+            return snapshot
+
+        stmt = select(
+            RoadmapModel.id,
+            RoadmapModel.category,
+            RoadmapModel.name,
+            RoadmapModel.level,
+            RoadmapModel.description,
+            RoadmapModel.parent_id,
+            RoadmapModel.created_at,
+            RoadmapModel.updated_at,
+        ).order_by(RoadmapModel.id)
+        result = await self.session.execute(stmt)
+        snapshot = RoadmapTreeSnapshot(
+            version=version,
+            nodes=tuple(
+                RoadmapNodeData(
+                    id=row.id,
+                    category=RoadmapCategory(
+                        row.category.value
+                        if hasattr(row.category, "value")
+                        else row.category
+                    ),
+                    name=row.name,
+                    level=row.level,
+                    description=row.description,
+                    parent_id=row.parent_id,
+                    created_at=row.created_at,
+                    updated_at=row.updated_at,
+                )
+                for row in result
+            ),
+        )
+        roadmap_tree_cache.set(snapshot)
+        return snapshot
 
     async def exists(self, roadmap_id: int) -> bool:
         stmt = select(RoadmapModel.id).where(RoadmapModel.id == roadmap_id)
         res = await self.session.execute(stmt)
         return res.scalar_one_or_none() is not None
-
-    @staticmethod
-    def flatten(models: Iterable[RoadmapModel]) -> list[RoadmapModel]:
-        ordered: list[RoadmapModel] = []
-
-        def _traverse(node: RoadmapModel) -> None:
-            ordered.append(node)
-            for child in node.children:
-                _traverse(child)
-
-        for roadmap in models:
-            _traverse(roadmap)
-        return ordered
-
@@ -1,12 +1,39 @@
+from itertools import chain
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import bindparam, event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from app.core.cache import TTLCache
+from app.core.config import get_settings
 from app.domain.entities import User
 from app.domain.repositories import RepositoryProtocol
 from app.infrastructure.db.models import UserModel
 
+settings = get_settings()
+
+# 인증 요청마다 반복되는 users 조회를 줄이기 위한 프로세스 단위 캐시 (user id → User)
+# 같은 프로세스의 ORM 변경은 아래 flush/commit 훅으로 즉시 무효화되고,
+# 다른 워커나 ORM 밖에서의 변경은 TTL 안에 반영된다.
+user_cache: TTLCache[int, User] = TTLCache(
+    maxsize=settings.user_cache_size,
+    ttl=settings.user_cache_ttl_seconds,
+)
+
+_PENDING_INVALIDATIONS = "invalidated_user_ids"
+
+# 인증 경로에서 매 요청 실행되는 문장은 한 번만 만들어 컴파일 캐시/prepared statement를 재사용
+_USER_BY_ID = select(UserModel).where(UserModel.id == bindparam("user_id")).limit(1)
+_USER_BY_EMAIL = (
+    select(UserModel).where(UserModel.email == bindparam("email")).limit(1)
+)
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """사용자 정보를 ORM 밖에서 변경했을 때 직접 호출한다."""
+    user_cache.pop(user_id)
+
 
 class UserRepository(RepositoryProtocol[User]):
     """Repository implementing CRUD operations for the User aggregate."""
@@ -39,6 +66,47 @@ class UserRepository(RepositoryProtocol[User]):
             return None
         return User.model_validate(model)
 
+    async def get_by_id(self, user_id: int) -> User | None:
+        """캐시를 우선 사용하는 id 조회 (인증 경로 전용)."""
+        user = user_cache.get(user_id)
+        if user is not None:
+            return user
+        user = await self._fetch_one(_USER_BY_ID, user_id=user_id)
+        if user is not None:
+            user_cache.set(user_id, user)
+        return user
+
     async def get_by_email(self, email: str) -> User | None:
-        return await self.get(email=email)
+        return await self._fetch_one(_USER_BY_EMAIL, email=email)
+
+    async def _fetch_one(self, stmt, **params: Any) -> User | None:
+        model = (await self.session.execute(stmt, params)).scalar_one_or_none()
+        if not model:
+            return None
+        return User.model_validate(model)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_users_after_flush(session: Session, flush_context) -> None:
+    user_ids = {
+        obj.id
+        for obj in chain(session.dirty, session.deleted)
+        if isinstance(obj, UserModel) and obj.id is not None
+    }
+    if not user_ids:
+        return
+    for user_id in user_ids:
+        user_cache.pop(user_id)
+    # 커밋 전 다른 요청이 이전 값을 다시 캐시했을 수 있으므로 커밋 후 한 번 더 비운다
+    session.info.setdefault(_PENDING_INVALIDATIONS, set()).update(user_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_users_after_commit(session: Session) -> None:
+    for user_id in session.info.pop(_PENDING_INVALIDATIONS, ()):
+        user_cache.pop(user_id)
+
 
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_user_invalidations(session: Session) -> None:
+    session.info.pop(_PENDING_INVALIDATIONS, None)
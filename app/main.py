@@ -3,6 +3,8 @@ from fastapi.openapi.utils import get_openapi
 
 from app.core.config import Settings, get_settings
 from app.presentation.api.v1.router import api_router
+from app.presentation.middleware import CompressionMiddleware, QueryStatsMiddleware
+from app.presentation.responses import FastJSONResponse
 
 
 def custom_openapi(app: FastAPI):
@@ -83,6 +85,8 @@ def custom_openapi(app: FastAPI):
             "limit": 20,
             "total": 100,
             "total_pages": 5,
+            "total_is_estimate": False,
+            "next_cursor": "eyJjcmVhdGVkX2F0IjoiMjAyNS0xMS0yN1QxMDowMDowMCswMDowMCIsImlkIjoxfQ",
         },
     }
 
@@ -100,10 +104,27 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
+        default_response_class=FastJSONResponse,
     )
 
     app.openapi = lambda: custom_openapi(app)  # type: ignore
 
+    if settings.query_stats_enabled:
+        app.add_middleware(
+            QueryStatsMiddleware,
+            n_plus_one_threshold=settings.query_stats_n_plus_one_threshold,
+        )
+    if settings.compression_enabled:
+        # 가장 바깥에서 최종 본문을 압축 (Server-Timing 등 헤더는 그대로 유지)
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            gzip_levels=settings.compression_gzip_levels,
+            brotli_levels=settings.compression_brotli_levels,
+            brotli_quality=settings.compression_brotli_quality,
+            cache_paths=settings.compression_cache_paths,
+        )
+
     app.include_router(api_router, prefix="/api")
 
     @app.get("/health", tags=["Health"])
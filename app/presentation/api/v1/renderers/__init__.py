@@ -0,0 +1,4 @@
+from .material import render_material_list
+from .roadmap import render_roadmap_list
+
+__all__ = ["render_material_list", "render_roadmap_list"]
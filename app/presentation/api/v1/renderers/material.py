@@ -0,0 +1,20 @@
+"""
+Direct JSON rendering for `GET /materials`.
+
+The search use case already returns plain dicts in the `MaterialItem` shape
+(built from column-projection rows or from a cached shared page), so they are
+encoded straight into the `MaterialListResponse` JSON without building and
+validating a Pydantic model per item.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.presentation.responses import dump_json
+
+
+def render_material_list(
+    items: list[dict[str, Any]], pagination: dict[str, Any]
+) -> bytes:
+    return dump_json({"materials": items, "pagination": pagination})
@@ -0,0 +1,106 @@
+"""
+Pre-encoded JSON rendering for `GET /roadmaps`.
+
+The roadmap tree is identical for every user except for the `is_completed`
+flags, so the full `RoadmapListResponse` body is encoded once per tree
+snapshot as a list of byte chunks with a slot for each node's flag. A request
+only splices `true`/`false` into those slots instead of building and
+validating a Pydantic `RoadmapNode` for every node.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from app.infrastructure.repositories.roadmap_repository import (
+    RoadmapNodeData,
+    RoadmapTreeSnapshot,
+)
+
+_TRUE = b"true"
+_FALSE = b"false"
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+class RoadmapJsonTemplate:
+    """RoadmapListResponse 본문을 완료 여부 자리만 비워 둔 채 미리 인코딩한 템플릿"""
+
+    def __init__(self, snapshot: RoadmapTreeSnapshot) -> None:
+        self.snapshot = snapshot
+        children: dict[int, list[RoadmapNodeData]] = {}
+        node_ids = {node.id for node in snapshot.nodes}
+        roots: list[RoadmapNodeData] = []
+        for node in snapshot.nodes:
+            if node.parent_id is None:
+                roots.append(node)
+            elif node.parent_id in node_ids:
+                children.setdefault(node.parent_id, []).append(node)
+
+        self._chunks: list[bytes] = []
+        self._slots: list[int] = []
+        buffer: list[str] = ['{"roadmaps":[']
+
+        def _write(node: RoadmapNodeData) -> None:
+            buffer.append(
+                '{"id":' + _encode(node.id)
+                + ',"category":' + _encode(node.category.value)
+                + ',"name":' + _encode(node.name)
+                + ',"level":' + _encode(node.level)
+                + ',"description":' + _encode(node.description)
+                + ',"parent_id":' + _encode(node.parent_id)
+                + ',"is_completed":'
+            )
+            # 완료 여부 자리: 여기까지를 하나의 chunk로 끊는다
+            self._chunks.append("".join(buffer).encode())
+            self._slots.append(node.id)
+            buffer.clear()
+            buffer.append(',"children":[')
+            for index, child in enumerate(children.get(node.id, [])):
+                if index:
+                    buffer.append(",")
+                _write(child)
+            buffer.append("]}")
+
+        for index, root in enumerate(roots):
+            if index:
+                buffer.append(",")
+            _write(root)
+        buffer.append("]}")
+        self._chunks.append("".join(buffer).encode())
+
+    def render(self, progress_map: dict[int, bool]) -> bytes:
+        parts: list[bytes] = [self._chunks[0]]
+        for node_id, chunk in zip(self._slots, self._chunks[1:]):
+            parts.append(_TRUE if progress_map.get(node_id) else _FALSE)
+            parts.append(chunk)
+        return b"".join(parts)
+
+
+class _TemplateCache:
+    """가장 최근 스냅샷의 템플릿 하나만 보관 (스냅샷 객체가 바뀌면 다시 생성)"""
+
+    def __init__(self) -> None:
+        self.template: RoadmapJsonTemplate | None = None
+
+    def get(self, snapshot: RoadmapTreeSnapshot) -> RoadmapJsonTemplate:
+        template = self.template
+        if template is None or template.snapshot is not snapshot:
+            template = RoadmapJsonTemplate(snapshot)
+            self.template = template
+        return template
+
+    def clear(self) -> None:
+        self.template = None
+
+
+roadmap_template_cache = _TemplateCache()
+
+
+def render_roadmap_list(
+    snapshot: RoadmapTreeSnapshot, progress_map: dict[int, bool]
+) -> bytes:
+    return roadmap_template_cache.get(snapshot).render(progress_map)
@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi.security import OAuth2PasswordRequestForm
 
-from app.core.dependencies import get_auth_service, get_current_user
+from app.core.dependencies import (
+    enforce_login_rate_limit,
+    get_auth_service,
+    get_current_user,
+)
 from app.domain.entities import User
 from app.schemas import RefreshTokenRequest, TokenPair, UserCreate, UserRead
 from app.usecases.auth import AuthService
@@ -18,7 +22,11 @@ async def signup(
     return UserRead.model_validate(user)
 
 
-@router.post("/login", response_model=TokenPair)
+@router.post(
+    "/login",
+    response_model=TokenPair,
+    dependencies=[Depends(enforce_login_rate_limit)],
+)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(get_auth_service),
@@ -35,6 +43,15 @@ async def refresh_tokens(
     return await auth_service.refresh_tokens(payload)
 
 
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    payload: RefreshTokenRequest,
+    auth_service: AuthService = Depends(get_auth_service),
+) -> Response:
+    await auth_service.revoke_tokens(payload)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 @router.get("/me", response_model=UserRead)
 async def read_current_user(current_user: User = Depends(get_current_user)) -> UserRead:
     return UserRead.model_validate(current_user)
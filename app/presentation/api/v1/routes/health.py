@@ -1,6 +1,12 @@
+from typing import Any
+
 from fastapi import APIRouter
 
-from app.usecases.health_check import get_health_payload
+from app.usecases.health_check import (
+    get_auth_health_payload,
+    get_db_health_payload,
+    get_health_payload,
+)
 
 router = APIRouter()
 
@@ -9,3 +15,12 @@ router = APIRouter()
 async def read_health() -> dict[str, str]:
     return await get_health_payload()
 
+
+@router.get("/auth", summary="Authentication worker stats")
+async def read_auth_health() -> dict[str, dict[str, int]]:
+    return await get_auth_health_payload()
+
+
+@router.get("/db", summary="Database connection pool stats")
+async def read_db_health() -> dict[str, Any]:
+    return await get_db_health_payload()
@@ -1,79 +1,118 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.core.dependencies import (
     get_current_user,
     get_material_scrap_usecase,
     get_material_search_usecase,
 )
+from app.core.read_your_writes import mark_write
 from app.domain.entities import User
-from app.schemas import MaterialItem, MaterialListResponse, ScrapResponse
+from app.presentation.api.v1.renderers import render_material_list
+from app.presentation.conditional import (
+    etag_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.schemas import MaterialListResponse, ScrapResponse
 from app.usecases.material import SearchMaterialsUseCase, ToggleMaterialScrapUseCase
 
 router = APIRouter(prefix="/materials", tags=["Materials"])
 
 
-def _material_to_item(material) -> MaterialItem:
-    """Material 엔티티를 MaterialItem 스키마로 변환"""
-    return MaterialItem(
-        id=material.id,
-        title=material.title,
-        url=material.url,
-        difficulty=material.difficulty.value if hasattr(material.difficulty, "value") else material.difficulty,
-        type=material.type.value if hasattr(material.type, "value") else material.type,
-        source=material.source,
-        summary=material.summary,
-        keywords=material.keywords or [],
-        is_scrapped=material.is_scrapped,
-    )
-
-
 @router.get("", response_model=MaterialListResponse)
 async def search_materials(
+    request: Request,
     keyword: str | None = Query(None, description="검색 키워드"),
     difficulty: str | None = Query(None, pattern="^(beginner|intermediate)$"),
     material_type: str | None = Query(
         None, alias="type", pattern="^(document|video)$"
     ),
+    sort: str = Query(
+        "latest",
+        pattern="^(latest|relevance)$",
+        description="정렬 기준 (relevance: 전문 검색 관련도순, keyword 필요)",
+    ),
+    match: str = Query(
+        "contains",
+        pattern="^(contains|fuzzy)$",
+        description="키워드 매칭 방식 (fuzzy: 부분 단어/유사도 매칭, 유사도순 정렬)",
+    ),
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(
+        None,
+        description="이전 응답의 pagination.next_cursor (지정 시 page 대신 keyset 페이지네이션)",
+    ),
+    with_total: bool = Query(
+        True, description="false면 전체 개수(COUNT) 계산을 생략 (total/total_pages=null)"
+    ),
+    estimate_total: bool = Query(
+        False,
+        description="true면 필터가 없는 목록의 전체 개수를 DB 통계 기반 추정치로 반환",
+    ),
     current_user: User = Depends(get_current_user),
     usecase: SearchMaterialsUseCase = Depends(get_material_search_usecase),
-) -> MaterialListResponse:
+) -> Response:
+    if not with_total:
+        total_mode = "none"
+    elif estimate_total:
+        total_mode = "estimated"
+    else:
+        total_mode = "exact"
+
+    # 카탈로그 버전 + 스크랩 상태 + 쿼리 문자열이 같으면 검색/COUNT 없이 304
+    stamp = await usecase.version_stamp(user_id=current_user.id)
+    etag = make_etag("materials", current_user.id, stamp, request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     result = await usecase.execute(
         user_id=current_user.id,
         keyword=keyword,
         difficulty=difficulty,
         resource_type=material_type,
+        sort=sort,
+        match=match,
         page=page,
         limit=limit,
+        cursor=cursor,
+        total_mode=total_mode,
+        stamp=stamp,
     )
-    items = [_material_to_item(m) for m in result["materials"]]
-    return MaterialListResponse(
-        materials=items,
-        pagination=result["pagination"],
+    # MaterialItem 형태의 dict를 응답 JSON으로 바로 인코딩
+    # (response_model은 OpenAPI 문서용, 엔티티/스키마 변환과 응답 검증은 생략됨)
+    return Response(
+        content=render_material_list(result["materials"], result["pagination"]),
+        media_type="application/json",
+        headers=etag_headers(etag),
     )
 
 
 @router.post("/{material_id}/scrap", response_model=ScrapResponse)
 async def scrap_material(
     material_id: int,
+    response: Response,
     current_user: User = Depends(get_current_user),
     usecase: ToggleMaterialScrapUseCase = Depends(get_material_scrap_usecase),
 ) -> ScrapResponse:
     is_scrapped = await usecase.execute(
         user_id=current_user.id, material_id=material_id, scrap=True
     )
+    mark_write(response, current_user.id)
     return ScrapResponse(success=True, is_scrapped=is_scrapped)
 
 
 @router.delete("/{material_id}/scrap", response_model=ScrapResponse)
 async def unscrap_material(
     material_id: int,
+    response: Response,
     current_user: User = Depends(get_current_user),
     usecase: ToggleMaterialScrapUseCase = Depends(get_material_scrap_usecase),
 ) -> ScrapResponse:
     is_scrapped = await usecase.execute(
         user_id=current_user.id, material_id=material_id, scrap=False
     )
+    mark_write(response, current_user.id)
     return ScrapResponse(success=True, is_scrapped=is_scrapped)
 
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.core.dependencies import (
     get_current_user,
     get_progress_overview_usecase,
     get_update_progress_usecase,
 )
+from app.core.read_your_writes import mark_write
 from app.domain.entities import User
+from app.presentation.conditional import (
+    etag_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.presentation.responses import FastJSONResponse
 from app.schemas import (
     ProgressOverviewResponse,
     ProgressUpdateRequest,
@@ -23,6 +31,7 @@ router = APIRouter(prefix="/progress", tags=["Progress"])
 async def update_progress(
     item_id: int,
     payload: ProgressUpdateRequest,
+    response: Response,
     item_type: str = Query(
         "roadmap",
         alias="type",
@@ -38,6 +47,7 @@ async def update_progress(
         completed=payload.completed,
         item_type=item_type,
     )
+    mark_write(response, current_user.id)
     return ProgressUpdateResponse(
         success=True,
         item_id=result.item_id,
@@ -48,6 +58,7 @@ async def update_progress(
 
 @router.get("", response_model=ProgressOverviewResponse)
 async def get_progress_overview(
+    request: Request,
     category: str | None = Query(None, pattern="^(frontend|backend|devops)$"),
     item_type: str | None = Query(
         None,
@@ -57,11 +68,20 @@ async def get_progress_overview(
     ),
     current_user: User = Depends(get_current_user),
     usecase: GetUserProgressUseCase = Depends(get_progress_overview_usecase),
-) -> ProgressOverviewResponse:
+) -> Response:
+    stamp = await usecase.version_stamp(user_id=current_user.id)
+    etag = make_etag("progress", current_user.id, stamp, request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     result = await usecase.execute(
         user_id=current_user.id,
         category=category,
         item_type=item_type,
+        stamp=stamp,
+    )
+    # 생성 시 한 번 검증된 모델을 그대로 직렬화 (response_model 재검증 생략)
+    return FastJSONResponse(
+        ProgressOverviewResponse(**result), headers=etag_headers(etag)
     )
-    return ProgressOverviewResponse(**result)
 
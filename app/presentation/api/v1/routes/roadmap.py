@@ -1,36 +1,42 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.core.dependencies import (
     get_current_user,
     get_roadmap_usecase,
 )
 from app.domain.entities import User
-from app.schemas import RoadmapListResponse, RoadmapNode
+from app.presentation.api.v1.renderers import render_roadmap_list
+from app.presentation.conditional import (
+    etag_headers,
+    etag_matches,
+    make_etag,
+    not_modified,
+)
+from app.schemas import RoadmapListResponse
 from app.usecases.roadmap import GetRoadmapsUseCase
 
 router = APIRouter(prefix="/roadmaps", tags=["Roadmaps"])
 
 
-def _roadmap_to_node(roadmap) -> RoadmapNode:
-    """Roadmap 엔티티를 RoadmapNode 스키마로 변환"""
-    return RoadmapNode(
-        id=roadmap.id,
-        category=roadmap.category.value if hasattr(roadmap.category, "value") else roadmap.category,
-        name=roadmap.name,
-        level=roadmap.level,
-        description=roadmap.description,
-        parent_id=roadmap.parent_id,
-        is_completed=roadmap.is_completed,
-        children=[_roadmap_to_node(child) for child in roadmap.children],
-    )
-
-
 @router.get("", response_model=RoadmapListResponse)
 async def list_roadmaps(
+    request: Request,
     current_user: User = Depends(get_current_user),
     usecase: GetRoadmapsUseCase = Depends(get_roadmap_usecase),
-) -> RoadmapListResponse:
-    roadmaps = await usecase.execute(user_id=current_user.id)
-    nodes = [_roadmap_to_node(rm) for rm in roadmaps]
-    return RoadmapListResponse(roadmaps=nodes)
+) -> Response:
+    # 트리 버전 + 사용자 진도 스탬프가 같으면 본문을 만들지 않고 304
+    stamp = await usecase.version_stamp(user_id=current_user.id)
+    etag = make_etag("roadmaps", current_user.id, stamp)
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
+    # 트리 스냅샷별로 미리 인코딩된 JSON에 사용자 완료 여부만 끼워 넣어 바로 반환
+    # (response_model은 OpenAPI 문서용, 응답 검증/직렬화는 생략됨)
+    snapshot, progress_map = await usecase.load(
+        user_id=current_user.id, tree_version=stamp[0]
+    )
+    return Response(
+        content=render_roadmap_list(snapshot, progress_map),
+        media_type="application/json",
+        headers=etag_headers(etag),
+    )
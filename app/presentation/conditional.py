@@ -0,0 +1,43 @@
+"""
+ETag / If-None-Match helpers for conditional GET.
+
+ETags are weak (`W/"..."`): they are derived from cheap version stamps read
+before the heavy queries, not from the response bytes, so they stay the same
+when only the Content-Encoding or a short-lived cached total differs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+# 클라이언트가 저장은 하되 매번 ETag로 재검증하도록 한다 (사용자별 응답이므로 private)
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 목록 중 하나라도 약한 비교(W/ 무시)로 일치하면 True"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
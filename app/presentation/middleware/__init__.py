@@ -0,0 +1,4 @@
+from .compression import CompressionMiddleware
+from .query_stats import QueryStatsMiddleware
+
+__all__ = ["CompressionMiddleware", "QueryStatsMiddleware"]
@@ -0,0 +1,158 @@
+import gzip
+import hashlib
+from typing import Iterable, Mapping
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+
+_settings = get_settings()
+# (경로, 인코딩, 레벨, 원본 본문 digest) -> 압축된 본문. 내용이 같으면 다시 압축하지 않는다
+compressed_response_cache: TTLCache[tuple[str, str, int, bytes], bytes] = TTLCache(
+    maxsize=_settings.compression_cache_size,
+    ttl=_settings.compression_cache_ttl_seconds,
+)
+
+_SKIP_STATUS = {204, 206, 304}
+# 지원 인코딩 (선호 순)
+_ENCODINGS = ("br", "gzip")
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Accept-Encoding에서 q>0으로 허용된 인코딩 중 가장 선호하는 것을 고른다"""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in _ENCODINGS:
+        quality = accepted.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """gzip/brotli 응답 압축.
+
+    - 본문이 `minimum_size` 바이트 이상이고 Content-Type이 `gzip_levels`에 있는 응답만 압축한다
+      (`text/*`처럼 하위 타입 와일드카드 지정 가능). 값은 타입별 gzip 레벨(1-9)이며,
+      brotli 품질(0-11)은 `brotli_levels`에 없으면 `brotli_quality`를 쓴다.
+    - `cache_paths` 경로의 응답은 본문 digest 기준으로 압축 결과를 캐시한다
+      (/openapi.json, 진행 기록이 없는 사용자의 로드맵 트리처럼 같은 본문이 반복되는 응답).
+    - 이미 Content-Encoding이 있거나 여러 조각으로 스트리밍되는 응답은 그대로 전달한다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_levels: Mapping[str, int] | None = None,
+        brotli_levels: Mapping[str, int] | None = None,
+        brotli_quality: int = 4,
+        cache_paths: Iterable[str] = (),
+        cache: TTLCache[tuple[str, str, int, bytes], bytes] | None = None,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_levels = dict(gzip_levels or {"application/json": 6})
+        self.brotli_levels = dict(brotli_levels or {})
+        self.brotli_quality = brotli_quality
+        self.cache_paths = frozenset(cache_paths)
+        self.cache = compressed_response_cache if cache is None else cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            pending, start = start, None
+            body = message.get("body", b"")
+            level = self._level_for(pending, encoding)
+            if level is not None:
+                MutableHeaders(scope=pending).add_vary_header("Accept-Encoding")
+            if (
+                level is None
+                or message.get("more_body", False)
+                or len(body) < self.minimum_size
+            ):
+                await send(pending)
+                await send(message)
+                return
+
+            compressed = self._compress(path, encoding, level, body)
+            headers = MutableHeaders(scope=pending)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            await send(pending)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _level_for(self, start: Message, encoding: str) -> int | None:
+        """압축 대상이면 인코딩별 레벨, 아니면 None"""
+        if start["status"] in _SKIP_STATUS:
+            return None
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return None
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if not content_type:
+            return None
+        wildcard = content_type.split("/")[0] + "/*"
+        gzip_level = self.gzip_levels.get(content_type, self.gzip_levels.get(wildcard))
+        if gzip_level is None:
+            return None
+        if encoding == "br":
+            return self.brotli_levels.get(
+                content_type, self.brotli_levels.get(wildcard, self.brotli_quality)
+            )
+        return gzip_level
+
+    def _compress(self, path: str, encoding: str, level: int, body: bytes) -> bytes:
+        key = None
+        if path in self.cache_paths:
+            key = (path, encoding, level, hashlib.blake2b(body, digest_size=16).digest())
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if encoding == "br":
+            compressed = brotli.compress(body, quality=level)
+        else:
+            # mtime을 고정해 같은 본문은 항상 같은 바이트로 압축되도록 한다
+            compressed = gzip.compress(body, compresslevel=level, mtime=0)
+
+        if key is not None:
+            self.cache.set(key, compressed)
+        return compressed
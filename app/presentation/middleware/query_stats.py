@@ -0,0 +1,48 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.query_stats import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 실행 수/DB 시간을 Server-Timing 헤더와 로그로 남긴다.
+
+    같은 SQL이 `n_plus_one_threshold`번 이상 실행되면 N+1 의심 경고를 남긴다.
+    응답 헤더 전송 이후(세션 정리 등)에 실행된 문장은 로그에만 포함된다.
+    """
+
+    def __init__(self, app: ASGIApp, n_plus_one_threshold: int = 5) -> None:
+        self.app = app
+        self.n_plus_one_threshold = n_plus_one_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(
+                        "Server-Timing", stats.server_timing()
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        request_line = f"{scope['method']} {scope['path']}"
+        logger.debug(
+            "%s: %d queries in %.2fms", request_line, stats.count, stats.duration * 1000
+        )
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "%s: possible N+1, statement executed %d times: %s",
+                request_line,
+                count,
+                " ".join(statement.split())[:200],
+            )
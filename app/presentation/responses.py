@@ -0,0 +1,28 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+def dump_json(content: Any) -> bytes:
+    """dict/list 등 일반 값을 JSON 바이트로 인코딩 (orjson이 모르는 타입은 pydantic-core)"""
+    try:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return to_json(content, by_alias=True)
+
+
+class FastJSONResponse(JSONResponse):
+    """앱 전체 기본 응답 클래스.
+
+    - 이미 검증된 Pydantic 모델을 그대로 받으면 pydantic-core로 바로 JSON 바이트를
+      만든다 (response_model 재검증과 jsonable_encoder 변환을 거치지 않음).
+    - dict/list 등 일반 값은 orjson으로 인코딩한다.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return dump_json(content)
@@ -20,8 +20,13 @@ class MaterialItem(BaseModel):
 class PaginationMeta(BaseModel):
     page: int
     limit: int
-    total: int
-    total_pages: int
+    # with_total=false로 요청하면 null
+    total: Optional[int] = None
+    total_pages: Optional[int] = None
+    # estimate_total=true 요청에서 통계 기반 추정치가 사용되었는지 여부
+    total_is_estimate: bool = False
+    # keyset 페이지네이션용 다음 페이지 cursor (마지막 페이지/관련도 정렬이면 null)
+    next_cursor: Optional[str] = None
 
 
 class MaterialListResponse(BaseModel):
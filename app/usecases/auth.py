@@ -1,25 +1,57 @@
-from typing import Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Tuple, TypeVar
+from uuid import uuid4
 
 from fastapi import HTTPException, status
 
+from app.core.config import get_settings
+from app.core.password_hasher import (
+    PasswordHasher,
+    PasswordHasherSaturatedError,
+    get_password_hasher,
+)
 from app.core.security import (
     InvalidTokenError,
     create_access_token,
     create_refresh_token,
-    get_password_hash,
     validate_token,
-    verify_password,
 )
-from app.domain.entities import User
+from app.core.token_denylist import AccessTokenDenylist, access_token_denylist
+from app.domain.entities import RefreshToken, User
+from app.domain.repositories import RefreshTokenStore
+from app.infrastructure.repositories.refresh_token_repository import (
+    SqlRefreshTokenStore,
+)
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.schemas import RefreshTokenRequest, TokenPair, UserCreate
 
+T = TypeVar("T")
+
+# auth_trust_token_claims 모드에서 access token에 서명해 담는 사용자 클레임
+TRUSTED_USER_CLAIMS = ("email", "is_active", "is_superuser")
+
 
 class AuthService:
     """Application service orchestrating authentication logic."""
 
-    def __init__(self, repository: UserRepository):
+    def __init__(
+        self,
+        repository: UserRepository,
+        password_hasher: PasswordHasher | None = None,
+        trust_token_claims: bool | None = None,
+        token_store: RefreshTokenStore | None = None,
+        denylist: AccessTokenDenylist | None = None,
+    ):
         self.repository = repository
+        self.password_hasher = password_hasher or get_password_hasher()
+        self.settings = get_settings()
+        self.trust_token_claims = (
+            self.settings.auth_trust_token_claims
+            if trust_token_claims is None
+            else trust_token_claims
+        )
+        self.token_store = token_store or SqlRefreshTokenStore(repository.session)
+        self.denylist = denylist or access_token_denylist
 
     async def register_user(self, payload: UserCreate) -> User:
         existing = await self.repository.get_by_email(payload.email)
@@ -28,7 +60,9 @@ class AuthService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
-        hashed_password = get_password_hash(payload.password)
+        hashed_password = await self._hashing(
+            self.password_hasher.hash(payload.password)
+        )
         user = User(
             email=payload.email,
             hashed_password=hashed_password,
@@ -37,7 +71,9 @@ class AuthService:
 
     async def authenticate(self, email: str, password: str) -> User:
         user = await self.repository.get_by_email(email)
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await self._hashing(
+            self.password_hasher.verify(password, user.hashed_password)
+        ):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
@@ -46,12 +82,39 @@ class AuthService:
         return user
 
     async def create_token_pair(self, user: User) -> TokenPair:
-        access_token, refresh_token = self._generate_tokens(user.id)
+        # 로그인마다 새 refresh token family 시작
+        access_token, refresh_token, record = self._generate_tokens(
+            user, family_id=uuid4().hex
+        )
+        await self.token_store.add(record)
         return TokenPair(access_token=access_token, refresh_token=refresh_token)
 
     async def refresh_tokens(self, payload: RefreshTokenRequest) -> TokenPair:
+        record = await self._get_refresh_record(payload.refresh_token)
+        if record.revoked_at is not None:
+            await self._reject_reuse(record)
+
+        user = await self.repository.get(id=record.user_id)
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+            )
+        access_token, refresh_token, replacement = self._generate_tokens(
+            user, family_id=record.family_id
+        )
+        if not await self.token_store.rotate(record.jti, replacement):
+            # 동시에 같은 refresh token으로 회전한 요청이 있었음
+            await self._reject_reuse(record)
+        return TokenPair(access_token=access_token, refresh_token=refresh_token)
+
+    async def revoke_tokens(self, payload: RefreshTokenRequest) -> None:
+        """로그아웃: refresh token family와 함께 발급된 access token을 모두 폐기."""
+        record = await self._get_refresh_record(payload.refresh_token)
+        await self._revoke_family(record.family_id)
+
+    async def _get_refresh_record(self, refresh_token: str) -> RefreshToken:
         try:
-            token_payload = validate_token(payload.refresh_token, expected_type="refresh")
+            token_payload = validate_token(refresh_token, expected_type="refresh")
         except InvalidTokenError as exc:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,18 +122,50 @@ class AuthService:
             ) from exc
 
         user_id = token_payload.get("sub")
-        if user_id is None:
+        jti = token_payload.get("jti")
+        if user_id is None or jti is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid refresh token payload",
             )
-        user = await self.repository.get(id=int(user_id))
-        if not user:
+        record = await self.token_store.get(jti)
+        if record is None and "fam" not in token_payload:
+            record = await self._adopt_legacy_token(token_payload)
+        if record is None or record.user_id != int(user_id):
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Unknown refresh token",
             )
-        token_pair = self._generate_tokens(user.id)
-        return TokenPair(access_token=token_pair[0], refresh_token=token_pair[1])
+        return record
+
+    async def _adopt_legacy_token(self, token_payload: dict[str, Any]) -> RefreshToken:
+        """refresh_tokens 도입 전에 발급된 토큰(`fam` 클레임 없음)을 새 family로 등록.
+
+        등록된 기록은 일반 토큰과 같이 회전되므로 레거시 토큰은 한 번만 쓸 수 있다.
+        함께 발급됐던 access token의 jti는 알 수 없어 폐기 대상에서 제외된다.
+        """
+        now = datetime.now(timezone.utc)
+        record = RefreshToken(
+            jti=token_payload["jti"],
+            family_id=uuid4().hex,
+            user_id=int(token_payload["sub"]),
+            access_jti=uuid4().hex,
+            access_expires_at=now,
+            expires_at=datetime.fromtimestamp(token_payload["exp"], timezone.utc),
+        )
+        return await self.token_store.get_or_add(record)
+
+    async def _reject_reuse(self, record: RefreshToken) -> None:
+        # 이미 회전된 토큰의 재사용은 탈취로 간주하고 family 전체를 폐기
+        await self._revoke_family(record.family_id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected",
+        )
+
+    async def _revoke_family(self, family_id: str) -> None:
+        for token in await self.token_store.revoke_family(family_id):
+            self.denylist.add(token.access_jti)
 
     async def get_current_user(self, token: str) -> User:
         try:
@@ -87,15 +182,78 @@ class AuthService:
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid token payload",
             )
-        user = await self.repository.get(id=int(user_id))
+        jti = payload.get("jti")
+        if jti and await self.denylist.is_revoked(jti, self.token_store):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        user = self._user_from_claims(payload)
+        if user is None:
+            user = await self.repository.get_by_id(int(user_id))
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Inactive user"
+            )
         return user
 
-    def _generate_tokens(self, user_id: int) -> Tuple[str, str]:
-        access_token = create_access_token(str(user_id))
-        refresh_token = create_refresh_token(str(user_id))
-        return access_token, refresh_token
+    def _user_from_claims(self, payload: dict[str, Any]) -> User | None:
+        """서명된 클레임만으로 사용자 구성 (신뢰 모드가 아니거나 클레임이 없으면 None).
+
+        토큰 수명 동안 권한/비활성화 변경이 반영되지 않으며, 비밀번호 해시와
+        생성/수정 시각은 채워지지 않는다.
+        """
+        if not self.trust_token_claims:
+            return None
+        if any(claim not in payload for claim in TRUSTED_USER_CLAIMS):
+            return None
+        return User(
+            id=int(payload["sub"]),
+            email=payload["email"],
+            hashed_password="",
+            is_active=payload["is_active"],
+            is_superuser=payload["is_superuser"],
+        )
+
+    async def _hashing(self, operation: Awaitable[T]) -> T:
+        try:
+            return await operation
+        except PasswordHasherSaturatedError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication is temporarily overloaded, please retry",
+                headers={"Retry-After": "1"},
+            ) from exc
+
+    def _generate_tokens(
+        self, user: User, family_id: str
+    ) -> Tuple[str, str, RefreshToken]:
+        claims = (
+            {claim: getattr(user, claim) for claim in TRUSTED_USER_CLAIMS}
+            if self.trust_token_claims
+            else None
+        )
+        now = datetime.now(timezone.utc)
+        record = RefreshToken(
+            jti=uuid4().hex,
+            family_id=family_id,
+            user_id=user.id,
+            access_jti=uuid4().hex,
+            access_expires_at=now
+            + timedelta(minutes=self.settings.access_token_expire_minutes),
+            expires_at=now
+            + timedelta(minutes=self.settings.refresh_token_expire_minutes),
+        )
+        access_token = create_access_token(
+            str(user.id), claims=claims, jti=record.access_jti
+        )
+        refresh_token = create_refresh_token(
+            str(user.id), jti=record.jti, family_id=family_id
+        )
+        return access_token, refresh_token, record
 
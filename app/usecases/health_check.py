@@ -1,6 +1,27 @@
 from datetime import datetime, timezone
+from typing import Any
+
+from app.core.database import engine, get_pool_status, read_engine
+from app.core.password_hasher import get_password_hasher
+from app.core.rate_limit import get_login_rate_limiter
 
 
 async def get_health_payload() -> dict[str, str]:
     return {"status": "ok", "timestamp": datetime.now(timezone.utc).isoformat()}
 
+
+async def get_auth_health_payload() -> dict[str, dict[str, int]]:
+    return {
+        "password_hasher": get_password_hasher().stats(),
+        "login_rate_limiter": get_login_rate_limiter().stats(),
+    }
+
+
+async def get_db_health_payload() -> dict[str, Any]:
+    payload: dict[str, Any] = {
+        "dialect": engine.dialect.name,
+        "pool": get_pool_status(engine),
+    }
+    if read_engine is not None:
+        payload["read_pool"] = get_pool_status(read_engine)
+    return payload
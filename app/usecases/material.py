@@ -1,20 +1,100 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from math import ceil
-from typing import Optional
+from typing import Any, Optional
 
 from fastapi import HTTPException, status
+from pydantic_core import from_json, to_json
 
-from app.domain.entities import MaterialDifficulty, MaterialType
+from app.core.response_cache import SHARED_SCOPE, ResponseCache
+from app.domain.entities import (
+    MaterialDifficulty,
+    MaterialMatch,
+    MaterialSort,
+    MaterialTotalMode,
+    MaterialType,
+)
 from app.infrastructure.repositories.material_repository import (
+    CursorNotSupportedError,
+    MaterialListRow,
     MaterialRepository,
     MaterialScrapRepository,
 )
 
 
+def encode_cursor(after: tuple[datetime, int]) -> str:
+    """마지막 행의 (created_at, id)를 불투명한 cursor 문자열로 인코딩"""
+    created_at, material_id = after
+    payload = json.dumps(
+        {"created_at": created_at.isoformat(), "id": material_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["created_at"]), int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 cursor 값입니다.",
+        ) from exc
+
+
+def _orders_by_relevance(
+    keyword: Optional[str], sort: MaterialSort, match: MaterialMatch
+) -> bool:
+    """키워드가 있고 관련도/유사도순으로 정렬되는 검색인지 (keyset cursor 사용 불가)"""
+    if not keyword or not keyword.strip():
+        return False
+    return sort == MaterialSort.RELEVANCE or match == MaterialMatch.FUZZY
+
+
+def _cursor_not_supported() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="cursor는 최신순 정렬에서만 사용할 수 있습니다.",
+    )
+
+
+def material_item(row: MaterialListRow, *, is_scrapped: bool) -> dict[str, Any]:
+    """검색 결과 행을 MaterialItem 형태의 dict로 변환 (Enum은 인코더가 값으로 직렬화)"""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "url": row.url,
+        "difficulty": row.difficulty,
+        "type": row.type,
+        "source": row.source,
+        "summary": row.summary,
+        "keywords": row.keywords or [],
+        "is_scrapped": is_scrapped,
+    }
+
+
 class SearchMaterialsUseCase:
-    def __init__(self, repository: MaterialRepository) -> None:
+    """자료 검색.
+
+    응답 캐시가 있으면 사용자와 무관한 페이지(스크랩 여부 제외)를 카탈로그 버전별로 한 번만
+    만들어 공유하고, 사용자별로는 그 페이지의 자료 id 중 스크랩한 것만 조회해 `is_scrapped`를 덮어쓴다.
+    """
+
+    def __init__(
+        self, repository: MaterialRepository, cache: ResponseCache | None = None
+    ) -> None:
         self.repository = repository
+        self.cache = cache
+
+    async def version_stamp(self, *, user_id: int) -> tuple[int, int]:
+        """(자료 카탈로그 버전, 사용자 스크랩 버전) 스탬프"""
+        return await self.repository.get_version_stamp(user_id)
 
     async def execute(
         self,
@@ -23,29 +103,92 @@ class SearchMaterialsUseCase:
         keyword: Optional[str] = None,
         difficulty: Optional[str] = None,
         resource_type: Optional[str] = None,
+        sort: str = MaterialSort.LATEST.value,
+        match: str = MaterialMatch.CONTAINS.value,
         page: int = 1,
         limit: int = 20,
+        cursor: Optional[str] = None,
+        total_mode: str = MaterialTotalMode.EXACT.value,
+        stamp: Optional[tuple] = None,
     ) -> dict:
-        difficulty_enum = (
-            MaterialDifficulty(difficulty) if difficulty else None
-        )
-        type_enum = MaterialType(resource_type) if resource_type else None
-        materials, total = await self.repository.search(
-            keyword=keyword,
-            difficulty=difficulty_enum,
-            type_=type_enum,
-            page=page,
-            limit=limit,
-            user_id=user_id,
+        if cursor and _orders_by_relevance(keyword, MaterialSort(sort), MaterialMatch(match)):
+            raise _cursor_not_supported()
+        query = {
+            "keyword": keyword,
+            "difficulty": MaterialDifficulty(difficulty) if difficulty else None,
+            "type_": MaterialType(resource_type) if resource_type else None,
+            "sort": MaterialSort(sort),
+            "match": MaterialMatch(match),
+            "page": page,
+            "limit": limit,
+            "after": decode_cursor(cursor) if cursor else None,
+            "total_mode": MaterialTotalMode(total_mode),
+        }
+        if self.cache is None:
+            return await self._load_page(
+                query,
+                user_id=user_id,
+                catalogue_version=stamp[0] if stamp is not None else None,
+            )
+
+        # 카탈로그 버전을 키에 포함해, 워커별 캐시여도 다른 워커의 쓰기 이후 값을 재사용하지 않는다
+        if stamp is None:
+            stamp = await self.version_stamp(user_id=user_id)
+        catalogue_version, scrap_version = stamp
+
+        page_key = await self.cache.key(
+            SHARED_SCOPE, "materials", catalogue_version, sorted(query.items())
         )
-        total_pages = ceil(total / limit) if limit else 1
+        cached = await self.cache.get(page_key)
+        if cached is not None:
+            result = from_json(cached)
+        else:
+            result = await self._load_page(
+                query, user_id=None, catalogue_version=catalogue_version
+            )
+            await self.cache.set(page_key, to_json(result))
+
+        # 스크랩 버전이 0이면 스크랩한 적이 없으므로 조회 생략
+        scrapped: set[int] = set()
+        if scrap_version:
+            scrapped = await self.repository.get_scrapped_ids(
+                user_id, [item["id"] for item in result["materials"]]
+            )
+        for item in result["materials"]:
+            item["is_scrapped"] = item["id"] in scrapped
+        return result
+
+    async def _load_page(
+        self,
+        query: dict[str, Any],
+        *,
+        user_id: int | None,
+        catalogue_version: int | None,
+    ) -> dict:
+        try:
+            result = await self.repository.search(
+                **query, user_id=user_id, catalogue_version=catalogue_version
+            )
+        except CursorNotSupportedError as exc:
+            raise _cursor_not_supported() from exc
+
+        limit = query["limit"]
+        total_pages = None
+        if result.total is not None:
+            total_pages = ceil(result.total / limit) if limit else 1
+        next_cursor = encode_cursor(result.next_after) if result.next_after else None
         return {
-            "materials": materials,
+            "materials": [
+                material_item(row, is_scrapped=bool(row.is_scrapped))
+                for row in result.materials
+            ],
             "pagination": {
-                "page": page,
+                "page": query["page"],
                 "limit": limit,
-                "total": total,
+                "total": result.total,
                 "total_pages": total_pages,
+                "total_is_estimate": result.total_is_estimate,
+                "next_cursor": next_cursor,
             },
         }
 
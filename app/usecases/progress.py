@@ -3,7 +3,9 @@ from __future__ import annotations
 from typing import Optional
 
 from fastapi import HTTPException, status
+from pydantic_core import from_json, to_json
 
+from app.core.response_cache import ResponseCache, user_scope
 from app.domain.entities import ItemType, RoadmapCategory, UserProgress
 from app.infrastructure.repositories.material_repository import MaterialRepository
 from app.infrastructure.repositories.progress_repository import UserProgressRepository
@@ -16,10 +18,12 @@ class UpdateProgressUseCase:
         roadmap_repository: RoadmapRepository,
         material_repository: MaterialRepository,
         progress_repository: UserProgressRepository,
+        cache: ResponseCache | None = None,
     ) -> None:
         self.roadmap_repository = roadmap_repository
         self.material_repository = material_repository
         self.progress_repository = progress_repository
+        self.cache = cache
 
     async def execute(
         self,
@@ -44,17 +48,29 @@ class UpdateProgressUseCase:
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail="자료를 찾을 수 없습니다.",
                 )
-        return await self.progress_repository.upsert_progress(
+        progress = await self.progress_repository.upsert_progress(
             user_id=user_id,
             item_id=item_id,
             completed=completed,
             item_type=item_type_enum,
         )
+        if self.cache is not None:
+            await self.cache.invalidate(user_scope(user_id))
+        return progress
 
 
 class GetUserProgressUseCase:
-    def __init__(self, progress_repository: UserProgressRepository) -> None:
+    def __init__(
+        self,
+        progress_repository: UserProgressRepository,
+        cache: ResponseCache | None = None,
+    ) -> None:
         self.progress_repository = progress_repository
+        self.cache = cache
+
+    async def version_stamp(self, *, user_id: int) -> tuple:
+        """진도 목록/통계가 바뀌면 달라지는 스탬프 (로드맵·자료 버전 + 사용자 진도 상태)"""
+        return await self.progress_repository.get_version_stamp(user_id)
 
     async def execute(
         self,
@@ -62,6 +78,26 @@ class GetUserProgressUseCase:
         user_id: int,
         category: Optional[str] = None,
         item_type: Optional[str] = None,
+        stamp: Optional[tuple] = None,
+    ) -> dict:
+        if self.cache is None:
+            return await self._load(user_id, category, item_type)
+
+        # 사용자별 캐시. 스탬프가 키에 포함되므로 다른 워커의 쓰기도 반영된다
+        if stamp is None:
+            stamp = await self.version_stamp(user_id=user_id)
+        key = await self.cache.key(
+            user_scope(user_id), "progress", stamp, category, item_type
+        )
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return from_json(cached)
+        result = await self._load(user_id, category, item_type)
+        await self.cache.set(key, to_json(result))
+        return result
+
+    async def _load(
+        self, user_id: int, category: Optional[str], item_type: Optional[str]
     ) -> dict:
         category_enum = RoadmapCategory(category) if category else None
         item_type_enum = ItemType(item_type) if item_type else None
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import List
-
-from app.domain.entities import Roadmap, RoadmapCategory
-from app.infrastructure.db.models import RoadmapModel
+from app.domain.entities import ItemType
 from app.infrastructure.repositories.progress_repository import (
     UserProgressRepository,
 )
-from app.infrastructure.repositories.roadmap_repository import RoadmapRepository
+from app.infrastructure.repositories.roadmap_repository import (
+    RoadmapRepository,
+    RoadmapTreeSnapshot,
+)
 
 
 class GetRoadmapsUseCase:
@@ -21,41 +21,16 @@ class GetRoadmapsUseCase:
         self.roadmap_repository = roadmap_repository
         self.progress_repository = progress_repository
 
-    async def execute(self, *, user_id: int) -> List[Roadmap]:
-        models = await self.roadmap_repository.list_all()
-        progress_map = await self.progress_repository.get_progress_map(user_id)
-
-        node_map: dict[int, Roadmap] = {}
-        for model in models:
-            node_map[model.id] = self._to_entity(
-                model, is_completed=progress_map.get(model.id, False)
-            )
-
-        roots: list[Roadmap] = []
-        for model in models:
-            node = node_map[model.id]
-            if model.parent_id is None:
-                roots.append(node)
-            else:
-                parent = node_map.get(model.parent_id)
-                if parent:
-                    parent.children.append(node)
-        return roots
-
-    def _to_entity(self, model: RoadmapModel, *, is_completed: bool) -> Roadmap:
-        category_value = (
-            model.category.value if hasattr(model.category, "value") else model.category
-        )
-        return Roadmap(
-            id=model.id,
-            category=RoadmapCategory(category_value),
-            name=model.name,
-            level=model.level,
-            description=model.description,
-            parent_id=model.parent_id,
-            is_completed=is_completed,
-            children=[],
-            created_at=model.created_at,
-            updated_at=model.updated_at,
+    async def version_stamp(self, *, user_id: int) -> tuple:
+        """트리 버전과 사용자 로드맵 진도 상태 스탬프 (첫 값이 트리 버전)"""
+        return await self.progress_repository.get_version_stamp(
+            user_id, item_type=ItemType.ROADMAP
         )
 
+    async def load(
+        self, *, user_id: int, tree_version: int | None = None
+    ) -> tuple[RoadmapTreeSnapshot, dict[int, bool]]:
+        """캐시된 트리 스냅샷과 사용자별 완료 여부(roadmap_id -> completed)를 반환"""
+        snapshot = await self.roadmap_repository.get_tree(tree_version)
+        progress_map = await self.progress_repository.get_progress_map(user_id)
+        return snapshot, progress_map
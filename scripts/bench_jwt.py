@@ -0,0 +1,65 @@
+"""
+Benchmark access-token validation.
+
+Compares a full decode with each available JWT backend (python-jose, PyJWT if
+installed) against `validate_token` served from the verified-token cache.
+
+Usage:
+    python scripts/bench_jwt.py [--iterations 20000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+from app.core import security  # noqa: E402
+from app.core.config import get_settings  # noqa: E402
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    per_call_us = seconds / iterations * 1_000_000
+    print(f"{label:<28} {per_call_us:8.2f} us/op  {iterations / seconds:10.0f} ops/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    token = security.create_access_token("1")
+    print(f"algorithm={settings.algorithm} iterations={args.iterations}")
+
+    for name, backend_cls in security.JWT_BACKENDS.items():
+        try:
+            backend = backend_cls()
+        except ImportError:
+            print(f"{'decode (' + name + ')':<28} skipped (not installed)")
+            continue
+        seconds = timeit.timeit(
+            lambda: backend.decode(
+                token, settings.secret_key, algorithms=[settings.algorithm]
+            ),
+            number=args.iterations,
+        )
+        _report(f"decode ({name})", seconds, args.iterations)
+
+    security.verified_token_cache.clear()
+    security.validate_token(token)
+    seconds = timeit.timeit(
+        lambda: security.validate_token(token), number=args.iterations
+    )
+    _report("validate_token (cached)", seconds, args.iterations)
+
+
+if __name__ == "__main__":
+    main()
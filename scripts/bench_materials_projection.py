@@ -0,0 +1,173 @@
+"""
+Benchmark for the material list serialization path.
+
+Seeds an in-memory SQLite database with a synthetic catalogue and renders a
+single page containing every row through two paths:
+
+* entity/schema -- ORM MaterialModel -> domain Material -> MaterialItem ->
+                   MaterialListResponse -> JSON (previous route behaviour)
+* projection    -- MaterialRepository.search column rows -> item dicts -> JSON
+                   (material_item + render_material_list, current route behaviour)
+
+Reports wall time and the tracemalloc peak (allocations made while loading
+and encoding the page) for each path.
+
+Usage:
+    python scripts/bench_materials_projection.py [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+from sqlalchemy import false, select  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.domain.entities import (  # noqa: E402
+    Material,
+    MaterialDifficulty,
+    MaterialTotalMode,
+    MaterialType,
+)
+from app.infrastructure.db.models import MaterialModel  # noqa: E402
+from app.infrastructure.repositories.material_repository import MaterialRepository  # noqa: E402
+from app.presentation.api.v1.renderers import render_material_list  # noqa: E402
+from app.presentation.responses import FastJSONResponse  # noqa: E402
+from app.schemas import MaterialItem, MaterialListResponse  # noqa: E402
+from app.usecases.material import material_item  # noqa: E402
+
+
+async def _seed(session, rows: int) -> None:
+    session.add_all(
+        MaterialModel(
+            title=f"Material {i}",
+            url=f"https://example.com/materials/{i}",
+            difficulty=MaterialDifficulty.BEGINNER if i % 2 else MaterialDifficulty.INTERMEDIATE,
+            type=MaterialType.DOCUMENT if i % 3 else MaterialType.VIDEO,
+            source="Stacknori",
+            summary=f"Synthetic material number {i} for the projection benchmark",
+            keywords=["python", "backend", f"topic-{i % 50}"],
+        )
+        for i in range(rows)
+    )
+    await session.commit()
+
+
+def _pagination(rows: int) -> dict:
+    return {
+        "page": 1,
+        "limit": rows,
+        "total": None,
+        "total_pages": None,
+        "total_is_estimate": False,
+        "next_cursor": None,
+    }
+
+
+async def entity_schema_path(session, rows: int) -> bytes:
+    stmt = (
+        select(MaterialModel, false().label("is_scrapped"))
+        .order_by(MaterialModel.created_at.desc(), MaterialModel.id.desc())
+        .limit(rows + 1)
+    )
+    result = list(await session.execute(stmt))[:rows]
+    materials = [
+        Material(
+            id=model.id,
+            title=model.title,
+            url=model.url,
+            difficulty=MaterialDifficulty(model.difficulty),
+            type=MaterialType(model.type),
+            source=model.source,
+            summary=model.summary,
+            keywords=list(model.keywords or []),
+            is_scrapped=bool(scrapped),
+            created_at=model.created_at,
+            updated_at=model.updated_at,
+        )
+        for model, scrapped in result
+    ]
+    items = [
+        MaterialItem(
+            id=m.id,
+            title=m.title,
+            url=m.url,
+            difficulty=m.difficulty.value,
+            type=m.type.value,
+            source=m.source,
+            summary=m.summary,
+            keywords=m.keywords,
+            is_scrapped=m.is_scrapped,
+        )
+        for m in materials
+    ]
+    body = MaterialListResponse(materials=items, pagination=_pagination(rows))
+    # 매 실행마다 identity map을 비워 두 경로의 조건을 맞춘다
+    session.expunge_all()
+    return FastJSONResponse(body).body
+
+
+async def projection_path(session, rows: int) -> bytes:
+    result = await MaterialRepository(session).search(
+        limit=rows, total_mode=MaterialTotalMode.NONE
+    )
+    items = [
+        material_item(row, is_scrapped=bool(row.is_scrapped)) for row in result.materials
+    ]
+    return render_material_list(items, _pagination(rows))
+
+
+async def _measure(path, session, rows: int, repeat: int) -> tuple[float, float, int]:
+    body = await path(session, rows)
+    timings = []
+    peaks = []
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        await path(session, rows)
+        timings.append(time.perf_counter() - start)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return min(timings) * 1000, min(peaks) / 1024 / 1024, len(body)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, expire_on_commit=False)()
+    await _seed(session, args.rows)
+    session.expunge_all()
+
+    print(f"rows={args.rows} repeat={args.repeat} (best of)")
+    print(f"{'path':<16} {'time ms':>10} {'peak MiB':>10} {'body bytes':>12}")
+    for label, path in (
+        ("entity/schema", entity_schema_path),
+        ("projection", projection_path),
+    ):
+        elapsed, peak, size = await _measure(path, session, args.rows, args.repeat)
+        print(f"{label:<16} {elapsed:>10.1f} {peak:>10.2f} {size:>12}")
+
+    await session.close()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""
+Micro-benchmark for per-query CPU spent building/compiling hot statements.
+
+Runs each hot repository query against an in-memory SQLite database in three
+modes and reports CPU time per call (time.process_time):
+
+* no compiled cache         -- select() rebuilt per call, query_cache_size=0
+* rebuilt, compiled cache   -- select() rebuilt per call, default cache
+* prebuilt, compiled cache  -- module-level statement with bound parameters
+
+Material search always starts from the prebuilt base SELECT and appends
+per-request filters, so it only has the cache/no-cache comparison.
+
+SQLite execution cost is included and identical across modes, so the
+difference between rows is the statement construction/compilation overhead.
+
+Usage:
+    python scripts/bench_queries.py [--iterations 2000]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "bench-secret-key")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.database import Base  # noqa: E402
+from app.domain.entities import ItemType, MaterialDifficulty, MaterialType  # noqa: E402
+from app.infrastructure.db.models import (  # noqa: E402
+    MaterialModel,
+    RoadmapModel,
+    UserModel,
+    UserProgressModel,
+)
+from app.infrastructure.db.models.roadmap import RoadmapCategory  # noqa: E402
+from app.infrastructure.repositories import progress_repository, user_repository  # noqa: E402
+from app.infrastructure.repositories.material_repository import (  # noqa: E402
+    MaterialRepository,
+    material_count_cache,
+)
+
+
+async def _seed(session) -> int:
+    user = UserModel(email="bench@example.com", hashed_password="x")
+    session.add(user)
+    session.add_all(
+        RoadmapModel(category=RoadmapCategory.BACKEND, name=f"Roadmap {i}", level=1)
+        for i in range(50)
+    )
+    session.add_all(
+        MaterialModel(
+            title=f"Material {i}",
+            url=f"https://example.com/{i}",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+            keywords=["python"],
+        )
+        for i in range(200)
+    )
+    await session.flush()
+    session.add_all(
+        UserProgressModel(
+            user_id=user.id,
+            roadmap_id=roadmap_id,
+            item_type=ItemType.ROADMAP,
+            is_completed=True,
+        )
+        for roadmap_id in range(1, 21)
+    )
+    await session.commit()
+    return user.id
+
+
+def _queries(session, user_id: int):
+    async def user_rebuilt():
+        stmt = select(UserModel).where(UserModel.id == user_id).limit(1)
+        (await session.execute(stmt)).scalar_one_or_none()
+
+    async def user_prebuilt():
+        await session.execute(user_repository._USER_BY_ID, {"user_id": user_id})
+
+    async def statistics_rebuilt():
+        stmt = progress_repository._statistics_statement.__wrapped__(True, True, False)
+        (await session.execute(stmt, {"user_id": user_id})).one()
+
+    async def statistics_prebuilt():
+        stmt = progress_repository._statistics_statement(True, True, False)
+        (await session.execute(stmt, {"user_id": user_id})).one()
+
+    async def material_search():
+        material_count_cache.clear()
+        await MaterialRepository(session).search(keyword="material", user_id=user_id)
+
+    return {
+        "user by id": (user_rebuilt, user_prebuilt),
+        "progress statistics": (statistics_rebuilt, statistics_prebuilt),
+        "material search": (None, material_search),
+    }
+
+
+async def _cpu_per_call(query, iterations: int) -> float:
+    for _ in range(min(50, iterations)):
+        await query()
+    start = time.process_time()
+    for _ in range(iterations):
+        await query()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    engines = {
+        "no_cache": create_async_engine("sqlite+aiosqlite:///:memory:", query_cache_size=0),
+        "cache": create_async_engine("sqlite+aiosqlite:///:memory:"),
+    }
+    sessions = {}
+    for name, engine in engines.items():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session = async_sessionmaker(engine, expire_on_commit=False)()
+        sessions[name] = (session, await _seed(session))
+
+    print(f"iterations={args.iterations} (CPU us per call)")
+    print(f"{'query':<22} {'no cache':>10} {'rebuilt/cache':>14} {'prebuilt/cache':>15}")
+    no_cache = _queries(*sessions["no_cache"])
+    cached = _queries(*sessions["cache"])
+    for label, (rebuilt, prebuilt) in cached.items():
+        uncached_query = no_cache[label][0] or no_cache[label][1]
+        timings = [
+            await _cpu_per_call(uncached_query, args.iterations),
+            await _cpu_per_call(rebuilt, args.iterations) if rebuilt else None,
+            await _cpu_per_call(prebuilt, args.iterations),
+        ]
+        cells = [f"{t:.1f}" if t is not None else "-" for t in timings]
+        print(f"{label:<22} {cells[0]:>10} {cells[1]:>14} {cells[2]:>15}")
+
+    for session, _ in sessions.values():
+        await session.close()
+    for engine in engines.values():
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
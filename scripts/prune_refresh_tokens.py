@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Delete refresh token records whose expires_at has passed.
+
+Usage:
+    python scripts/prune_refresh_tokens.py
+
+Environment variables (optional):
+    DATABASE_URL - overrides the default settings.database_url
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+# Ensure project root on sys.path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from app.core.config import get_settings
+from app.infrastructure.repositories.refresh_token_repository import (
+    SqlRefreshTokenStore,
+)
+
+
+async def main() -> None:
+    settings = get_settings()
+    database_url = os.getenv("DATABASE_URL", settings.database_url)
+    engine = create_async_engine(database_url, echo=False)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with async_session() as session:
+        deleted = await SqlRefreshTokenStore(session).delete_expired(
+            datetime.now(timezone.utc)
+        )
+        print(f"🧹 Deleted {deleted} expired refresh token records.")
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
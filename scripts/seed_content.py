@@ -26,6 +26,7 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
 from app.core.config import get_settings
+from app.core.response_cache import SHARED_SCOPE, get_response_cache
 from app.domain.entities.roadmap import RoadmapCategory
 from app.domain.entities.material import MaterialDifficulty, MaterialType
 from app.infrastructure.db.models import (
@@ -252,6 +253,13 @@ async def main() -> None:
         await seed_materials(session)
         print("✨ Seeding completed.")
 
+    # 공유 응답 캐시(RESPONSE_CACHE_BACKEND=redis)의 자료 페이지를 즉시 무효화
+    # (워커별 메모리 캐시는 DB cache_versions 변경으로 다음 요청에서 갱신됨)
+    cache = get_response_cache()
+    if cache is not None:
+        await cache.invalidate(SHARED_SCOPE)
+        await cache.backend.close()
+
     await engine.dispose()
 
 
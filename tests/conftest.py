@@ -1,4 +1,5 @@
 import os
+from contextlib import contextmanager
 
 import pytest
 import pytest_asyncio
@@ -11,6 +12,7 @@ os.environ.setdefault("SECRET_KEY", "test-secret-key")
 os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "60")
 os.environ.setdefault("REFRESH_TOKEN_EXPIRE_MINUTES", f"{60 * 24 * 14}")
 os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("QUERY_STATS_ENABLED", "true")
 
 from app.core.config import Settings
 from app.core.database import Base
@@ -38,6 +40,65 @@ def test_settings() -> Settings:
     )
 
 
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """프로세스 단위 캐시가 테스트 간(서로 다른 DB) 공유되지 않도록 초기화"""
+    from app.core.rate_limit import get_login_rate_limiter
+    from app.core.read_your_writes import recent_writers
+    from app.core.response_cache import get_response_cache
+    from app.core.security import verified_token_cache
+    from app.core.token_denylist import access_token_denylist
+    from app.infrastructure.repositories.material_repository import (
+        material_count_cache,
+    )
+    from app.infrastructure.repositories.roadmap_repository import (
+        roadmap_tree_cache,
+    )
+    from app.infrastructure.repositories.user_repository import user_cache
+    from app.presentation.api.v1.renderers.roadmap import roadmap_template_cache
+    from app.presentation.middleware.compression import compressed_response_cache
+
+    # 로그인 시도 제한/응답 캐시 상태는 테스트마다 새로 시작
+    get_login_rate_limiter.cache_clear()
+    get_response_cache.cache_clear()
+    caches = [
+        material_count_cache,
+        roadmap_tree_cache,
+        roadmap_template_cache,
+        user_cache,
+        verified_token_cache,
+        access_token_denylist,
+        recent_writers,
+        compressed_response_cache,
+    ]
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
+@pytest.fixture
+def query_budget():
+    """`with query_budget(n):` 블록에서 실행된 SQL 문이 n개를 넘으면 테스트 실패"""
+    from app.core.query_stats import track_queries
+
+    @contextmanager
+    def _budget(max_queries: int):
+        with track_queries() as stats:
+            yield stats
+        if stats.count > max_queries:
+            executed = "\n".join(
+                f"  {count}x {' '.join(statement.split())[:160]}"
+                for statement, count in stats.statements.most_common()
+            )
+            pytest.fail(
+                f"{stats.count} queries executed, budget is {max_queries}:\n{executed}"
+            )
+
+    return _budget
+
+
 @pytest_asyncio.fixture
 async def test_db_session(test_settings: Settings):
     """테스트용 DB 세션 (트랜잭션 롤백)"""
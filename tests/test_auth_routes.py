@@ -196,3 +196,103 @@ async def test_get_current_user_invalid_token(test_client: AsyncClient):
     
     assert response.status_code == 401
 
+
+
+async def _login(test_client: AsyncClient) -> dict:
+    response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_reuse_revokes_family(test_client: AsyncClient, sample_user):
+    """회전된 리프레시 토큰 재사용 시 family 전체가 폐기되는지 테스트"""
+    tokens = await _login(test_client)
+
+    rotated = await test_client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert rotated.status_code == 200
+
+    reused = await test_client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert reused.status_code == 401
+    assert "reuse" in reused.json()["detail"].lower()
+
+    # 회전으로 받은 최신 토큰과 기존 access token도 함께 무효화
+    latest = await test_client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": rotated.json()["refresh_token"]},
+    )
+    assert latest.status_code == 401
+    for access_token in (tokens["access_token"], rotated.json()["access_token"]):
+        me = await test_client.get(
+            "/api/v1/auth/me",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        assert me.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_logout_revokes_tokens(test_client: AsyncClient, sample_user):
+    """로그아웃 후 access/refresh 토큰이 거부되는지 테스트"""
+    tokens = await _login(test_client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert (await test_client.get("/api/v1/auth/me", headers=headers)).status_code == 200
+
+    response = await test_client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == 204
+
+    me = await test_client.get("/api/v1/auth/me", headers=headers)
+    assert me.status_code == 401
+    assert me.json()["detail"] == "Token has been revoked"
+    refreshed = await test_client.post(
+        "/api/v1/auth/refresh",
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert refreshed.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_login_rate_limited_per_email(test_client: AsyncClient, sample_user):
+    """같은 이메일로 연속 로그인 실패 시 bcrypt 전에 429로 거절되는지 테스트"""
+    from app.core.rate_limit import get_login_rate_limiter
+
+    burst = get_login_rate_limiter().email_rule.capacity
+    for _ in range(burst):
+        response = await test_client.post(
+            "/api/v1/auth/login",
+            data={"username": "test@example.com", "password": "wrongpassword"},
+        )
+        assert response.status_code == 401
+
+    response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "TEST@example.com", "password": "testpassword123"},
+    )
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    stats = (await test_client.get("/api/v1/health/auth")).json()["login_rate_limiter"]
+    assert stats["admitted"] == burst
+    assert stats["rejected_by_email"] == 1
+
+    # 다른 계정은 영향을 받지 않음
+    other = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "other@example.com", "password": "wrongpassword"},
+    )
+    assert other.status_code == 401
@@ -130,6 +130,37 @@ async def test_refresh_tokens_invalid_token(test_db_session):
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
 
+@pytest.mark.asyncio
+async def test_refresh_tokens_accepts_legacy_token_once(test_db_session, sample_user):
+    """refresh_tokens 도입 전 토큰(fam 클레임 없음)은 새 family로 한 번만 회전되는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+
+    from app.core.security import create_refresh_token
+    from app.infrastructure.repositories.refresh_token_repository import (
+        SqlRefreshTokenStore,
+    )
+
+    service = AuthService(UserRepository(test_db_session))
+    legacy_token = create_refresh_token(str(sample_user.id))
+
+    new_pair = await service.refresh_tokens(
+        RefreshTokenRequest(refresh_token=legacy_token)
+    )
+    assert new_pair.refresh_token != legacy_token
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.refresh_tokens(RefreshTokenRequest(refresh_token=legacy_token))
+    assert "reuse" in exc_info.value.detail.lower()
+
+    # 만료 시각이 지난 기록만 정리된다
+    store = SqlRefreshTokenStore(test_db_session)
+    assert await store.delete_expired(datetime.now(timezone.utc)) == 0
+    later = datetime.now(timezone.utc) + timedelta(
+        minutes=service.settings.refresh_token_expire_minutes + 1
+    )
+    assert await store.delete_expired(later) == 2
+
+
 @pytest.mark.asyncio
 async def test_get_current_user_success(test_db_session, sample_user):
     """현재 사용자 조회 성공 테스트"""
@@ -157,3 +188,221 @@ async def test_get_current_user_invalid_token(test_db_session):
     
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
 
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rejects_when_hasher_saturated(test_db_session, sample_user):
+    """비밀번호 해시 큐가 가득 차면 503으로 거절하는지 테스트"""
+    from app.core.password_hasher import PasswordHasher
+
+    hasher = PasswordHasher(max_workers=1, max_pending=0)
+    repository = UserRepository(test_db_session)
+    service = AuthService(repository, password_hasher=hasher)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.authenticate("test@example.com", "testpassword123")
+
+    assert exc_info.value.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert hasher.stats()["rejected"] == 1
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_runs_off_event_loop():
+    """bcrypt 작업이 전용 스레드에서 병렬 처리되는지 테스트"""
+    import asyncio
+
+    from app.core.password_hasher import PasswordHasher
+
+    hasher = PasswordHasher(max_workers=2, max_pending=4)
+    hashed = await hasher.hash("password123")
+    results = await asyncio.gather(
+        hasher.verify("password123", hashed),
+        hasher.verify("wrong-password", hashed),
+    )
+
+    assert results == [True, False]
+    stats = hasher.stats()
+    assert stats["completed"] == 3
+    assert stats["in_flight"] == 0
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_holds_slot_until_work_finishes():
+    """취소된 요청도 실행 중인 작업이 끝날 때까지 슬롯을 차지하고, 성공만 완료로 집계"""
+    import asyncio
+    import threading
+
+    from app.core.password_hasher import PasswordHasher, PasswordHasherSaturatedError
+
+    hasher = PasswordHasher(max_workers=1, max_pending=1)
+    started, release = threading.Event(), threading.Event()
+
+    def blocking() -> str:
+        started.set()
+        release.wait(5)
+        return "done"
+
+    def failing() -> str:
+        raise ValueError("boom")
+
+    task = asyncio.create_task(hasher._run(blocking))
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # 스레드에서 bcrypt가 아직 실행 중이므로 슬롯이 반환되지 않았다
+    assert hasher.stats()["in_flight"] == 1
+    with pytest.raises(PasswordHasherSaturatedError):
+        await hasher.hash("password123")
+
+    release.set()
+    for _ in range(100):
+        if hasher.stats()["in_flight"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    with pytest.raises(ValueError):
+        await hasher._run(failing)
+
+    stats = hasher.stats()
+    assert stats["in_flight"] == 0
+    # 호출자는 취소됐어도 스레드의 해싱은 성공했으므로 완료 1, 예외로 끝난 작업은 제외
+    assert stats["completed"] == 1
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_uses_cache_and_invalidates_on_update(
+    test_db_session, sample_user
+):
+    """사용자 캐시 적중 및 비활성화 시 무효화 테스트"""
+    from app.infrastructure.repositories.user_repository import user_cache
+
+    repository = UserRepository(test_db_session)
+    service = AuthService(repository, trust_token_claims=False)
+    token_pair = await service.create_token_pair(User.model_validate(sample_user))
+
+    await service.get_current_user(token_pair.access_token)
+    assert user_cache.get(sample_user.id) is not None
+
+    sample_user.is_active = False
+    await test_db_session.flush()
+    assert user_cache.get(sample_user.id) is None
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.get_current_user(token_pair.access_token)
+    assert exc_info.value.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_trusts_signed_claims(test_db_session, sample_user):
+    """신뢰 모드에서는 토큰 클레임만으로 사용자를 구성하는지 테스트"""
+    from app.core.security import validate_token
+
+    repository = UserRepository(test_db_session)
+    service = AuthService(repository, trust_token_claims=True)
+    token_pair = await service.create_token_pair(User.model_validate(sample_user))
+
+    payload = validate_token(token_pair.access_token)
+    assert payload["email"] == "test@example.com"
+    assert payload["is_superuser"] is False
+
+    await test_db_session.delete(sample_user)
+    await test_db_session.flush()
+
+    current_user = await service.get_current_user(token_pair.access_token)
+    assert current_user.id == sample_user.id
+    assert current_user.is_active is True
+
+
+def test_validate_token_caches_verified_payload(monkeypatch):
+    """검증된 토큰은 exp까지 캐시되고 만료 토큰은 캐시되지 않는지 테스트"""
+    from datetime import timedelta
+
+    from app.core import security
+
+    calls = []
+    original_decode = security.decode_token
+
+    def counting_decode(token):
+        calls.append(token)
+        return original_decode(token)
+
+    monkeypatch.setattr(security, "decode_token", counting_decode)
+
+    token = security.create_access_token("1")
+    first = security.validate_token(token)
+    first["sub"] = "tampered"
+    second = security.validate_token(token)
+
+    assert second["sub"] == "1"
+    assert len(calls) == 1
+
+    with pytest.raises(security.InvalidTokenError):
+        security.validate_token(token, expected_type="refresh")
+
+    expired = security.create_access_token("1", expires_delta=timedelta(minutes=-1))
+    for _ in range(2):
+        with pytest.raises(security.InvalidTokenError):
+            security.validate_token(expired)
+    assert len(security.verified_token_cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_access_token_denylist_syncs_from_store():
+    """다른 워커의 폐기가 동기화되고, 폐기되지 않은 토큰은 저장소 조회 없이 통과하는지 테스트"""
+    from datetime import datetime, timedelta, timezone
+
+    from app.core.token_denylist import AccessTokenDenylist
+    from app.domain.entities import RefreshToken
+    from app.infrastructure.repositories.refresh_token_repository import (
+        InMemoryRefreshTokenStore,
+    )
+
+    class CountingStore(InMemoryRefreshTokenStore):
+        lookups = 0
+
+        async def is_access_revoked(self, access_jti):
+            self.lookups += 1
+            return await super().is_access_revoked(access_jti)
+
+    now = datetime.now(timezone.utc)
+    store = CountingStore()
+    await store.add(
+        RefreshToken(
+            jti="r1",
+            family_id="f1",
+            user_id=1,
+            access_jti="a1",
+            access_expires_at=now + timedelta(minutes=5),
+            expires_at=now + timedelta(days=1),
+        )
+    )
+    await store.revoke_family("f1")
+
+    clock = [0.0]
+    denylist = AccessTokenDenylist(
+        capacity=100, error_rate=0.001, sync_interval=30, timer=lambda: clock[0]
+    )
+    assert await denylist.is_revoked("a1", store) is True
+    assert await denylist.is_revoked("not-revoked", store) is False
+    assert store.lookups == 1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refills_over_time():
+    """token bucket이 시간에 따라 회복되고 재시도 시간을 알려주는지 테스트"""
+    from app.core.rate_limit import InMemoryRateLimitBackend, TokenBucketRule
+
+    clock = [0.0]
+    backend = InMemoryRateLimitBackend(timer=lambda: clock[0])
+    rule = TokenBucketRule(scope="ip", capacity=2, refill_rate=0.5)
+
+    assert await backend.consume("k", rule) == 0
+    assert await backend.consume("k", rule) == 0
+    assert await backend.consume("k", rule) == pytest.approx(2.0)
+
+    clock[0] = 2.0
+    assert await backend.consume("k", rule) == 0
@@ -0,0 +1,121 @@
+import gzip
+import json
+
+import brotli
+import pytest
+from httpx import AsyncClient
+from starlette.responses import Response
+
+from app.core.cache import TTLCache
+from app.presentation.middleware import CompressionMiddleware
+from app.presentation.middleware.compression import negotiate_encoding
+
+
+def _payload_app(body: bytes, media_type: str = "application/json"):
+    async def app(scope, receive, send):
+        await Response(body, media_type=media_type)(scope, receive, send)
+
+    return app
+
+
+async def _get(app, path: str = "/", accept_encoding: str = "gzip"):
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        return await client.get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+@pytest.mark.asyncio
+async def test_openapi_is_gzip_compressed(test_client: AsyncClient):
+    """큰 JSON 응답은 gzip으로 압축되고 작은 응답은 그대로 전달되는지 테스트"""
+    response = await test_client.get(
+        "/openapi.json", headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["info"]["title"]
+
+    small = await test_client.get("/health", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+
+@pytest.mark.asyncio
+async def test_compression_respects_threshold_type_and_accept_encoding():
+    """최소 크기/Content-Type/Accept-Encoding 조건을 만족할 때만 압축"""
+    body = json.dumps({"items": ["x" * 10] * 200}).encode()
+    app = _payload_app(body)
+    middleware = CompressionMiddleware(app, minimum_size=len(body) + 1)
+    response = await _get(middleware)
+    assert "content-encoding" not in response.headers
+    assert response.content == body
+
+    middleware = CompressionMiddleware(app, minimum_size=100)
+    assert "content-encoding" not in (await _get(middleware, accept_encoding="identity")).headers
+    assert "content-encoding" not in (await _get(middleware, accept_encoding="gzip;q=0")).headers
+
+    image_app = _payload_app(body, media_type="image/png")
+    response = await _get(CompressionMiddleware(image_app, minimum_size=100))
+    assert "content-encoding" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_compression_level_per_content_type_and_cache():
+    """Content-Type별 레벨 적용 및 캐시 경로의 압축 결과 재사용"""
+    body = json.dumps({"items": list(range(2000))}).encode()
+    app = _payload_app(body)
+    cache: TTLCache = TTLCache(maxsize=8, ttl=60)
+    middleware = CompressionMiddleware(
+        app,
+        minimum_size=100,
+        gzip_levels={"application/json": 1},
+        cache_paths=["/cached"],
+        cache=cache,
+    )
+
+    response = await _get(middleware, "/cached")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.content == body
+    assert int(response.headers["content-length"]) == len(
+        gzip.compress(body, compresslevel=1, mtime=0)
+    )
+    assert len(cache) == 1
+    (key,) = cache._data
+    assert key[:3] == ("/cached", "gzip", 1)
+
+    # 같은 본문은 캐시된 바이트 그대로, 캐시 경로가 아니면 저장하지 않음
+    cache.set(key, gzip.compress(b'{"cached":true}', mtime=0))
+    assert (await _get(middleware, "/cached")).json() == {"cached": True}
+    await _get(middleware, "/other")
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_brotli_negotiated_with_per_type_quality():
+    """br을 허용하면 brotli로 압축하고 Content-Type별 품질(없으면 기본 품질)을 적용"""
+    body = json.dumps({"items": [f"item-{i}" for i in range(2000)]}).encode()
+    for media_type, quality in (("application/json", 11), ("text/plain", 1)):
+        middleware = CompressionMiddleware(
+            _payload_app(body, media_type=media_type),
+            minimum_size=100,
+            gzip_levels={"application/json": 6, "text/*": 6},
+            brotli_levels={"application/json": 11},
+            brotli_quality=1,
+            cache=TTLCache(maxsize=8, ttl=60),
+        )
+        async with AsyncClient(app=middleware, base_url="http://test") as client:
+            async with client.stream(
+                "GET", "/", headers={"Accept-Encoding": "gzip, br"}
+            ) as response:
+                raw = b"".join([chunk async for chunk in response.aiter_raw()])
+
+        assert response.headers["content-encoding"] == "br"
+        assert brotli.decompress(raw) == body
+        assert raw == brotli.compress(body, quality=quality)
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0.5, br") == "br"
+    assert negotiate_encoding("br;q=0.1, gzip") == "gzip"
+    assert negotiate_encoding("*") is not None
+    assert negotiate_encoding("gzip;q=0, identity") is None
+    assert negotiate_encoding("") is None
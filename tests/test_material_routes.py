@@ -235,3 +235,571 @@ async def test_search_materials_no_auth(test_client: AsyncClient):
     response = await test_client.get("/api/v1/materials")
     assert response.status_code == 401
 
+
+
+@pytest.mark.asyncio
+async def test_search_materials_keyword_matches_keywords_column(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """keywords 컬럼만 매칭되는 자료도 검색되고 total이 정확한지 테스트"""
+    materials = [
+        MaterialModel(
+            title=f"Container Guide {i}",
+            url=f"https://example.com/container{i}",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+            summary="Compose basics",
+            keywords=["docker", "devops"],
+        )
+        for i in range(3)
+    ]
+    materials.append(
+        MaterialModel(
+            title="React Hooks",
+            url="https://example.com/react-hooks",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+            summary="Hooks patterns",
+            keywords=["react"],
+        )
+    )
+    test_db_session.add_all(materials)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get(
+        "/api/v1/materials",
+        params={"keyword": "DOCKER", "limit": 2},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["materials"]) == 2
+    assert all("docker" in m["keywords"] for m in data["materials"])
+    assert data["pagination"]["total"] == 3
+    assert data["pagination"]["total_pages"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_materials_sort_by_relevance(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """전문 검색 관련도순 정렬 테스트"""
+    title_match = MaterialModel(
+        title="FastAPI Deep Dive",
+        url="https://example.com/fastapi-deep",
+        difficulty=MaterialDifficulty.INTERMEDIATE,
+        type=MaterialType.DOCUMENT,
+        summary="Dependency injection and routing",
+        keywords=["python"],
+    )
+    summary_match = MaterialModel(
+        title="Python Web Frameworks",
+        url="https://example.com/frameworks",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+        summary="Django, Flask and FastAPI compared",
+        keywords=["python", "web"],
+    )
+    unrelated = MaterialModel(
+        title="React Patterns",
+        url="https://example.com/react-patterns",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.VIDEO,
+        summary="Component composition",
+        keywords=["react"],
+    )
+    test_db_session.add_all([summary_match, title_match, unrelated])
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get(
+        "/api/v1/materials",
+        params={"keyword": "fastapi", "sort": "relevance"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    titles = [m["title"] for m in data["materials"]]
+    assert titles == ["FastAPI Deep Dive", "Python Web Frameworks"]
+    assert data["pagination"]["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_materials_fuzzy_match(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """부분 단어 fuzzy 검색 및 유사도순 정렬 테스트"""
+    summary_match = MaterialModel(
+        title="Backend Roadmap",
+        url="https://example.com/backend",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+        summary="웹 프레임워크 선택 가이드",
+        keywords=["backend"],
+    )
+    title_match = MaterialModel(
+        title="프레임워크 비교",
+        url="https://example.com/frameworks-ko",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+        summary="Django vs FastAPI",
+        keywords=["python"],
+    )
+    test_db_session.add_all([title_match, summary_match])
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get(
+        "/api/v1/materials",
+        params={"keyword": "프레임", "match": "fuzzy"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    titles = [m["title"] for m in data["materials"]]
+    assert titles == ["프레임워크 비교", "Backend Roadmap"]
+    assert data["pagination"]["total"] == 2
+
+
+@pytest.mark.asyncio
+async def test_search_materials_cursor_pagination(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """cursor(keyset) 페이지네이션 테스트"""
+    from datetime import datetime, timedelta, timezone
+
+    base = datetime(2025, 11, 27, 10, 0, 0, tzinfo=timezone.utc)
+    materials = [
+        MaterialModel(
+            title=f"Cursor Material {i}",
+            url=f"https://example.com/cursor{i}",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+            # 0, 1번은 같은 created_at → id로 순서가 고정되어야 함
+            created_at=base + timedelta(minutes=max(i, 1)),
+        )
+        for i in range(5)
+    ]
+    test_db_session.add_all(materials)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    seen: list[int] = []
+    params = {"limit": 2}
+    for _ in range(3):
+        response = await test_client.get(
+            "/api/v1/materials", params=params, headers=headers
+        )
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(m["id"] for m in data["materials"])
+        next_cursor = data["pagination"]["next_cursor"]
+        if next_cursor is None:
+            break
+        params = {"limit": 2, "cursor": next_cursor}
+
+    expected = [m.id for m in sorted(materials, key=lambda m: (m.created_at, m.id), reverse=True)]
+    assert seen == expected
+    assert next_cursor is None
+
+    response = await test_client.get(
+        "/api/v1/materials", params={"cursor": "not-a-cursor"}, headers=headers
+    )
+    assert response.status_code == 400
+
+    # 관련도/유사도순 정렬에는 cursor를 쓸 수 없음 (검색 전에 거절)
+    first_page = await test_client.get(
+        "/api/v1/materials", params={"limit": 2}, headers=headers
+    )
+    seen_cursor = first_page.json()["pagination"]["next_cursor"]
+    for extra in ({"sort": "relevance"}, {"match": "fuzzy"}):
+        response = await test_client.get(
+            "/api/v1/materials",
+            params={"keyword": "cursor", "cursor": seen_cursor, **extra},
+            headers=headers,
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "cursor는 최신순 정렬에서만 사용할 수 있습니다."
+
+
+@pytest.mark.asyncio
+async def test_search_materials_total_modes(
+    test_client: AsyncClient, test_db_session, sample_user, query_budget
+):
+    """COUNT 생략/캐시 동작 테스트"""
+    test_db_session.add_all(
+        [
+            MaterialModel(
+                title=f"Count Material {i}",
+                url=f"https://example.com/count{i}",
+                difficulty=MaterialDifficulty.BEGINNER,
+                type=MaterialType.DOCUMENT,
+            )
+            for i in range(3)
+        ]
+    )
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get(
+        "/api/v1/materials", params={"with_total": "false"}, headers=headers
+    )
+    assert response.status_code == 200
+    pagination = response.json()["pagination"]
+    assert pagination["total"] is None
+    assert pagination["total_pages"] is None
+    assert len(response.json()["materials"]) == 3
+
+    response = await test_client.get("/api/v1/materials", headers=headers)
+    assert response.json()["pagination"]["total"] == 3
+
+    # 같은 필터 조합은 페이지가 달라도 TTL 동안 캐시된 COUNT를 사용
+    with query_budget(10) as stats:
+        response = await test_client.get(
+            "/api/v1/materials", params={"limit": 2}, headers=headers
+        )
+    assert response.json()["pagination"]["total"] == 3
+    assert not any("count(" in sql for sql in stats.statements)
+    etag = response.headers["etag"]
+
+    # 자료가 추가되면 카탈로그 버전이 바뀌어 캐시된 COUNT를 재사용하지 않는다
+    test_db_session.add(
+        MaterialModel(
+            title="Count Material 3",
+            url="https://example.com/count3",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+        )
+    )
+    await test_db_session.commit()
+    response = await test_client.get(
+        "/api/v1/materials", params={"limit": 2}, headers=headers
+    )
+    assert response.status_code == 200
+    assert response.json()["pagination"]["total"] == 4
+    assert response.json()["pagination"]["total_pages"] == 2
+    assert response.headers["etag"] != etag
+
+    response = await test_client.get(
+        "/api/v1/materials",
+        params={"limit": 2},
+        headers={**headers, "If-None-Match": response.headers["etag"]},
+    )
+    assert response.status_code == 304
+
+    # SQLite에는 통계 추정치가 없으므로 정확한 COUNT로 대체
+    response = await test_client.get(
+        "/api/v1/materials",
+        params={"estimate_total": "true", "difficulty": "beginner"},
+        headers=headers,
+    )
+    pagination = response.json()["pagination"]
+    assert pagination["total"] == 4
+    assert pagination["total_is_estimate"] is False
+
+
+@pytest.mark.asyncio
+async def test_search_materials_marks_scrapped(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """검색 결과에 현재 사용자의 스크랩 여부가 표시되는지 테스트"""
+    scrapped = MaterialModel(
+        title="Scrapped Material",
+        url="https://example.com/scrapped",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    other = MaterialModel(
+        title="Other Material",
+        url="https://example.com/other",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    test_db_session.add_all([scrapped, other])
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.post(
+        f"/api/v1/materials/{scrapped.id}/scrap", headers=headers
+    )
+    assert response.status_code == 200
+
+    response = await test_client.get("/api/v1/materials", headers=headers)
+    assert response.status_code == 200
+    flags = {m["id"]: m["is_scrapped"] for m in response.json()["materials"]}
+    assert flags == {scrapped.id: True, other.id: False}
+
+
+@pytest.mark.asyncio
+async def test_search_reads_replica_until_user_writes(
+    test_client: AsyncClient, test_db_session, sample_user, monkeypatch
+):
+    """조회는 복제본에서, 쓰기 직후 같은 사용자의 조회는 primary에서 수행되는지 테스트"""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from app.core import database, read_your_writes
+    from app.core.read_your_writes import recent_writers
+
+    # 아직 복제되지 않은 상태를 흉내 내는 빈 복제본
+    replica_url = "sqlite+aiosqlite:///:memory:"
+    replica_engine = create_async_engine(replica_url)
+    async with replica_engine.begin() as conn:
+        await conn.run_sync(database.Base.metadata.create_all)
+    monkeypatch.setattr(read_your_writes.settings, "database_read_url", replica_url)
+    monkeypatch.setattr(
+        database,
+        "ReadSessionLocal",
+        async_sessionmaker(replica_engine, expire_on_commit=False),
+    )
+
+    material = MaterialModel(
+        title="Primary Only",
+        url="https://example.com/primary-only",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    test_db_session.add(material)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    params = {"with_total": "false"}
+
+    response = await test_client.get("/api/v1/materials", headers=headers, params=params)
+    assert response.json()["materials"] == []
+
+    scrap = await test_client.post(
+        f"/api/v1/materials/{material.id}/scrap", headers=headers
+    )
+    assert scrap.status_code == 200
+    assert "stacknori_rw_until" in scrap.cookies
+
+    response = await test_client.get("/api/v1/materials", headers=headers, params=params)
+    materials = response.json()["materials"]
+    assert [item["title"] for item in materials] == ["Primary Only"]
+    assert materials[0]["is_scrapped"] is True
+
+    # 쿠키 없이 같은 워커로 들어와도 primary 사용
+    test_client.cookies.clear()
+    response = await test_client.get("/api/v1/materials", headers=headers, params=params)
+    assert len(response.json()["materials"]) == 1
+
+    # 표시가 만료되면 다시 복제본
+    recent_writers.clear()
+    response = await test_client.get("/api/v1/materials", headers=headers, params=params)
+    assert response.json()["materials"] == []
+
+    await replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_write_marker_skipped_without_replica(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """복제본이 없으면 쓰기 후에도 read-your-writes 쿠키/표시를 남기지 않는지 테스트"""
+    from app.core.read_your_writes import recent_writers
+
+    material = MaterialModel(
+        title="No Replica",
+        url="https://example.com/no-replica",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    test_db_session.add(material)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    scrap = await test_client.post(
+        f"/api/v1/materials/{material.id}/scrap", headers=headers
+    )
+    assert scrap.status_code == 200
+    assert "stacknori_rw_until" not in scrap.cookies
+    assert len(recent_writers) == 0
+
+
+@pytest.mark.asyncio
+async def test_search_materials_projection_matches_schema(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """컬럼 프로젝션 응답이 MaterialListResponse 스키마와 동일한 모양인지 확인"""
+    from app.schemas import MaterialListResponse
+
+    test_db_session.add(
+        MaterialModel(
+            title="Projection Material",
+            url="https://example.com/projection",
+            difficulty=MaterialDifficulty.INTERMEDIATE,
+            type=MaterialType.VIDEO,
+            source="Stacknori",
+            keywords=None,
+        )
+    )
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = await test_client.get("/api/v1/materials", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert MaterialListResponse.model_validate(data).model_dump(mode="json") == data
+    assert data["materials"][0] == {
+        "id": data["materials"][0]["id"],
+        "title": "Projection Material",
+        "url": "https://example.com/projection",
+        "difficulty": "intermediate",
+        "type": "video",
+        "source": "Stacknori",
+        "summary": None,
+        "keywords": [],
+        "is_scrapped": False,
+    }
+
+
+@pytest.mark.asyncio
+async def test_search_materials_conditional_get(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """스크랩/카탈로그/쿼리 문자열이 같으면 304, 하나라도 바뀌면 새 ETag"""
+    material = MaterialModel(
+        title="ETag Material",
+        url="https://example.com/etag",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+        keywords=["http"],
+    )
+    test_db_session.add(material)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = await test_client.get("/api/v1/materials", headers=headers)
+    etag = response.headers["etag"]
+    conditional = {**headers, "If-None-Match": etag}
+
+    response = await test_client.get("/api/v1/materials", headers=conditional)
+    assert response.status_code == 304
+
+    filtered = await test_client.get(
+        "/api/v1/materials", headers=conditional, params={"type": "document"}
+    )
+    assert filtered.status_code == 200
+    assert filtered.headers["etag"] != etag
+
+    await test_client.post(f"/api/v1/materials/{material.id}/scrap", headers=headers)
+    response = await test_client.get("/api/v1/materials", headers=conditional)
+    assert response.status_code == 200
+    assert response.json()["materials"][0]["is_scrapped"] is True
+    scrapped_etag = response.headers["etag"]
+
+    material.title = "ETag Material (revised)"
+    await test_db_session.commit()
+    response = await test_client.get(
+        "/api/v1/materials", headers={**headers, "If-None-Match": scrapped_etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["materials"][0]["title"] == "ETag Material (revised)"
+
+
+@pytest.mark.asyncio
+async def test_material_changes_bump_catalogue_version(test_db_session):
+    """행이 없는 버전 카운터도 upsert로 생성되고, 자료 변경마다 1씩 증가하는지 테스트"""
+    from app.infrastructure.db.versioning import (
+        MATERIAL_CATALOGUE,
+        bump_version,
+        get_version,
+    )
+
+    assert await get_version(test_db_session, MATERIAL_CATALOGUE) == 0
+    material = MaterialModel(
+        title="Versioned Material",
+        url="https://example.com/versioned",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    test_db_session.add(material)
+    await test_db_session.commit()
+    assert await get_version(test_db_session, MATERIAL_CATALOGUE) == 1
+
+    material.title = "Versioned Material (revised)"
+    await test_db_session.commit()
+    connection = await test_db_session.connection()
+    await connection.run_sync(bump_version, MATERIAL_CATALOGUE)
+    await test_db_session.commit()
+    assert await get_version(test_db_session, MATERIAL_CATALOGUE) == 3
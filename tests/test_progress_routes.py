@@ -77,3 +77,181 @@ async def test_progress_supports_materials(
     assert len(items) == 1
     assert items[0]["item_type"] == "material"
 
+    # 진도/카탈로그가 그대로면 304, 완료를 취소하면 새 ETag
+    conditional = {**headers, "If-None-Match": overview.headers["etag"]}
+    resp = await test_client.get("/api/v1/progress", headers=conditional)
+    assert resp.status_code == 304
+
+    await test_client.post(
+        f"/api/v1/progress/{material.id}/complete",
+        params={"type": "material"},
+        json={"completed": False},
+        headers=headers,
+    )
+    resp = await test_client.get("/api/v1/progress", headers=conditional)
+    assert resp.status_code == 200
+    assert resp.json()["statistics"]["material_completed"] == 0
+
+
+
+@pytest.mark.asyncio
+async def test_progress_statistics_filters(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    frontend = RoadmapModel(category=RoadmapCategory.FRONTEND, name="HTML", level=1)
+    backend = RoadmapModel(category=RoadmapCategory.BACKEND, name="API", level=1)
+    backend_extra = RoadmapModel(category=RoadmapCategory.BACKEND, name="DB", level=1)
+    material = MaterialModel(
+        title="FastAPI Getting Started",
+        url="https://example.com/fastapi",
+        difficulty=MaterialDifficulty.BEGINNER,
+        type=MaterialType.DOCUMENT,
+    )
+    test_db_session.add_all([frontend, backend, backend_extra, material])
+    await test_db_session.flush()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    for item_id, item_type in [
+        (frontend.id, "roadmap"),
+        (backend.id, "roadmap"),
+        (material.id, "material"),
+    ]:
+        resp = await test_client.post(
+            f"/api/v1/progress/{item_id}/complete",
+            params={"type": item_type},
+            json={"completed": True},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+
+    overview = await test_client.get(
+        "/api/v1/progress", params={"category": "backend"}, headers=headers
+    )
+    assert overview.status_code == 200
+    stats = overview.json()["statistics"]
+    assert stats["roadmap_total"] == 2
+    assert stats["roadmap_completed"] == 1
+    assert stats["material_total"] == 1
+    assert stats["material_completed"] == 1
+    assert stats["total_items"] == 3
+    assert stats["completed_items"] == 2
+
+    overview = await test_client.get(
+        "/api/v1/progress", params={"type": "material"}, headers=headers
+    )
+    stats = overview.json()["statistics"]
+    assert stats["roadmap_total"] == 0
+    assert stats["roadmap_completed"] == 0
+    assert stats["material_total"] == 1
+    assert stats["material_completed"] == 1
+    assert stats["completion_rate"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_progress_update_is_idempotent_upsert(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    roadmap = RoadmapModel(category=RoadmapCategory.DEVOPS, name="Docker", level=1)
+    test_db_session.add(roadmap)
+    await test_db_session.flush()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    for completed in (True, True, False):
+        resp = await test_client.post(
+            f"/api/v1/progress/{roadmap.id}/complete",
+            json={"completed": completed},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["is_completed"] is completed
+
+    overview = await test_client.get("/api/v1/progress", headers=headers)
+    items = overview.json()["progress"]
+    assert len(items) == 1
+    assert items[0]["item_name"] == "Docker"
+    assert items[0]["category"] == "devops"
+    assert items[0]["is_completed"] is False
+    assert items[0]["completed_at"] is None
+
+
+@pytest.mark.asyncio
+async def test_progress_endpoints_stay_within_query_budget(
+    test_client: AsyncClient, test_db_session, sample_user, query_budget
+):
+    """항목 수와 무관하게 조회 API의 SQL 문 수가 일정한지(N+1 없음) 테스트"""
+    parent = RoadmapModel(category=RoadmapCategory.BACKEND, name="Backend", level=1)
+    test_db_session.add(parent)
+    await test_db_session.flush()
+    roadmaps = [parent] + [
+        RoadmapModel(
+            category=RoadmapCategory.BACKEND,
+            name=f"Backend {i}",
+            level=2,
+            parent_id=parent.id,
+        )
+        for i in range(4)
+    ]
+    materials = [
+        MaterialModel(
+            title=f"Material {i}",
+            url=f"https://example.com/budget-{i}",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+        )
+        for i in range(4)
+    ]
+    test_db_session.add_all(roadmaps + materials)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    for roadmap in roadmaps:
+        await test_client.post(
+            f"/api/v1/progress/{roadmap.id}/complete",
+            json={"completed": True},
+            headers=headers,
+        )
+    for material in materials:
+        await test_client.post(
+            f"/api/v1/progress/{material.id}/complete",
+            params={"type": "material"},
+            json={"completed": True},
+            headers=headers,
+        )
+
+    # ETag 스탬프 1 + 목록 1 + 통계 1
+    with query_budget(3) as stats:
+        resp = await test_client.get("/api/v1/progress", headers=headers)
+    assert resp.status_code == 200
+    assert len(resp.json()["progress"]) == len(roadmaps) + len(materials)
+    assert "Server-Timing" in resp.headers
+    assert f'desc="{stats.count} queries"' in resp.headers["Server-Timing"]
+
+    # 버전/ETag 스탬프 1 + 트리 1 + 사용자 진도 1, 이후에는 트리를 캐시에서 사용
+    for budget in (3, 2):
+        with query_budget(budget):
+            resp = await test_client.get("/api/v1/roadmaps", headers=headers)
+        assert resp.status_code == 200
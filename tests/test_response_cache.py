@@ -0,0 +1,288 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+
+from app.core.response_cache import (
+    SHARED_SCOPE,
+    CacheBackendError,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    ResponseCache,
+    get_response_cache,
+    user_scope,
+)
+from app.domain.entities.material import MaterialDifficulty, MaterialType
+from app.infrastructure.db.models import UserModel
+from app.infrastructure.db.models.material import MaterialModel
+
+
+class RespStandIn:
+    """테스트용 RESP2 서버 (GET/SET PX/DEL/INCR(BY)/AUTH/SELECT/PING만 지원).
+
+    redis-py가 연결 직후 보내는 CLIENT SETINFO 등 나머지 명령에는 오류로 응답한다.
+    """
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[bytes] = []
+        self.writers: list[asyncio.StreamWriter] = []
+        self.server: asyncio.AbstractServer | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        auth = f":{self.password}@" if self.password else ""
+        return f"redis://{auth}{host}:{port}/1"
+
+    async def start(self) -> None:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self.drop_connections()
+        self.server.close()
+        await self.server.wait_closed()
+
+    def drop_connections(self) -> None:
+        for writer in self.writers:
+            writer.close()
+        self.writers.clear()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.writers.append(writer)
+        authenticated = self.password is None
+        try:
+            while True:
+                header = await reader.readuntil(b"\r\n")
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readuntil(b"\r\n"))[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                command = args[0].upper()
+                self.commands.append(command)
+                if command == b"AUTH":
+                    authenticated = args[1].decode() == self.password
+                    writer.write(b"+OK\r\n" if authenticated else b"-ERR invalid password\r\n")
+                elif not authenticated:
+                    writer.write(b"-NOAUTH Authentication required.\r\n")
+                else:
+                    writer.write(self._dispatch(command, args[1:]))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def _dispatch(self, command: bytes, args: list[bytes]) -> bytes:
+        if command in (b"PING", b"SELECT"):
+            return b"+OK\r\n"
+        if command == b"GET":
+            value = self._get(args[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if command == b"SET":
+            expires_at = None
+            if len(args) == 4 and args[2].upper() == b"PX":
+                expires_at = time.monotonic() + int(args[3]) / 1000
+            self.data[args[0]] = (args[1], expires_at)
+            return b"+OK\r\n"
+        if command == b"DEL":
+            return b":%d\r\n" % int(self.data.pop(args[0], None) is not None)
+        if command in (b"INCR", b"INCRBY"):
+            value = int(self._get(args[0]) or 0) + (int(args[1]) if len(args) > 1 else 1)
+            self.data[args[0]] = (str(value).encode(), None)
+            return b":%d\r\n" % value
+        return b"-ERR unknown command\r\n"
+
+    def _get(self, key: bytes) -> bytes | None:
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+
+@pytest_asyncio.fixture
+async def resp_server():
+    server = RespStandIn(password="s3cret")
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_response_cache_generations():
+    """세대를 올리면 같은 parts로 만든 키가 바뀌어 이전 항목이 조회되지 않는지 테스트"""
+    cache = ResponseCache(InMemoryCacheBackend(max_entries=10), ttl=60)
+
+    key = await cache.key(user_scope(1), "progress", None)
+    await cache.set(key, b"cached")
+    assert await cache.get(await cache.key(user_scope(1), "progress", None)) == b"cached"
+
+    await cache.invalidate(user_scope(1))
+    stale_key = key
+    key = await cache.key(user_scope(1), "progress", None)
+    assert key != stale_key
+    assert await cache.get(key) is None
+    # 다른 scope는 영향 없음
+    assert await cache.key(SHARED_SCOPE, "x") == await cache.key(SHARED_SCOPE, "x")
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_against_stand_in(resp_server: RespStandIn):
+    """redis 백엔드의 AUTH/SELECT, 만료, 카운터, 재연결 동작 테스트"""
+    backend = RedisCacheBackend(resp_server.url, timeout=1)
+
+    assert await backend.get("missing") is None
+    await backend.set("page", b"\x00binary\r\npayload", ttl=60)
+    assert await backend.get("page") == b"\x00binary\r\npayload"
+    assert await backend.incr("generation") == 1
+    assert await backend.incr("generation") == 2
+    await backend.delete("page")
+    assert await backend.get("page") is None
+
+    await backend.set("short", b"v", ttl=0.01)
+    await asyncio.sleep(0.03)
+    assert await backend.get("short") is None
+    assert resp_server.commands[0] == b"AUTH"
+    assert b"SELECT" in resp_server.commands
+
+    # 서버가 연결을 끊으면 한 번 실패한 뒤 다음 호출에서 다시 연결
+    resp_server.drop_connections()
+    cache = ResponseCache(backend, ttl=60)
+    key = await cache.key(SHARED_SCOPE, "page")
+    await cache.set(key, b"value")
+    assert await cache.get(key) == b"value"
+    assert resp_server.commands.count(b"AUTH") == 2
+
+    await backend.close()
+
+    # 인증 실패도 CacheBackendError로 올라오고, 인증되지 않은 연결을 재사용하지 않는다
+    wrong = RedisCacheBackend(resp_server.url.replace("s3cret", "wrong"), timeout=1)
+    for _ in range(2):
+        with pytest.raises(CacheBackendError):
+            await wrong.get("page")
+    assert resp_server.commands.count(b"AUTH") == 4
+    assert resp_server.commands[-1] == b"AUTH"
+    await wrong.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_treats_unreachable_backend_as_miss(resp_server: RespStandIn):
+    """캐시 서버에 연결할 수 없으면 예외 없이 미스로 처리"""
+    url = resp_server.url
+    await resp_server.stop()
+    cache = ResponseCache(RedisCacheBackend(url, timeout=0.2), ttl=60)
+
+    key = await cache.key(SHARED_SCOPE, "page")
+    await cache.set(key, b"value")
+    await cache.invalidate(SHARED_SCOPE)
+    assert await cache.get(key) is None
+    await cache.backend.close()
+
+
+@pytest.mark.asyncio
+async def test_material_pages_shared_across_users(
+    test_client: AsyncClient, test_db_session, sample_user, query_budget
+):
+    """자료 페이지는 사용자 간 공유되고 is_scrapped만 페이지 단위로 덧씌워지는지 테스트"""
+    from app.core.security import get_password_hash
+
+    other = UserModel(
+        email="other@example.com",
+        hashed_password=get_password_hash("otherpassword123"),
+        is_active=True,
+    )
+    materials = [
+        MaterialModel(
+            title=f"Shared Material {i}",
+            url=f"https://example.com/shared/{i}",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+            keywords=["shared"],
+        )
+        for i in range(3)
+    ]
+    test_db_session.add_all([other, *materials])
+    await test_db_session.commit()
+
+    headers = {}
+    for email, password in (
+        ("test@example.com", "testpassword123"),
+        ("other@example.com", "otherpassword123"),
+    ):
+        login_response = await test_client.post(
+            "/api/v1/auth/login", data={"username": email, "password": password}
+        )
+        headers[email] = {
+            "Authorization": f"Bearer {login_response.json()['access_token']}"
+        }
+
+    scrap = await test_client.post(
+        f"/api/v1/materials/{materials[0].id}/scrap", headers=headers["test@example.com"]
+    )
+    assert scrap.status_code == 200
+
+    cache = get_response_cache()
+    first = await test_client.get("/api/v1/materials", headers=headers["test@example.com"])
+    flags = {m["id"]: m["is_scrapped"] for m in first.json()["materials"]}
+    assert flags[materials[0].id] is True
+
+    # 다른 사용자는 공유 페이지를 재사용 (첫 인증 사용자 조회 + 스탬프 조회만 실행,
+    # 스크랩이 없으므로 스크랩 id 조회도 생략)
+    hits = cache.hits
+    with query_budget(2):
+        second = await test_client.get(
+            "/api/v1/materials", headers=headers["other@example.com"]
+        )
+    assert cache.hits == hits + 1
+    assert all(m["is_scrapped"] is False for m in second.json()["materials"])
+    assert [m["id"] for m in second.json()["materials"]] == list(flags)
+
+    # 스크랩한 사용자도 공유 페이지를 쓰고, 그 페이지 id에 대한 스크랩 조회만 추가된다
+    with query_budget(3) as stats:
+        again = await test_client.get("/api/v1/materials", headers=headers["test@example.com"])
+    assert again.json() == first.json()
+    assert any("material_scraps.material_id IN" in sql for sql in stats.statements)
+
+    # 스크랩 해제는 해당 사용자의 스크랩 버전(ETag)만 바꾼다
+    other_etag = second.headers["etag"]
+    await test_client.delete(
+        f"/api/v1/materials/{materials[0].id}/scrap", headers=headers["test@example.com"]
+    )
+    response = await test_client.get("/api/v1/materials", headers=headers["test@example.com"])
+    assert response.headers["etag"] != first.headers["etag"]
+    assert all(m["is_scrapped"] is False for m in response.json()["materials"])
+    response = await test_client.get(
+        "/api/v1/materials", headers={**headers["other@example.com"], "If-None-Match": other_etag}
+    )
+    assert response.status_code == 304
+
+    # 카탈로그가 바뀌면 공유 페이지도 다시 만든다
+    materials[1].title = "Shared Material (renamed)"
+    await test_db_session.commit()
+    response = await test_client.get("/api/v1/materials", headers=headers["other@example.com"])
+    titles = {m["title"] for m in response.json()["materials"]}
+    assert "Shared Material (renamed)" in titles
+    assert response.json()["pagination"]["total"] == 3
+
+    # 자료가 추가되면 공유 페이지와 전체 개수가 함께 갱신되고, 갱신된 페이지가 다시 공유된다
+    test_db_session.add(
+        MaterialModel(
+            title="Shared Material 3",
+            url="https://example.com/shared/3",
+            difficulty=MaterialDifficulty.BEGINNER,
+            type=MaterialType.DOCUMENT,
+        )
+    )
+    await test_db_session.commit()
+    response = await test_client.get("/api/v1/materials", headers=headers["other@example.com"])
+    assert response.json()["pagination"]["total"] == 4
+    assert len(response.json()["materials"]) == 4
+    hits = cache.hits
+    response = await test_client.get("/api/v1/materials", headers=headers["test@example.com"])
+    assert cache.hits == hits + 1
+    assert response.json()["pagination"]["total"] == 4
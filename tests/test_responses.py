@@ -0,0 +1,45 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from app.presentation.responses import FastJSONResponse, dump_json
+from app.schemas import ProgressOverviewResponse
+
+
+def test_fast_json_response_matches_default_encoding():
+    """FastJSONResponse가 기존 jsonable_encoder 결과와 같은 JSON을 만드는지 테스트"""
+    model = ProgressOverviewResponse(
+        progress=[
+            {
+                "item_id": 1,
+                "item_name": "HTML",
+                "item_type": "roadmap",
+                "category": "frontend",
+                "is_completed": True,
+                "completed_at": datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc),
+            }
+        ],
+        statistics={
+            "total_items": 2,
+            "completed_items": 1,
+            "completion_rate": 0.5,
+            "roadmap_total": 1,
+            "roadmap_completed": 1,
+            "material_total": 1,
+            "material_completed": 0,
+        },
+    )
+
+    assert json.loads(FastJSONResponse(model).body) == jsonable_encoder(model)
+    payload = {"status": "ok", "counts": {1: 2}}
+    assert json.loads(FastJSONResponse(payload).body) == {
+        "status": "ok",
+        "counts": {"1": 2},
+    }
+
+
+def test_dump_json_falls_back_for_types_orjson_rejects():
+    """orjson이 지원하지 않는 타입(Decimal 등)은 pydantic-core로 인코딩되는지 테스트"""
+    assert json.loads(dump_json({"rate": Decimal("0.5")})) == {"rate": "0.5"}
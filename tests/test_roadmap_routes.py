@@ -101,3 +101,179 @@ async def test_list_roadmaps_no_auth(test_client: AsyncClient):
     response = await test_client.get("/api/v1/roadmaps")
     assert response.status_code == 401
 
+
+
+@pytest.mark.asyncio
+async def test_list_roadmaps_cache_invalidated_on_write(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """로드맵 트리 캐시가 재사용되고, 로드맵 변경 시 버전이 올라 무효화되는지 테스트"""
+    from app.infrastructure.repositories.roadmap_repository import roadmap_tree_cache
+
+    root = RoadmapModel(
+        category=RoadmapCategory.DEVOPS,
+        name="DevOps Essentials",
+        level=1,
+    )
+    test_db_session.add(root)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get("/api/v1/roadmaps", headers=headers)
+    assert response.status_code == 200
+    cached = roadmap_tree_cache.snapshot
+    assert cached is not None
+
+    response = await test_client.get("/api/v1/roadmaps", headers=headers)
+    assert response.status_code == 200
+    assert roadmap_tree_cache.snapshot is cached
+
+    child = RoadmapModel(
+        category=RoadmapCategory.DEVOPS,
+        name="Docker & Compose",
+        level=2,
+        parent_id=root.id,
+    )
+    test_db_session.add(child)
+    await test_db_session.commit()
+
+    response = await test_client.get("/api/v1/roadmaps", headers=headers)
+    assert response.status_code == 200
+    assert roadmap_tree_cache.snapshot.version > cached.version
+    devops = next(rm for rm in response.json()["roadmaps"] if rm["id"] == root.id)
+    assert [c["name"] for c in devops["children"]] == ["Docker & Compose"]
+
+
+@pytest.mark.asyncio
+async def test_list_roadmaps_rendered_json_matches_schema(
+    test_client: AsyncClient, test_db_session, sample_user
+):
+    """미리 인코딩된 로드맵 JSON이 스키마와 일치하고 중첩 노드의 완료 여부가 반영되는지 테스트"""
+    from app.domain.entities.progress import ItemType
+    from app.infrastructure.db.models.progress import UserProgressModel
+    from app.schemas import RoadmapListResponse
+
+    root = RoadmapModel(
+        category=RoadmapCategory.BACKEND,
+        name="Backend \"Fundamentals\"",
+        level=1,
+        description="API 서버와 데이터 저장소 기초",
+    )
+    test_db_session.add(root)
+    await test_db_session.flush()
+    child = RoadmapModel(
+        category=RoadmapCategory.BACKEND,
+        name="Database Design",
+        level=2,
+        parent_id=root.id,
+    )
+    test_db_session.add(child)
+    await test_db_session.flush()
+    grandchild = RoadmapModel(
+        category=RoadmapCategory.BACKEND,
+        name="Indexes",
+        level=3,
+        parent_id=child.id,
+    )
+    test_db_session.add(grandchild)
+    await test_db_session.flush()
+    test_db_session.add(
+        UserProgressModel(
+            user_id=sample_user.id,
+            roadmap_id=grandchild.id,
+            item_type=ItemType.ROADMAP.value,
+            is_completed=True,
+        )
+    )
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": "test@example.com",
+            "password": "testpassword123",
+        },
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+    )
+    access_token = login_response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    response = await test_client.get("/api/v1/roadmaps", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert RoadmapListResponse.model_validate(body).model_dump() == body
+
+    (backend,) = body["roadmaps"]
+    assert backend["name"] == 'Backend "Fundamentals"'
+    assert backend["description"] == "API 서버와 데이터 저장소 기초"
+    assert backend["is_completed"] is False
+    (database,) = backend["children"]
+    assert database["is_completed"] is False
+    (indexes,) = database["children"]
+    assert indexes["is_completed"] is True
+    assert indexes["children"] == []
+
+
+@pytest.mark.asyncio
+async def test_list_roadmaps_conditional_get(
+    test_client: AsyncClient, test_db_session, sample_user, query_budget
+):
+    """If-None-Match가 현재 ETag와 같으면 본문 없이 304, 진도/트리가 바뀌면 새 ETag"""
+    root = RoadmapModel(category=RoadmapCategory.BACKEND, name="Backend", level=1)
+    test_db_session.add(root)
+    await test_db_session.commit()
+
+    login_response = await test_client.post(
+        "/api/v1/auth/login",
+        data={"username": "test@example.com", "password": "testpassword123"},
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    response = await test_client.get("/api/v1/roadmaps", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "private, no-cache"
+
+    # 스탬프 조회 1회만 실행하고 트리/진도는 읽지 않는다
+    with query_budget(1):
+        response = await test_client.get(
+            "/api/v1/roadmaps", headers={**headers, "If-None-Match": etag}
+        )
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    await test_client.post(
+        f"/api/v1/progress/{root.id}/complete",
+        json={"completed": True},
+        headers=headers,
+    )
+    response = await test_client.get(
+        "/api/v1/roadmaps", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["roadmaps"][0]["is_completed"] is True
+    completed_etag = response.headers["etag"]
+    assert completed_etag != etag
+
+    test_db_session.add(
+        RoadmapModel(category=RoadmapCategory.BACKEND, name="Databases", level=1)
+    )
+    await test_db_session.commit()
+    response = await test_client.get(
+        "/api/v1/roadmaps", headers={**headers, "If-None-Match": completed_etag}
+    )
+    assert response.status_code == 200
+    assert len(response.json()["roadmaps"]) == 2